@@ -0,0 +1,34 @@
+"""keyset_indexes
+
+Revision ID: 76f8256e9311
+Revises: a7d0590542c6
+Create Date: 2026-10-18 10:12:41.318502
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "76f8256e9311"
+down_revision: Union[str, None] = "a7d0590542c6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_users_created_at_id", "users", ["created_at", "id"], unique=False
+    )
+    op.create_index(
+        "ix_sessions_user_id_start_id",
+        "sessions",
+        ["user_id", "start", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_sessions_user_id_start_id", table_name="sessions")
+    op.drop_index("ix_users_created_at_id", table_name="users")
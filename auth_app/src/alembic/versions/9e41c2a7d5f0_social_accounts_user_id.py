@@ -0,0 +1,32 @@
+"""social_accounts_user_id
+
+Revision ID: 9e41c2a7d5f0
+Revises: 5c0b7d3e91a4
+Create Date: 2026-10-18 16:05:27.204913
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9e41c2a7d5f0"
+down_revision: Union[str, None] = "5c0b7d3e91a4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        op.f("ix_social_accounts_user_id"),
+        "social_accounts",
+        ["user_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f("ix_social_accounts_user_id"), table_name="social_accounts"
+    )
@@ -0,0 +1,30 @@
+"""refresh_tokens_audit
+
+Revision ID: d3f8a61b2c07
+Revises: 9e41c2a7d5f0
+Create Date: 2026-10-18 17:22:48.615309
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d3f8a61b2c07"
+down_revision: Union[str, None] = "9e41c2a7d5f0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_refresh_tokens_created_at",
+        "refresh_tokens",
+        ["created_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_refresh_tokens_created_at", table_name="refresh_tokens")
@@ -15,7 +15,13 @@ from fastapi import (
 )
 
 from auth_app.src.core.logger import logstash_handler
-from auth_app.src.schemas.entity import CheckoutResponse, UserSignIn
+from auth_app.src.models.choices import AccessLevel
+from auth_app.src.schemas.entity import (
+    CheckoutResponse,
+    RevokedTokensResponse,
+    UserSignIn,
+)
+from auth_app.src.services.access_service import access_control, security_jwt
 from auth_app.src.services.auth_service import AuthService, get_auth_service
 from auth_app.src.utils.utils import set_cookie
 
@@ -166,3 +172,23 @@ async def checkout_token(
         )
     await Authorize.jwt_required(token)
     return await auth_service.checkout_token(token)
+
+
+@router.get(
+    "/revoked",
+    response_model=RevokedTokensResponse,
+    status_code=HTTPStatus.OK,
+    summary="Список отозванных access token",
+    description=(
+        "Межсервисный запрос списка jti отозванных(logout) access token, "
+        "используется сервисами для локальной проверки токенов."
+    ),
+    dependencies=[Depends(security_jwt)],
+)
+@access_control(AccessLevel.ADMIN, allow_services=True)
+async def revoked_tokens(
+    request: Request,  # нужен для декоратора.
+    auth_service: AuthService = Depends(get_auth_service),
+) -> RevokedTokensResponse:
+    tokens = await auth_service.get_revoked_tokens()
+    return RevokedTokensResponse(tokens=tokens)
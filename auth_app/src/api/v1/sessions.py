@@ -6,9 +6,18 @@ from uuid import UUID
 
 from async_fastapi_jwt_auth import AuthJWT
 from async_fastapi_jwt_auth.auth_jwt import AuthJWTBearer
-from fastapi import APIRouter, Cookie, Depends, HTTPException, Path, Query
+from fastapi import (
+    APIRouter,
+    Cookie,
+    Depends,
+    HTTPException,
+    Path,
+    Query,
+    Response,
+)
 
 from auth_app.src.core.logger import LOGGING
+from auth_app.src.db.queries.pagination import next_cursor
 from auth_app.src.models.choices import RequestData, RequestTypes
 from auth_app.src.schemas.entity import UserSessions
 from auth_app.src.services.auth_service import AuthService, get_auth_service
@@ -32,6 +41,7 @@ auth_dep = AuthJWTBearer()
 )
 async def list_sessions(
     user_id: Annotated[UUID, Path(description="Get session by user_id")],
+    response: Response,
     access_token: Annotated[
         str | None,
         Cookie(
@@ -44,6 +54,9 @@ async def list_sessions(
     ),
     page_size: int = Query(10, ge=1, description="Page size for pagination"),
     sort: str = Query(default="desc", description="Criteria to sort the users"),
+    cursor: str | None = Query(
+        default=None, description="Cursor of next page(X-Next-Cursor header)"
+    ),
     view_service: SessionService = Depends(get_sessions_service),
     auth_service: AuthService = Depends(get_auth_service),
     Authorize: AuthJWT = Depends(auth_dep),
@@ -55,11 +68,16 @@ async def list_sessions(
         size=page_size,
         page=page_number,
         sort=sort,
+        cursor=cursor,
         query=str(user_id),
     )
     try:
         users = await view_service.get_list(request_data)
+        if next_page := next_cursor(users, "start", page_size):
+            response.headers["X-Next-Cursor"] = next_page
         return users
+    except ValueError as e:
+        raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e))
     except Exception as e:
         raise HTTPException(
             status_code=HTTPStatus.INTERNAL_SERVER_ERROR, detail=str(e)
@@ -0,0 +1,101 @@
+from http import HTTPStatus
+
+from fastapi import APIRouter, Request
+
+from auth_app.src.db.redis import get_pool_stats as get_redis_pool_stats
+from auth_app.src.models.choices import AccessLevel
+from auth_app.src.services.access_service import access_control
+from auth_app.src.services.http_session import get_pool_stats
+from auth_app.src.services.mailer import mailer
+from auth_app.src.services.password_hasher import password_hasher
+from auth_app.src.services.single_flight import single_flight
+from auth_app.src.services.user_cache import user_cache
+
+router = APIRouter()
+
+
+@router.get(
+    "/http-pool",
+    response_model=dict,
+    status_code=HTTPStatus.OK,
+    summary="Состояние пула HTTP соединений",
+    description=(
+        "Лимиты, занятые и свободные соединения общего пула "
+        "исходящих HTTP запросов воркера."
+    ),
+)
+@access_control(AccessLevel.ADMIN, allow_services=True)
+async def http_pool_stats(request: Request) -> dict:  # request для декоратора
+    return get_pool_stats()
+
+
+@router.get(
+    "/redis-pool",
+    response_model=dict,
+    status_code=HTTPStatus.OK,
+    summary="Состояние пула соединений Redis",
+    description=(
+        "Размер, занятые и свободные соединения пула Redis воркера, "
+        "exhausted - сколько раз пул был исчерпан."
+    ),
+)
+@access_control(AccessLevel.ADMIN, allow_services=True)
+async def redis_pool_stats(request: Request) -> dict:
+    return get_redis_pool_stats()
+
+
+@router.get(
+    "/user-cache",
+    response_model=dict,
+    status_code=HTTPStatus.OK,
+    summary="Состояние L1 кеша пользователей",
+    description="Размер и попадания L1 кеша UserInDB воркера.",
+)
+@access_control(AccessLevel.ADMIN, allow_services=True)
+async def user_cache_stats(request: Request) -> dict:
+    return user_cache.stats()
+
+
+@router.get(
+    "/cache",
+    response_model=dict,
+    status_code=HTTPStatus.OK,
+    summary="Состояние кеша",
+    description=(
+        "Попадания, промахи, объединенные запросы(coalesced), "
+        "отданные устаревшие значения и ранние обновления кеша воркера."
+    ),
+)
+@access_control(AccessLevel.ADMIN, allow_services=True)
+async def cache_stats(request: Request) -> dict:
+    return {**single_flight.stats, "in_flight": single_flight.in_flight()}
+
+
+@router.get(
+    "/smtp-pool",
+    response_model=dict,
+    status_code=HTTPStatus.OK,
+    summary="Состояние пула SMTP соединений",
+    description=(
+        "Размер пула, простаивающие соединения и свободные слоты "
+        "одновременной отправки писем воркера."
+    ),
+)
+@access_control(AccessLevel.ADMIN, allow_services=True)
+async def smtp_pool_stats(request: Request) -> dict:
+    return mailer.stats()
+
+
+@router.get(
+    "/password-hasher",
+    response_model=dict,
+    status_code=HTTPStatus.OK,
+    summary="Хеширование паролей",
+    description=(
+        "Метод и пул хеширования паролей, количество, среднее и "
+        "максимальное время хеширования, проверки и пересчета хешей."
+    ),
+)
+@access_control(AccessLevel.ADMIN, allow_services=True)
+async def password_hasher_stats(request: Request) -> dict:
+    return password_hasher.stats()
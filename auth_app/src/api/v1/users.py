@@ -4,9 +4,18 @@ from logging import config as logging_config
 from typing import Annotated
 
 from async_fastapi_jwt_auth.auth_jwt import AuthJWTBearer
-from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Path,
+    Query,
+    Request,
+    Response,
+)
 
 from auth_app.src.core.logger import LOGGING
+from auth_app.src.db.queries.pagination import next_cursor
 from auth_app.src.models.choices import AccessLevel, RequestData, RequestTypes
 from auth_app.src.schemas.entity import UserBulkRequest, UserInDB
 from auth_app.src.services.access_service import access_control
@@ -54,11 +63,15 @@ async def get_user(
 @access_control(AccessLevel.MODERATOR, allow_services=True)
 async def list_users(
     request: Request,  # нужен для декоратора.
+    response: Response,
     page_number: int = Query(
         default=1, ge=1, description="Page number for pagination"
     ),
     page_size: int = Query(10, ge=1, description="Page size for pagination"),
     sort: str = Query(default="desc", description="Criteria to sort the users"),
+    cursor: str | None = Query(
+        default=None, description="Cursor of next page(X-Next-Cursor header)"
+    ),
     view_service: UsersService = Depends(get_users_service),
 ):
     request_data = RequestData(
@@ -67,10 +80,15 @@ async def list_users(
         size=page_size,
         page=page_number,
         sort=sort,
+        cursor=cursor,
     )
     try:
         users = await view_service.get_list(request_data)
+        if next_page := next_cursor(users, "created_at", page_size):
+            response.headers["X-Next-Cursor"] = next_page
         return users
+    except ValueError as e:
+        raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e))
     except Exception as e:
         raise HTTPException(
             status_code=HTTPStatus.INTERNAL_SERVER_ERROR, detail=str(e)
@@ -1,4 +1,5 @@
 import os
+from typing import Literal
 
 from pydantic import ConfigDict, Field
 from pydantic_settings import BaseSettings
@@ -62,6 +63,16 @@ class AppConfig(BaseSettings):
     auth_url: str = Field(default="http://auth_app:80/")
     profile_url: str = Field(default="http://profiles_app:40/")
     profile_create_url: str = Field(default="api/v1/profiles")
+    profile_bulk_url: str = Field(default="api/v1/profiles/bulk")
+    # пакет профилей воркера: не больше --threads dramatiq процесса.
+    profile_batch_size: int = Field(default=16)
+    profile_batch_wait: float = Field(default=0.5)  # сек ожидания пакета
+    profile_task_time_limit: int = Field(default=60_000)  # мс, задачи
+    outbox_batch_size: int = Field(default=100)  # событий за транзакцию
+    outbox_poll_interval: float = Field(default=1.0)  # сек, нет событий
+    outbox_retention: int = Field(
+        default=60 * 60 * 24,
+    )  # 1 день хранения опубликованных событий
     enable_tracer: bool = Field(default=False)
     enable_hawk: bool = Field(default=True)
     jaeger_url: str = Field(default="http://jaeger:14268/")
@@ -90,6 +101,29 @@ class AppConfig(BaseSettings):
         default=60 * 60 * 24 * 30,
     )  # 30 дней
     service_token_max_age: int = 30 * 24 * 3600  # 30 дней в секундах
+    cache_prefix: str = Field(default="auth")  # префикс ключей Redis
+    cache_version: int = Field(default=1)  # версия схемы кешируемых данных
+    revoked_tokens_key: str = Field(
+        default="revoked_access_tokens",
+        description="ключ Redis со списком отозванных access token",
+    )
+    used_refresh_tokens_key: str = Field(
+        default="used_refresh_tokens",
+        description="префикс ключей Redis использованных refresh token",
+    )  # без версии кеша: смена cache_version не должна их сбрасывать
+    # журнал использованных refresh token в БД(аудит), пишется фоном
+    refresh_audit_enabled: bool = Field(default=True)
+    refresh_audit_batch_size: int = Field(default=100)  # записей за запрос
+    refresh_audit_queue_size: int = Field(default=10_000)
+    refresh_audit_retention: int = Field(
+        default=60 * 60 * 24 * 90,
+    )  # 90 дней хранения журнала
+    user_cache_size: int = Field(default=10_000)  # L1 кеш users воркера
+    user_cache_ttl: int = Field(default=30)  # сек
+    user_cache_expire: int = Field(
+        default=60 * 60 * 24 * 7,
+    )  # 7 дней в Redis, сбрасывается при изменении usera
+    user_cache_channel: str = Field(default="user_cache_invalidation")
 
 
 class ContactConfig(BaseSettings):
@@ -102,6 +136,10 @@ class ContactConfig(BaseSettings):
 
 class RedisData(BaseSettings):
     unix_socket_path: str
+    db: int = Field(default=1)
+    max_connections: int = Field(default=50)  # размер пула воркера
+    pool_timeout: int = Field(default=5)  # сек ожидания свободного соединения
+    health_check_interval: int = Field(default=30)  # сек
 
     model_config = ConfigDict(  # type: ignore
         env_prefix="REDIS_",
@@ -156,6 +194,47 @@ class RabbitMQData(BaseSettings):
     )
 
 
+class CacheConfig(BaseSettings):
+    stale_ttl: int = Field(default=0)  # сек отдачи устаревшего значения
+    early_refresh_beta: float = Field(default=1.0)  # 0 - выключено
+    use_lock: bool = Field(default=False)  # Redis lock между воркерами
+    lock_timeout: float = Field(default=5.0)  # сек
+    lock_poll_interval: float = Field(default=0.05)  # сек
+    negative_ttl: int = Field(default=30)  # сек хранения "не найдено"
+
+    model_config = ConfigDict(  # type: ignore
+        env_prefix="CACHE_",
+        envenv_file=".conn.env",
+    )
+
+
+class HttpClientConfig(BaseSettings):
+    limit: int = Field(default=100)  # всего соединений в пуле
+    limit_per_host: int = Field(default=30)
+    keepalive_timeout: int = Field(default=30)  # сек
+    dns_cache_ttl: int = Field(default=300)  # сек
+    total_timeout: int = Field(default=30)  # сек
+    connect_timeout: int = Field(default=5)  # сек
+
+    model_config = ConfigDict(  # type: ignore
+        env_prefix="HTTP_CLIENT_",
+        envenv_file=".conn.env",
+    )
+
+
+class PasswordHashConfig(BaseSettings):
+    # метод werkzeug с явными параметрами: при изменении
+    # хеши пересчитываются при входе пользователя
+    method: str = Field(default="scrypt:32768:8:1")
+    executor: Literal["thread", "process"] = Field(default="thread")
+    max_workers: int = Field(default=4)  # одновременных вычислений хеша
+
+    model_config = ConfigDict(  # type: ignore
+        env_prefix="PASSWORD_HASH_",
+        envenv_file=".conn.env",
+    )
+
+
 psql_data = PsqlData()
 redis_data = RedisData()  # type: ignore
 app_config = AppConfig()  # type: ignore
@@ -164,6 +243,9 @@ superuser_data = SuperUserConfig()
 logstash_data = LogstashConfig()
 hawk_data = HawkConfig()
 rabbitmq_data = RabbitMQData()
+http_client_config = HttpClientConfig()
+cache_config = CacheConfig()
+password_hash_config = PasswordHashConfig()
 
 contact_config = {  # type: ignore
     "name": contact_config.name,
@@ -1,4 +1,4 @@
-from pydantic import ConfigDict
+from pydantic import ConfigDict, Field
 from pydantic_settings import BaseSettings
 
 
@@ -8,6 +8,13 @@ class SmtpConfig(BaseSettings):
     email_use_tls: bool
     email_use_ssl: bool
     default_from_email: str
+    email_host_user: str | None = Field(default=None)
+    email_host_password: str | None = Field(default=None)
+    pool_size: int = Field(default=5)  # одновременных SMTP соединений
+    idle_timeout: float = Field(default=30.0)  # сек без проверки NOOP
+    max_retries: int = Field(default=3)  # переподключений на письмо
+    retry_backoff: float = Field(default=0.5)  # сек * номер попытки
+    timeout: float = Field(default=10.0)  # сек на операцию SMTP
 
     model_config = ConfigDict(  # type: ignore
         env_prefix="SMTP_",
@@ -5,6 +5,7 @@ class Base(DeclarativeBase):
     pass
 
 
+from .outbox import OutboxEvent
 from .roles import Role, UserRoles
 from .sessions import Sessions
 from .social_account import SocialAccount
@@ -0,0 +1,33 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Index, String, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from . import Base
+from .mixins import TimeStampedMixin, UUIDMixin
+
+
+class OutboxEvent(Base, UUIDMixin, TimeStampedMixin):
+    """
+    Побочное действие, записанное в одной транзакции с изменением
+    данных(письмо, создание профиля). Публикуется в RabbitMQ
+    ретранслятором(services/outbox_relay.py), sent_at - время публикации.
+    """
+
+    __tablename__ = "outbox"
+    __table_args__ = (
+        # выборка неопубликованных событий ретранслятором
+        Index(
+            "ix_outbox_pending",
+            "created_at",
+            postgresql_where=text("sent_at IS NULL"),
+        ),
+    )
+
+    event_type: Mapped[str] = mapped_column(String(64), nullable=False)
+    payload: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    sent_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+
+    def __repr__(self) -> str:
+        return f"<OutboxEvent {self.event_type} {self.id}>"
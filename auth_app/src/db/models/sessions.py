@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import DateTime, ForeignKey, String
+from sqlalchemy import DateTime, ForeignKey, Index, String
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -13,6 +13,10 @@ from .mixins import UUIDMixin
 
 class Sessions(Base, UUIDMixin):
     __tablename__ = "sessions"
+    __table_args__ = (
+        # keyset пагинация сессий пользователя
+        Index("ix_sessions_user_id_start_id", "user_id", "start", "id"),
+    )
 
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -18,7 +18,7 @@ class SocialAccount(Base, TimeStampedMixin, UUIDMixin):
     provider: Mapped[str] = mapped_column(String, index=True)
     provider_user_id: Mapped[str] = mapped_column(String, index=True)
     user_id: Mapped[UUID] = mapped_column(
-        ForeignKey("users.id", ondelete="CASCADE")
+        ForeignKey("users.id", ondelete="CASCADE"), index=True
     )
 
     user = relationship("User", back_populates="social_accounts")
@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, String
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -9,7 +9,16 @@ from .mixins import TimeStampedMixin, UUIDMixin
 
 
 class RefreshToken(Base, UUIDMixin, TimeStampedMixin):
+    """
+    Журнал использованных refresh token: id токена(jti) и время
+    использования. Проверка повторного использования - в Redis.
+    """
+
     __tablename__ = "refresh_tokens"
+    __table_args__ = (
+        # очистка журнала по сроку хранения
+        Index("ix_refresh_tokens_created_at", "created_at"),
+    )
 
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
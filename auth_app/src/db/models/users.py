@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, String
+from sqlalchemy import Boolean, Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from werkzeug.security import check_password_hash
 
@@ -8,6 +8,10 @@ from .mixins import TimeStampedMixin, UUIDMixin
 
 class User(Base, UUIDMixin, TimeStampedMixin):
     __tablename__ = "users"
+    __table_args__ = (
+        # keyset пагинация списка пользователей
+        Index("ix_users_created_at_id", "created_at", "id"),
+    )
 
     login: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
     password: Mapped[str] = mapped_column(String(255), nullable=False)
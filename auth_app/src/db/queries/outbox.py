@@ -0,0 +1,52 @@
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+from sqlalchemy import delete, select, update
+
+from auth_app.src.db.models.outbox import OutboxEvent
+
+from .base import BaseQueryService
+
+
+class OutboxQueryService(BaseQueryService):
+
+    def add(self, event_type: str, payload: dict) -> OutboxEvent:
+        """
+        Добавление события в текущую транзакцию(без commit).
+        Событие сохраняется вместе с остальными изменениями сессии.
+        """
+        event = OutboxEvent(event_type=event_type, payload=payload)
+        self.session.add(event)
+        return event
+
+    async def lock_pending(self, limit: int) -> list[OutboxEvent]:
+        """
+        Неопубликованные события в порядке создания.
+        FOR UPDATE SKIP LOCKED - несколько ретрансляторов
+        не получат одни и те же события.
+        """
+        query = (
+            select(OutboxEvent)
+            .where(OutboxEvent.sent_at.is_(None))
+            .order_by(OutboxEvent.created_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        return list((await self.session.execute(query)).scalars().all())
+
+    async def mark_sent(self, event_ids: list[UUID]) -> None:
+        """Отметка об успешной публикации(без commit)."""
+        await self.session.execute(
+            update(OutboxEvent)
+            .where(OutboxEvent.id.in_(event_ids))
+            .values(sent_at=datetime.now(timezone.utc))
+        )
+
+    async def purge_sent(self, older_than: int) -> int:
+        """Удаление опубликованных событий старше older_than сек."""
+        border = datetime.now(timezone.utc) - timedelta(seconds=older_than)
+        result = await self.session.execute(
+            delete(OutboxEvent).where(OutboxEvent.sent_at < border)
+        )
+        await self.session.commit()
+        return result.rowcount  # type: ignore
@@ -75,6 +75,13 @@ class RoleQueryService(BaseQueryService):
         result = await self.session.execute(query)
         return result.scalars().first()
 
+    async def get_role_user_ids(self, role_id: int) -> list[str]:
+        """id пользователей с данной ролью."""
+        result = await self.session.execute(
+            select(UserRoles.user_id).where(UserRoles.role_id == int(role_id))
+        )
+        return [str(user_id) for user_id in result.scalars().all()]
+
     async def delete_role_by_id(self, role_id: int) -> bool:
         """Удалить роль по id."""
         try:
@@ -9,6 +9,7 @@ from auth_app.src.db.models.sessions import Sessions
 from auth_app.src.models.choices import EndType, RequestData
 
 from .base import BaseQueryService
+from .pagination import keyset_page
 
 
 class SessionQueryService(BaseQueryService):
@@ -62,21 +63,24 @@ class SessionQueryService(BaseQueryService):
             await self.session.refresh(session)
 
     async def get_list(self, request_data: RequestData) -> list[Sessions]:
-        """Возвращает список пользователей без фильтрации."""
+        """
+        Возвращает список сессий пользователя.
+        С request_data.cursor - keyset пагинация по (start, id).
+        """
         page_size = request_data.size
         page = request_data.page
-        sort = request_data.sort
+        cursor = request_data.cursor
         user_id = request_data.query
 
-        if sort == "asc":
-            order = Sessions.start.asc()
-        order = Sessions.start.desc()
-
-        result: AsyncResult = await self.session.execute(
-            select(Sessions)
-            .filter(Sessions.user_id == user_id)
-            .order_by(order)
-            .limit(page_size)
-            .offset(page_size * (page - 1))  # type: ignore
+        query = keyset_page(
+            select(Sessions).filter(Sessions.user_id == user_id),
+            Sessions.start,
+            Sessions.id,
+            request_data.sort,
+            page_size,  # type: ignore
+            cursor,
         )
+        if not cursor:
+            query = query.offset(page_size * (page - 1))  # type: ignore
+        result: AsyncResult = await self.session.execute(query)
         return result.scalars().all()  # type: ignore
@@ -1,4 +1,8 @@
-from sqlalchemy import select
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
 
 from auth_app.src.db.models.tokens import RefreshToken
 
@@ -6,22 +10,43 @@ from .base import BaseQueryService
 
 
 class TokenQueryService(BaseQueryService):
-    async def store_refresh_token(self, user_id: str, token: str):
-        """Добавить использованный RefreshToken в базу данных."""
+    """
+    Журнал использованных refresh token(аудит).
+    Проверка повторного использования - в Redis(used_refresh_tokens),
+    в БД хранится только id токена(jti), без самого токена.
+    """
 
-        refresh_token = RefreshToken(user_id=user_id, token=token)
-        self.session.add(refresh_token)
+    async def add_used_tokens(self, rows: list[dict]) -> None:
+        """Пакетная запись использованных токенов(user_id, token)."""
+        await self.session.execute(
+            insert(RefreshToken).values(rows).on_conflict_do_nothing()
+        )
         await self.session.commit()
-        await self.session.refresh(refresh_token)
 
-    async def get_refresh_token_by_token(
-        self, token: str
-    ) -> RefreshToken | None:
-        """Вернуть объект refresh token."""
+    async def get_legacy_tokens(self, limit: int) -> list[RefreshToken]:
+        """
+        Записи прежнего формата: полный refresh token вместо id.
+        Id токена(jti, uuid) не длиннее 64 символов.
+        """
         result = await self.session.execute(
-            select(RefreshToken).where(RefreshToken.token == token)
+            select(RefreshToken)
+            .where(func.length(RefreshToken.token) > 64)
+            .limit(limit)
         )
-        obj = result.scalars().first()
-        if obj:
-            return obj
-        return None
+        return list(result.scalars().all())
+
+    async def delete_tokens(self, token_ids: list[UUID]) -> None:
+        """Удаление записей по id."""
+        await self.session.execute(
+            delete(RefreshToken).where(RefreshToken.id.in_(token_ids))
+        )
+        await self.session.commit()
+
+    async def purge_audit(self, older_than: int) -> int:
+        """Удаление записей журнала старше older_than сек."""
+        border = datetime.now(timezone.utc) - timedelta(seconds=older_than)
+        result = await self.session.execute(
+            delete(RefreshToken).where(RefreshToken.created_at < border)
+        )
+        await self.session.commit()
+        return result.rowcount  # type: ignore
@@ -1,18 +1,19 @@
 from uuid import UUID
 
 from fastapi.encoders import jsonable_encoder
-from sqlalchemy import String, func, or_, select
+from sqlalchemy import String, func, literal_column, or_, select, update
 from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncResult
-from werkzeug.security import generate_password_hash
 
 from auth_app.src.db.models.roles import Role, UserRoles
 from auth_app.src.db.models.social_account import SocialAccount
 from auth_app.src.db.models.users import User
 from auth_app.src.models.choices import RequestData
 from auth_app.src.schemas.entity import UserCreate
+from auth_app.src.services.password_hasher import password_hasher
 
 from .base import BaseQueryService
+from .pagination import keyset_page
 
 
 class UserQueryService(BaseQueryService):
@@ -21,32 +22,51 @@ class UserQueryService(BaseQueryService):
         """
         Базовый SQL-запрос для извлечения пользователей
         с ролями и социальными аккаунтами.
+            Роли и аккаунты - коррелированные подзапросы по индексам
+            user_id: без произведения ролей на аккаунты(JOIN + GROUP BY)
+            и только для строк, попавших в результат(LIMIT).
         """
-        return (
+        roles = (
             select(
-                User.id,
-                User.login,
-                User.email,
-                User.first_name,
-                User.last_name,
-                User.is_active,
-                User.password,
-                func.array_agg(Role.name, type_=ARRAY(String)).label("roles"),
-                func.array_agg(
-                    func.jsonb_build_object(
-                        "id",
-                        SocialAccount.id,
-                        "provider",
-                        SocialAccount.provider,
-                        "provider_user_id",
-                        SocialAccount.provider_user_id,
-                    )
-                ).label("social_accounts"),
+                func.coalesce(
+                    func.array_agg(Role.name, type_=ARRAY(String)),
+                    literal_column("'{}'"),
+                )
             )
-            .outerjoin(UserRoles, UserRoles.user_id == User.id)
-            .outerjoin(Role, UserRoles.role_id == Role.id)
-            .outerjoin(SocialAccount, SocialAccount.user_id == User.id)
-            .group_by(User.id)
+            .join(UserRoles, UserRoles.role_id == Role.id)
+            .where(UserRoles.user_id == User.id)
+            .scalar_subquery()
+        )
+        social_accounts = (
+            select(
+                func.coalesce(
+                    func.array_agg(
+                        func.jsonb_build_object(
+                            "id",
+                            SocialAccount.id,
+                            "provider",
+                            SocialAccount.provider,
+                            "provider_user_id",
+                            SocialAccount.provider_user_id,
+                        )
+                    ),
+                    literal_column("'{}'"),
+                )
+            )
+            .where(SocialAccount.user_id == User.id)
+            .scalar_subquery()
+        )
+        return select(
+            User.id,
+            User.login,
+            User.email,
+            User.first_name,
+            User.last_name,
+            User.is_active,
+            User.password,
+            User.created_at,
+            roles.label("roles"),
+            social_accounts.label("social_accounts"),
         )
 
     async def get_by_id(self, obj_id: UUID | int) -> User | None:
@@ -89,12 +109,19 @@ class UserQueryService(BaseQueryService):
         )
         user = result.scalars().first()
         if user:
-            user.password = generate_password_hash(new_password)
+            user.password = await password_hasher.hash(new_password)
             await self.session.commit()
             await self.session.refresh(user)
             return user
         return None
 
+    async def set_password_hash(self, user_id: UUID, pwhash: str) -> None:
+        """Замена хеша пароля(пересчет с новыми параметрами)."""
+        await self.session.execute(
+            update(User).where(User.id == user_id).values(password=pwhash)
+        )
+        await self.session.commit()
+
     async def is_user_exists(self, email: str, login: str) -> bool:
         """Существует ли пользователь с таким email или login"""
         query = select(User).filter(
@@ -103,35 +130,46 @@ class UserQueryService(BaseQueryService):
         result = await self.session.execute(query)
         return bool(result.scalars().first())
 
-    async def create_user(self, user_data: UserCreate) -> User:
-        """Создание пользователя."""
+    async def create_user(
+        self, user_data: UserCreate, commit: bool = True
+    ) -> User:
+        """
+        Создание пользователя.
+        commit=False - только flush: транзакцию завершает вызывающий
+        (например, вместе с событиями outbox).
+        """
         obj_dto = jsonable_encoder(user_data)
         obj_dto.pop("password2", None)
-        obj_dto["password"] = generate_password_hash(obj_dto["password"])
+        obj_dto["password"] = await password_hasher.hash(obj_dto["password"])
 
         obj = User(**obj_dto)
         self.session.add(obj)
-        await self.session.commit()
+        if commit:
+            await self.session.commit()
+        else:
+            await self.session.flush()
         await self.session.refresh(obj)
         return obj
 
     async def get_list(self, request_data: RequestData) -> list[User]:
-        """Возвращает список пользователей без фильтрации."""
+        """
+        Возвращает список пользователей без фильтрации.
+        С request_data.cursor - keyset пагинация по (created_at, id).
+        """
         page_size = request_data.size
         page = request_data.page
-        sort = request_data.sort
-
-        if sort == "asc":
-            order = User.created_at.asc()
-        else:
-            order = User.created_at.desc()
-
-        query = (
-            self._base_user_query()
-            .order_by(order)
-            .limit(page_size)
-            .offset(page_size * (page - 1))  # type: ignore
+        cursor = request_data.cursor
+
+        query = keyset_page(
+            self._base_user_query(),
+            User.created_at,
+            User.id,
+            request_data.sort,
+            page_size,  # type: ignore
+            cursor,
         )
+        if not cursor:
+            query = query.offset(page_size * (page - 1))  # type: ignore
         result: AsyncResult = await self.session.execute(query)
         users = result.fetchall()
         return users  # type: ignore
@@ -1,9 +1,76 @@
-from redis.asyncio import Redis
+from redis.asyncio import BlockingConnectionPool, Redis
+from redis.asyncio.connection import UnixDomainSocketConnection
 
 from auth_app.src.core.config import redis_data
 
+
+class MonitoredConnectionPool(BlockingConnectionPool):
+    """
+    Пул соединений Redis воркера.
+    При исчерпании ждет свободное соединение не дольше pool_timeout,
+    количество таких ожиданий хранится в exhausted.
+    """
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.exhausted = 0
+
+    async def get_connection(self, command_name, *keys, **options):
+        if (
+            not self._available_connections
+            and len(self._in_use_connections) >= self.max_connections
+        ):
+            self.exhausted += 1
+        return await super().get_connection(command_name, *keys, **options)
+
+    def stats(self) -> dict:
+        """Состояние пула для метрик."""
+        return {
+            "max_connections": self.max_connections,
+            "in_use": len(self._in_use_connections),
+            "available": len(self._available_connections),
+            "exhausted": self.exhausted,
+        }
+
+
+pool: MonitoredConnectionPool | None = None
 redis: Redis | None = None
 
 
+async def init_redis() -> Redis:
+    """Создание общего пула соединений Redis(вызывается в lifespan)."""
+    global pool, redis
+    pool = MonitoredConnectionPool(
+        connection_class=UnixDomainSocketConnection,
+        path=redis_data.unix_socket_path,
+        db=redis_data.db,
+        max_connections=redis_data.max_connections,
+        timeout=redis_data.pool_timeout,
+        health_check_interval=redis_data.health_check_interval,
+    )
+    redis = Redis(connection_pool=pool)
+    return redis
+
+
 async def get_redis() -> Redis:
-    return Redis(unix_socket_path=redis_data.unix_socket_path, db=1)
+    """Клиент поверх общего пула, вне lifespan пул создается при вызове."""
+    if redis is None:
+        return await init_redis()
+    return redis
+
+
+async def close_redis() -> None:
+    """Закрытие клиента и всех соединений пула(lifespan)."""
+    global pool, redis
+    if redis is not None:
+        await redis.aclose()
+    if pool is not None:
+        await pool.disconnect()
+    pool, redis = None, None
+
+
+def get_pool_stats() -> dict:
+    """Состояние пула соединений Redis."""
+    if pool is None:
+        return {"initialized": False}
+    return {"initialized": True, **pool.stats()}
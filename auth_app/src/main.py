@@ -1,3 +1,4 @@
+import asyncio
 from contextlib import asynccontextmanager
 
 from async_fastapi_jwt_auth.exceptions import AuthJWTException
@@ -9,6 +10,14 @@ from starlette.exceptions import HTTPException as StarletteHTTPException
 from starlette.middleware.sessions import SessionMiddleware
 
 from auth_app.src.services.access_service import security_jwt
+from auth_app.src.services.http_session import (
+    close_http_session,
+    init_http_session,
+)
+from auth_app.src.services.mailer import mailer
+from auth_app.src.services.password_hasher import password_hasher
+from auth_app.src.services.used_tokens import used_refresh_tokens
+from auth_app.src.services.user_cache import user_cache
 
 from .api.v1 import (
     auth,
@@ -17,12 +26,13 @@ from .api.v1 import (
     role,
     sessions,
     signup,
+    stats,
     user_roles,
     users,
 )
 from .core import config
 from .core.auth_config import authjwt_exception_handler
-from .db.redis import get_redis
+from .db.redis import close_redis, init_redis
 from .exceptions import global_exception_handler, http_exception_handler
 from .hawk import init_hawk
 from .middleware import HawkMiddleware, before_request
@@ -32,7 +42,10 @@ from .tracing import configure_tracer
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Жизненный цикл приложения."""
-    redis = await get_redis()
+    redis = await init_redis()
+    await init_http_session()
+    user_cache_listener = asyncio.create_task(user_cache.listen(redis))
+    refresh_audit_writer = asyncio.create_task(used_refresh_tokens.run_audit())
     if config.app_config.enable_hawk:
         app.state.hawk = init_hawk()
     else:
@@ -41,7 +54,13 @@ async def lifespan(app: FastAPI):
         await FastAPILimiter.init(redis)
         yield
     finally:
-        await redis.close()
+        user_cache_listener.cancel()
+        refresh_audit_writer.cancel()
+        await used_refresh_tokens.close()
+        await close_http_session()
+        await mailer.close()
+        password_hasher.close()
+        await close_redis()
 
 
 app = FastAPI(
@@ -96,3 +115,9 @@ app.include_router(
     tags=["roles"],
     dependencies=[Depends(security_jwt)],
 )
+app.include_router(
+    stats.router,
+    prefix="/api/v1/stats",
+    tags=["stats"],
+    dependencies=[Depends(security_jwt)],
+)
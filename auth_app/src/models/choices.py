@@ -11,6 +11,7 @@ class RequestData(BaseModel):
     size: int | None = None
     query: str | UUID | int | None = None
     sort: str | None = None
+    cursor: str | None = None  # keyset пагинация, вместо page
 
 
 class RequestTypes(Enum):
@@ -27,6 +28,11 @@ class EndType(Enum):
     INVALID_REFRESH = "invalid_refresh"
 
 
+class OutboxEventType(Enum):
+    SEND_EMAIL = "send_email"
+    CREATE_PROFILE = "create_profile"
+
+
 class UserField(Enum):
     ID = "user_id"
     LOGIN = "user_login"
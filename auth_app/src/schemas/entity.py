@@ -78,6 +78,7 @@ class CreatedUser(BaseModel):
 
 class UserInDB(CreatedUser):
     social_accounts: list[SocialAccountsUser] = Field(default_factory=list)
+    created_at: datetime | None = None
 
     @field_validator("social_accounts", mode="before")
     def set_accounts_to_empty_list(cls, v):
@@ -164,5 +165,9 @@ class CheckoutResponse(BaseModel):
     user_roles: list[str] = Field(..., title="Список ролей usera")
 
 
+class RevokedTokensResponse(BaseModel):
+    tokens: list[str] = Field(..., title="Список jti отозванных access token")
+
+
 class UserBulkRequest(BaseModel):
     user_ids: list[UUID] = Field(..., title="Список запращиваемых users")
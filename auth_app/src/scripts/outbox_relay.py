@@ -0,0 +1,6 @@
+import asyncio
+
+from auth_app.src.services.outbox_relay import outbox_relay
+
+if __name__ == "__main__":
+    asyncio.run(outbox_relay.run())
@@ -0,0 +1,40 @@
+"""
+Очистка журнала refresh token.
+    Записи прежнего формата(полный токен) переносятся в Redis,
+    если токен еще не истек, и удаляются из БД.
+    Записи журнала старше refresh_audit_retention удаляются.
+Запуск разово после обновления и далее по расписанию:
+    python src/scripts/purge_refresh_tokens.py
+"""
+
+import asyncio
+
+from auth_app.src.core.config import app_config
+from auth_app.src.core.logger import logstash_handler
+from auth_app.src.db.queries.token import TokenQueryService
+from auth_app.src.db.redis import close_redis
+from auth_app.src.db.sessions import async_session, engine
+from auth_app.src.services.cache_service import get_redis_cache_service
+from auth_app.src.services.used_tokens import used_refresh_tokens
+
+logger = logstash_handler()
+
+
+async def purge_refresh_tokens() -> None:
+    cache_service = await get_redis_cache_service()
+    try:
+        migrated = await used_refresh_tokens.migrate_legacy(cache_service)
+        async with async_session() as session:
+            purged = await TokenQueryService(session).purge_audit(
+                app_config.refresh_audit_retention
+            )
+        logger.info(
+            f"Журнал refresh token: перенесено {migrated}, удалено {purged}"
+        )
+    finally:
+        await close_redis()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(purge_refresh_tokens())
@@ -8,6 +8,7 @@ from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 from auth_app.src.core.config import app_config
 from auth_app.src.models.choices import AccessLevel
+from auth_app.src.services.http_session import http_session
 from auth_app.src.utils.utils import decode_id, encode_id
 
 
@@ -103,7 +104,7 @@ class JWTBearer(HTTPBearer):
 
     async def send_token_for_validation(self, jwt_token: str) -> dict | None:
         """Отправление access tokena на проверку и дешифровку."""
-        async with aiohttp.ClientSession() as session:
+        async with http_session() as session:
             headers = {"Authorization": f"Bearer {jwt_token}"}
             try:
                 # url = f"{app_config.auth_url}api/v1/auth/checkout"
@@ -2,6 +2,7 @@ from typing import Any
 
 import aiohttp
 
+from auth_app.src.services.http_session import get_http_session
 from auth_app.src.services.token_manager import TokenManager
 
 
@@ -18,14 +19,20 @@ class APIClient:
         self.base_url = base_url
         self.token_manager = token_manager
         self.session: aiohttp.ClientSession | None = None
+        self._own_session = False
 
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        # общий пул воркера, вне lifespan(dramatiq) -> собственная сессия.
+        self.session = get_http_session()
+        self._own_session = self.session is None
+        if self._own_session:
+            self.session = aiohttp.ClientSession()
         return self
 
     async def __aexit__(self, exc_type, exc, tb):
-        if self.session:
+        if self.session and self._own_session:
             await self.session.close()
+        self.session = None
 
     async def request(self, method: str, endpoint: str, **kwargs) -> Any:
         if not self.session:
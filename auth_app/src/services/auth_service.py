@@ -1,12 +1,13 @@
 import logging
+import time
 from http import HTTPStatus
 from logging import config as logging_config
 from typing import Any
+from uuid import UUID
 
 from async_fastapi_jwt_auth import AuthJWT
 from async_fastapi_jwt_auth.auth_jwt import AuthJWTBearer
 from fastapi import Depends, HTTPException, Request
-from werkzeug.security import check_password_hash
 
 from auth_app.src.core.config import app_config
 from auth_app.src.core.logger import LOGGING
@@ -20,6 +21,9 @@ from auth_app.src.services.cache_service import (
     RedisCacheService,
     get_redis_cache_service,
 )
+from auth_app.src.services.password_hasher import password_hasher
+from auth_app.src.services.used_tokens import used_refresh_tokens
+from auth_app.src.services.user_cache import user_cache
 
 logging_config.dictConfig(LOGGING)
 logger = logging.getLogger("auth_service")
@@ -52,6 +56,7 @@ class AuthService:
             Находим usera по логину, если нет -> ошибка.
             Если user не активен -> ошибка.
             Проверяем пароль, если неверный -> ошибка.
+            Хеш с устаревшими параметрами -> пересчитываем.
             Создаем токены по id.
             старт сессии.
             возвращаем токены.
@@ -67,7 +72,9 @@ class AuthService:
             raise HTTPException(
                 status_code=HTTPStatus.CONFLICT, detail="User not active."
             )
-        if check_password_hash(user.password, password):
+        if await password_hasher.verify(user.password, password):
+            if password_hasher.needs_rehash(user.password):
+                await self.rehash_password(user.id, password)
             user = UserInDB.model_validate(user)  # type: ignore
             return await self.start(user, request)  # type: ignore
         else:
@@ -75,6 +82,18 @@ class AuthService:
                 status_code=HTTPStatus.CONFLICT, detail="Incorrect password."
             )
 
+    async def rehash_password(self, user_id: UUID, password: str) -> None:
+        """Пересчет хеша пароля с текущими параметрами при входе."""
+        started = time.perf_counter()
+        try:
+            pwhash = await password_hasher.hash(password)
+            await self.user_query.set_password_hash(user_id, pwhash)
+        except Exception as e:
+            # вход не зависит от пересчета, повторится при следующем
+            logger.error(f"Ошибка пересчета хеша пароля: {e}")
+            await self.user_query.session.rollback()
+        password_hasher.record_rehash(time.perf_counter() - started)
+
     async def start(self, user: UserInDB, request: Request):
         """создание токенов, старт сессии, и возврат токенов+user"""
         access, refresh = await self.create_auth_jwt_tokens(user=user)
@@ -85,16 +104,21 @@ class AuthService:
         """
         Выход из пользователя, /logout.
             Потрошим токен.
-            Кладем использованный токен в БД.
-            Если токен уже в БД как использованный -> ошибка.
+            Отмечаем refresh token использованным,
+            если использован ранее -> ошибка.
             Закрываем сессию.
+            Отзываем access token до истечения его срока жизни.
         """
         jwt_claims = await self.authorize.get_raw_jwt(access_token)
-        user_id = jwt_claims.get("sub")
+        if not await self.mark_refresh_token_used(refresh_token):
+            raise HTTPException(
+                status_code=HTTPStatus.UNAUTHORIZED,
+                detail="Invalid refresh token",
+            )
 
         try:
-            await self.token_query.store_refresh_token(user_id, refresh_token)
             await self.session_query.end_session(refresh_token, EndType.LOGOUT)
+            await self.revoke_access_token(jwt_claims)
         except Exception as e:
             raise HTTPException(
                 status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
@@ -105,11 +129,11 @@ class AuthService:
         """
         Выдача новой пары токенов в обмен на refresh_token:
             Потрошим token, если некорректен -> ошибка.
-            Проверяем использован ли токен ранее, если да -> ошибка.
+            Отмечаем токен использованным, если использован ранее
+            -> ошибка(одна команда Redis, без гонки двух обменов).
             Достаем по id хозяина токена из кеша, если нет -> из БД.
                 Если хозяина токена в БД нет-> ошибка.
                 Запрос частый, кладем usera в кеш.
-            Сохраняем токен как использованный.
             Создаем новую пару токенов.
             Продлеваем сеесию записывая новый рефреш токен.
             Возвращаем токены.
@@ -122,27 +146,19 @@ class AuthService:
                 detail="Invalid refresh token",
             )
         user_id = refresh_jwt["sub"]
-        query = await self.token_query.get_refresh_token_by_token(refresh_token)
-        if query is not None:  # если токен уже в БД, значит использованный.
+        if not await used_refresh_tokens.mark_used(
+            self.cache_service, refresh_jwt, refresh_token
+        ):
             raise HTTPException(
                 status_code=HTTPStatus.UNAUTHORIZED,
                 detail="Invalid refresh token",
             )
-        user = await self.cache_service._obj_from_cache(user_id, UserInDB)
-        if not user:
-            user_from_db = await self.user_query.get_by_id(user_id)
-            user = UserInDB.model_validate(user_from_db)
-            await self.cache_service._put_obj_to_cache(
-                obj_id=user_id,
-                obj=user,
-                ex=60 * 60 * 24,
-            )
+        user = await self._get_user(user_id)
         if user is None:  # если в токен зашит некорректный id
             raise HTTPException(
                 status_code=HTTPStatus.BAD_REQUEST,
                 detail="Invalid or expired refresh token",
             )
-        await self.token_query.store_refresh_token(user_id, refresh_token)
         access, refresh = await self.create_auth_jwt_tokens(
             user=user  # type: ignore
         )
@@ -168,16 +184,8 @@ class AuthService:
                 detail="Invalid access token",
             )
         user_id = access_jwt["sub"]
-        user = await self.cache_service._obj_from_cache(user_id, UserInDB)
-        if not user:
-            user_from_db = await self.user_query.get_by_id(user_id)
-            user = UserInDB.model_validate(user_from_db)
-            await self.cache_service._put_obj_to_cache(
-                obj_id=user_id,
-                obj=user,
-                ex=60 * 60 * 24,
-            )
-        if not bool(set(access_list) & set(user.roles)):  # type: ignore
+        user = await self._get_user(user_id)
+        if user is None or not bool(set(access_list) & set(user.roles)):
             raise HTTPException(
                 status_code=HTTPStatus.UNAUTHORIZED, detail="access denied."
             )
@@ -192,7 +200,16 @@ class AuthService:
         access = await self.authorize.create_access_token(
             subject=str(user.id),
             expires_time=access_expires_time,
-            user_claims={"roles": user.roles},
+            user_claims={
+                "roles": user.roles,
+                "user_data": {  # для локальной проверки токена сервисами
+                    "user_id": str(user.id),
+                    "login": user.login,
+                    "email": user.email,
+                    "first_name": user.first_name,
+                    "last_name": user.last_name,
+                },
+            },
         )
         refresh = await self.authorize.create_refresh_token(
             subject=str(user.id),
@@ -204,7 +221,7 @@ class AuthService:
     async def end_expired_session(self, refresh_token: str) -> None:
         """
         Закрытие просроченной сессии.
-            Помещение Токена в БД как использованного.
+            Отметка токена как использованного.
             Закрытие сессии как просроченной.
         """
         try:
@@ -214,8 +231,9 @@ class AuthService:
                 status_code=HTTPStatus.UNAUTHORIZED,
                 detail="Invalid refresh token",
             )
-        user_id = refresh_jwt["sub"]
-        await self.token_query.store_refresh_token(user_id, refresh_token)
+        await used_refresh_tokens.mark_used(
+            self.cache_service, refresh_jwt, refresh_token
+        )
         await self.session_query.end_session(
             refresh_token, EndType.INVALID_REFRESH
         )
@@ -224,6 +242,7 @@ class AuthService:
         """
         Проверка доступа.
             Потрошим token, если некорректен -> ошибка.
+            Если token отозван(logout) -> ошибка.
             Достаем по id хозяина токена из кеша, если нет -> из БД.
                 Если хозяина токена в БД нет-> ошибка.
                 Запрос частый, кладем usera в кеш.
@@ -237,16 +256,13 @@ class AuthService:
                 status_code=HTTPStatus.UNAUTHORIZED,
                 detail="Invalid access token",
             )
-        user_id = access_jwt["sub"]
-        user = await self.cache_service._obj_from_cache(user_id, UserInDB)
-        if not user:
-            user_from_db = await self.user_query.get_by_id(user_id)
-            user = UserInDB.model_validate(user_from_db)
-            await self.cache_service._put_obj_to_cache(
-                obj_id=user_id,
-                obj=user,
-                ex=60 * 60 * 24,
+        if await self.is_token_revoked(access_jwt.get("jti")):
+            raise HTTPException(
+                status_code=HTTPStatus.UNAUTHORIZED,
+                detail="Token has been revoked.",
             )
+        user_id = access_jwt["sub"]
+        user = await self._get_user(user_id)
         if user is None:  # если в токен зашит некорректный id
             raise HTTPException(
                 status_code=HTTPStatus.NOT_FOUND,
@@ -265,6 +281,67 @@ class AuthService:
             }
         )
 
+    async def _get_user(self, user_id: str) -> UserInDB | None:
+        """
+        Пользователь по id.
+            Из L1 кеша воркера, если нет -> из Redis, если нет -> из БД.
+            Запрос частый, кладем usera в кеш на сутки.
+        """
+        if user := await user_cache.get(user_id, self.cache_service):
+            return user
+        user_from_db = await self.user_query.get_by_id(user_id)
+        if user_from_db is None:
+            return None
+        user = UserInDB.model_validate(user_from_db)
+        await user_cache.put(user_id, user, self.cache_service)
+        return user
+
+    async def mark_refresh_token_used(self, refresh_token: str) -> bool:
+        """
+        Отметка refresh token использованным(logout).
+        False - токен уже был использован.
+        """
+        try:
+            refresh_jwt = await self.authorize.get_raw_jwt(refresh_token)
+        except Exception:
+            return True  # некорректный/истекший токен и так не примут
+        return await used_refresh_tokens.mark_used(
+            self.cache_service, refresh_jwt, refresh_token
+        )
+
+    async def revoke_access_token(self, jwt_claims: dict) -> None:
+        """
+        Помещение access token(jti) в список отозванных.
+        Запись хранится до истечения срока жизни токена(score = exp).
+        """
+        jti, exp = jwt_claims.get("jti"), jwt_claims.get("exp")
+        if not jti or not exp:
+            return
+        await self.cache_service.conn.zadd(
+            app_config.revoked_tokens_key, {jti: exp}
+        )
+
+    async def is_token_revoked(self, jti: str | None) -> bool:
+        """Проверка наличия access token(jti) в списке отозванных."""
+        if not jti:
+            return False
+        score = await self.cache_service.conn.zscore(
+            app_config.revoked_tokens_key, jti
+        )
+        return score is not None and score > time.time()
+
+    async def get_revoked_tokens(self) -> list[str]:
+        """
+        Список отозванных и еще не истекших access token(jti).
+        Истекшие записи удаляются из списка.
+        """
+        key = app_config.revoked_tokens_key
+        await self.cache_service.conn.zremrangebyscore(
+            key, "-inf", int(time.time())
+        )
+        tokens = await self.cache_service.conn.zrange(key, 0, -1)
+        return [token.decode("utf-8") for token in tokens]
+
 
 async def get_auth_service(
     session=Depends(get_session),
@@ -1,18 +1,26 @@
 import abc
+import asyncio
+import hashlib
 import json
+import math
+import time
 from functools import wraps
-from typing import Any, Callable, Coroutine, Type, TypeVar
+from typing import Any, Awaitable, Callable, Coroutine, Type, TypeVar
 
 import redis.exceptions as redis_e
 from pydantic import BaseModel
 from redis.asyncio import Redis
 
-from auth_app.src.core.config import redis_data
+from auth_app.src.core.config import app_config, cache_config
+from auth_app.src.db import redis as redis_db
 from auth_app.src.models.choices import RequestTypes
 
 from .my_backoff import backoff
+from .single_flight import single_flight
 
 redis: Redis | None = None
+# Значение ключа "не найдено", не совпадает ни с одним json.
+NEGATIVE = b"\x00none"
 RT = TypeVar("RT")
 FuncType = Callable[..., RT | Coroutine[Any, Any, RT]]
 
@@ -58,19 +66,24 @@ class CacheService(abc.ABC):
         """Сохранение списка объектов из кеша."""
 
     @abc.abstractmethod
-    async def make_cache_key(self, **kwargs) -> str:
+    async def make_cache_key(self, namespace: str, **kwargs) -> str:
         """Составляет ключ для кеширования."""
 
+    @abc.abstractmethod
+    async def invalidate_namespace(self, namespace: str) -> None:
+        """Сброс всех ключей пространства имен."""
+
 
 class RedisCacheService(CacheService):
     """
     Сервис кеширования(асинхронный).
     Основан на абстрактном сервисе CacheService.
     В кач-ве хранилища используется Redis.
+    Не хранит состояния: работает поверх общего пула соединений воркера.
     """
 
-    def __init__(self) -> None:
-        self.conn: Redis = None  # type: ignore
+    def __init__(self, conn: Redis | None = None) -> None:
+        self.conn: Redis | None = conn  # type: ignore
 
     async def init_connection(self) -> None:
         self.conn = await self.get_redis()
@@ -89,8 +102,8 @@ class RedisCacheService(CacheService):
         ),
     )
     async def get_redis(self) -> Redis:
-        """Соеденение с Redis"""
-        return Redis(unix_socket_path=redis_data.unix_socket_path, db=1)
+        """Клиент Redis поверх общего пула соединений."""
+        return await redis_db.get_redis()
 
     async def put_to_cache(
         self,
@@ -114,7 +127,7 @@ class RedisCacheService(CacheService):
     ) -> BaseModel | None:
         """Достает из Redis объект BaseModel."""
         data = await self.conn.get(obj_id)
-        if not data:
+        if not data or data == NEGATIVE:
             return None
 
         person = model.model_validate_json(data)
@@ -135,7 +148,7 @@ class RedisCacheService(CacheService):
     ) -> list[BaseModel] | None:
         """Достает из Redis список объектов BaseModel."""
         data = await self.conn.get(key)
-        if not data:
+        if not data or data == NEGATIVE:
             return None
         result = json.loads(data)
         return [model.model_validate_json(obj) for obj in result]
@@ -151,20 +164,194 @@ class RedisCacheService(CacheService):
         obj_list_as_json = json.dumps(_list)
         return await self.conn.set(name=key, value=obj_list_as_json, ex=ex)
 
-    async def make_cache_key(self, **kwargs) -> str:
-        """Составляет ключ для кеширования Redis."""
-
-        key_data = {key: value for key, value in kwargs.items()}
+    def make_obj_key(self, namespace: str, obj_id: Any) -> str:
+        """
+        Ключ объекта: <prefix>:<namespace>:v<version>:<obj_id>.
+        Сбрасывается точечно, по id.
+        """
+        return (
+            f"{app_config.cache_prefix}:{namespace}:"
+            f"v{app_config.cache_version}:{obj_id}"
+        )
+
+    async def make_cache_key(self, namespace: str, **kwargs) -> str:
+        """
+        Составляет ключ для кеширования Redis:
+            <prefix>:<namespace>:v<version>:g<generation>:<hash>
+        hash - хеш отсортированных kwargs(фиксированной длины),
+        generation - поколение пространства имен(см. invalidate_namespace).
+        """
+        sorted_key_data = dict(sorted(kwargs.items()))
+        key_data = json.dumps(sorted_key_data, ensure_ascii=False, default=str)
+        digest = hashlib.blake2b(key_data.encode(), digest_size=16).hexdigest()
+        generation = await self.conn.get(  # type: ignore
+            self._generation_key(namespace)
+        )
+        return (
+            f"{app_config.cache_prefix}:{namespace}:"
+            f"v{app_config.cache_version}:g{int(generation or 0)}:{digest}"
+        )
+
+    async def invalidate_namespace(self, namespace: str) -> None:
+        """
+        Сброс всех ключей пространства имен(например, всех страниц списка)
+        без SCAN: новое поколение, старые ключи истекут по TTL.
+        """
+        await self.conn.incr(self._generation_key(namespace))  # type: ignore
+
+    def _generation_key(self, namespace: str) -> str:
+        return f"{app_config.cache_prefix}:{namespace}:generation"
+
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        encode: Callable[[Any], str],
+        decode: Callable[[bytes], Any],
+        ex: int = 60 * 10 * 1,
+    ) -> Any:
+        """
+        Значение из кеша, при промахе -> loader() с защитой от stampede.
+            Одновременные промахи ключа в воркере ждут один loader.
+            cache_config.use_lock - ожидание между воркерами(Redis lock).
+            cache_config.stale_ttl - ключ живет ex + stale_ttl, последние
+                stale_ttl сек значение отдается устаревшим
+                и обновляется в фоне(stale-while-revalidate).
+            cache_config.early_refresh_beta - вероятностное обновление
+                до истечения ключа(XFetch), 0 - выключено.
+        Пустой результат loader кешируется как NEGATIVE
+        на cache_config.negative_ttl, при чтении -> None.
+        loader выполняется в общей задаче(фон, другие ожидающие) и может
+        пережить вызвавший запрос: сессию БД запроса использовать
+        нельзя, только свою(async_session()).
+        """
+        pipe = self.conn.pipeline(transaction=False)  # type: ignore
+        data, pttl = await pipe.get(key).pttl(key).execute()
+
+        async def load() -> Any:
+            return await self._load(key, loader, encode, decode, ex)
+
+        if data is None:
+            return await single_flight.do(key, load)
+        if data == NEGATIVE:
+            single_flight.stats["hit_negative"] += 1
+            return None
 
-        sorted_key_data = dict(sorted(key_data.items()))
+        ttl_left = math.inf  # pttl < 0 - ключ без срока жизни.
+        if pttl >= 0:
+            ttl_left = pttl / 1000 - cache_config.stale_ttl
+        if ttl_left <= 0:
+            single_flight.stats["stale"] += 1
+            single_flight.refresh(key, load)
+        elif single_flight.should_refresh_early(
+            key, ttl_left, cache_config.early_refresh_beta
+        ):
+            single_flight.stats["early_refresh"] += 1
+            return await single_flight.do(key, load)
+        else:
+            single_flight.stats["hit_positive"] += 1
+        return decode(data)
+
+    async def _load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        encode: Callable[[Any], str],
+        decode: Callable[[bytes], Any],
+        ex: int,
+    ) -> Any:
+        """
+        Загрузка значения и запись в кеш.
+        С use_lock загружает только воркер, получивший lock,
+        остальные ждут появления значения не дольше lock_timeout.
+        """
+        lock_key = f"{key}:lock"
+        locked = False
+        if cache_config.use_lock:
+            locked = await self.conn.set(  # type: ignore
+                lock_key, 1, nx=True, px=int(cache_config.lock_timeout * 1000)
+            )
+            if not locked:
+                single_flight.stats["lock_wait"] += 1
+                if (data := await self._wait_for_value(key)) is not None:
+                    return None if data == NEGATIVE else decode(data)
+        try:
+            result = await loader()
+            if result:
+                single_flight.stats["miss_positive"] += 1
+                await self.conn.set(  # type: ignore
+                    key, encode(result), ex=ex + cache_config.stale_ttl
+                )
+            else:
+                single_flight.stats["miss_negative"] += 1
+                await self.put_negative(key)
+            return result
+        finally:
+            if locked:
+                await self.conn.delete(lock_key)  # type: ignore
+
+    async def put_negative(self, key: str) -> None:
+        """Запоминает отсутствие значения на cache_config.negative_ttl."""
+        await self.conn.set(  # type: ignore
+            key, NEGATIVE, ex=cache_config.negative_ttl
+        )
+
+    async def is_negative(self, key: str) -> bool:
+        """Отсутствие значения уже известно(ключ NEGATIVE)."""
+        if await self.conn.get(key) == NEGATIVE:  # type: ignore
+            single_flight.stats["hit_negative"] += 1
+            return True
+        return False
+
+    async def _wait_for_value(self, key: str) -> bytes | None:
+        """Ожидание значения, загружаемого другим воркером."""
+        deadline = time.monotonic() + cache_config.lock_timeout
+        while time.monotonic() < deadline:
+            await asyncio.sleep(cache_config.lock_poll_interval)
+            if (data := await self.conn.get(key)) is not None:  # type: ignore
+                return data
+        return None
 
-        return json.dumps(sorted_key_data, ensure_ascii=False)
+    async def get_or_load_obj(
+        self,
+        key: str,
+        model: Type[BaseModel],
+        loader: Callable[[], Awaitable[BaseModel | None]],
+        ex: int = 60 * 10 * 1,
+    ) -> BaseModel | None:
+        """get_or_load для объекта BaseModel."""
+        return await self.get_or_load(
+            key,
+            loader,
+            encode=lambda obj: obj.model_dump_json(),
+            decode=model.model_validate_json,
+            ex=ex,
+        )
+
+    async def get_or_load_list(
+        self,
+        key: str,
+        model: Type[BaseModel],
+        loader: Callable[[], Awaitable[list[BaseModel]]],
+        ex: int = 60 * 10 * 1,
+    ) -> list[BaseModel]:
+        """get_or_load для списка BaseModel(формат _put_obj_list_to_cache)."""
+        result = await self.get_or_load(
+            key,
+            loader,
+            encode=lambda objs: json.dumps(
+                [obj.model_dump_json() for obj in objs]
+            ),
+            decode=lambda data: [
+                model.model_validate_json(obj) for obj in json.loads(data)
+            ],
+            ex=ex,
+        )
+        return result or []
 
 
 async def get_redis_cache_service() -> RedisCacheService:
-    cache_service = RedisCacheService()
-    await cache_service.init_connection()
-    return cache_service
+    return RedisCacheService(conn=await redis_db.get_redis())
 
 
 def redis_cache_decorator(
@@ -183,6 +370,8 @@ def redis_cache_decorator(
     В качестве элементов для создания ключа cache_service.make_cache_key
     использует cache_name + переданные в функцию именованные аргументы.
 
+    Промахи одного ключа объединяются(см. RedisCacheService.get_or_load).
+
     :cache_name: один из элементов имени cache
     :model: тип возвращакмой модели pydantic
     :ex: Время хранения cache
@@ -197,34 +386,19 @@ def redis_cache_decorator(
         ) -> list[BaseModel] | BaseModel | None:
             cache_service = await get_redis_cache_service()
             key = await cache_service.make_cache_key(
-                cache_name=cache_name, **kwargs
+                namespace=cache_name.value, **kwargs
             )
 
+            async def loader() -> Any:
+                return await func(*args, **kwargs)  # type: ignore
+
             if lst:
                 # Обработка списка
-                if data := await cache_service._get_obj_list_from_cache(
-                    key, model
-                ):
-                    return data
-
-                if result := await func(*args, **kwargs):
-                    await cache_service._put_obj_list_to_cache(
-                        key=key, obj_list=result, ex=ex
-                    )
-                    return result
-                return []
-
+                return await cache_service.get_or_load_list(
+                    key, model, loader, ex
+                )
             # Обработка одиночного объекта
-            if data := await cache_service._obj_from_cache(  # type: ignore
-                key, model
-            ):
-                return data
-
-            if result := await func(*args, **kwargs):
-                await cache_service._put_obj_to_cache(key, result, ex)
-
-                return result
-            return None
+            return await cache_service.get_or_load_obj(key, model, loader, ex)
 
         return async_wrapper
 
@@ -0,0 +1,87 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+import aiohttp
+
+from auth_app.src.core.config import http_client_config
+
+session: aiohttp.ClientSession | None = None
+
+
+async def init_http_session() -> aiohttp.ClientSession:
+    """
+    Создание общего пула HTTP соединений воркера.
+    Вызывается в lifespan, используется всеми исходящими запросами.
+    """
+    global session
+    connector = aiohttp.TCPConnector(
+        limit=http_client_config.limit,
+        limit_per_host=http_client_config.limit_per_host,
+        keepalive_timeout=http_client_config.keepalive_timeout,
+        ttl_dns_cache=http_client_config.dns_cache_ttl,
+    )
+    session = aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(
+            total=http_client_config.total_timeout,
+            connect=http_client_config.connect_timeout,
+        ),
+    )
+    return session
+
+
+async def close_http_session() -> None:
+    """Закрытие общего пула HTTP соединений(lifespan)."""
+    global session
+    if session and not session.closed:
+        await session.close()
+    session = None
+
+
+def get_http_session() -> aiohttp.ClientSession | None:
+    """Общая сессия воркера, None - если пул не создан."""
+    if session is None or session.closed:
+        return None
+    return session
+
+
+@asynccontextmanager
+async def http_session() -> AsyncIterator[aiohttp.ClientSession]:
+    """Общая сессия воркера, если пул не создан -> временная сессия."""
+    if shared := get_http_session():
+        yield shared
+        return
+    async with aiohttp.ClientSession() as temp_session:
+        yield temp_session
+
+
+def get_pool_stats() -> dict:
+    """Состояние пула HTTP соединений для настройки под нагрузкой."""
+    shared = get_http_session()
+    if shared is None:
+        return {"initialized": False}
+    connector: aiohttp.TCPConnector = shared.connector  # type: ignore
+    # счетчики соединений - не публичные атрибуты aiohttp,
+    # если в версии aiohttp их нет -> None вместо ошибки
+    acquired = getattr(connector, "_acquired", None)
+    idle = getattr(connector, "_conns", None)
+    per_host = getattr(connector, "_acquired_per_host", None)
+    return {
+        "initialized": True,
+        "limit": connector.limit,
+        "limit_per_host": connector.limit_per_host,
+        "acquired": None if acquired is None else len(acquired),
+        "idle": (
+            None
+            if idle is None
+            else sum(len(conns) for conns in idle.values())
+        ),
+        "acquired_per_host": (
+            None
+            if per_host is None
+            else {
+                f"{key.host}:{key.port}": len(conns)
+                for key, conns in per_host.items()
+            }
+        ),
+    }
@@ -0,0 +1,195 @@
+import asyncio
+import time
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+
+import aiosmtplib
+
+from auth_app.src.core.logger import logstash_handler
+from auth_app.src.core.smtp_config import smtp_data
+
+logger = logstash_handler()
+
+
+class Mailer:
+    """
+    Отправка писем через пул долгоживущих SMTP соединений.
+        Соединение(TLS, авторизация) открывается один раз и
+        переиспользуется, пока сервер его не закроет.
+        Одновременно не больше pool_size отправок.
+        Соединение, простаивавшее дольше idle_timeout, проверяется NOOP.
+        Разрыв/ошибка соединения -> переподключение и повтор,
+        не больше max_retries раз с паузой retry_backoff * попытка.
+    Пул привязан к event loop: в другом loop создается заново.
+    Параметры сервера - из smtp_data, могут быть переданы явно
+    (например, локальный aiosmtpd).
+    """
+
+    def __init__(
+        self,
+        hostname: str = smtp_data.email_host,
+        port: int = smtp_data.email_port,
+        use_tls: bool = smtp_data.email_use_tls,
+        start_tls: bool = smtp_data.email_use_ssl,
+        username: str | None = smtp_data.email_host_user,
+        password: str | None = smtp_data.email_host_password,
+        from_email: str = smtp_data.default_from_email,
+        pool_size: int = smtp_data.pool_size,
+        idle_timeout: float = smtp_data.idle_timeout,
+        max_retries: int = smtp_data.max_retries,
+        retry_backoff: float = smtp_data.retry_backoff,
+        timeout: float = smtp_data.timeout,
+    ) -> None:
+        self.hostname = hostname
+        self.port = port
+        self.use_tls = use_tls
+        self.start_tls = start_tls
+        self.username = username
+        self.password = password
+        self.from_email = from_email
+        self.pool_size = pool_size
+        self.idle_timeout = idle_timeout
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.timeout = timeout
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._idle: list[tuple[aiosmtplib.SMTP, float]] = []
+        self._semaphore: asyncio.Semaphore | None = None
+
+    async def send(self, subject: str, recipient: str, body: str) -> None:
+        """Отправка одного html письма, ошибка - после всех повторов."""
+        message = self._build(subject, recipient, body)
+        self._bind_loop()
+        async with self._semaphore:  # type: ignore
+            await self._send_with_retry(message)
+
+    async def send_many(self, messages: list[dict]) -> list[Exception | None]:
+        """
+        Отправка группы писем(subject, recipient, body) через пул.
+        Возвращает ошибку или None для каждого письма по порядку.
+        """
+        results = await asyncio.gather(
+            *(self.send(**message) for message in messages),
+            return_exceptions=True,
+        )
+        failed = [result for result in results if result is not None]
+        if failed:
+            logger.error(
+                f"Не отправлено писем: {len(failed)} из {len(messages)}"
+            )
+        return list(results)  # type: ignore
+
+    async def close(self) -> None:
+        """Закрытие всех простаивающих соединений(lifespan/воркер)."""
+        idle, self._idle = self._idle, []
+        for client, _ in idle:
+            await self._quit(client)
+
+    def stats(self) -> dict:
+        """Состояние пула для /stats."""
+        semaphore = self._semaphore
+        return {
+            "pool_size": self.pool_size,
+            "idle": len(self._idle),
+            "free_slots": semaphore._value if semaphore else self.pool_size,
+        }
+
+    async def _send_with_retry(self, message: MIMEMultipart) -> None:
+        attempt = 0
+        while True:
+            try:
+                return await self._attempt(message)
+            except OSError as e:
+                attempt += 1
+                if attempt > self.max_retries:
+                    raise
+                logger.warning(f"Ошибка SMTP соединения: {e}, повтор")
+                await asyncio.sleep(self.retry_backoff * attempt)
+
+    async def _attempt(self, message: MIMEMultipart) -> None:
+        """
+        Одна попытка отправки через соединение пула.
+        Ошибка подключения/авторизации - из _acquire(соединение
+        закрыто в _connect).
+        """
+        client = await self._acquire()
+        try:
+            await client.send_message(message)
+        except OSError:
+            # ошибки соединения aiosmtplib(разрыв, таймаут) -
+            # наследники OSError, соединение не в пул
+            self._discard(client)
+            raise
+        except aiosmtplib.SMTPException:
+            # отказ сервера принять письмо, соединение рабочее
+            self._release(client)
+            raise
+        self._release(client)
+
+    async def _acquire(self) -> aiosmtplib.SMTP:
+        """Простаивающее соединение из пула или новое."""
+        while self._idle:
+            client, released_at = self._idle.pop()
+            if not client.is_connected:
+                continue
+            if time.monotonic() - released_at < self.idle_timeout:
+                return client
+            try:
+                await client.noop()
+                return client
+            except (aiosmtplib.SMTPException, OSError):
+                client.close()
+        return await self._connect()
+
+    async def _connect(self) -> aiosmtplib.SMTP:
+        client = aiosmtplib.SMTP(
+            hostname=self.hostname,
+            port=self.port,
+            use_tls=self.use_tls,
+            start_tls=self.start_tls,
+            timeout=self.timeout,
+        )
+        await client.connect()
+        if self.username and self.password:
+            try:
+                await client.login(self.username, self.password)
+            except BaseException:
+                client.close()
+                raise
+        return client
+
+    def _discard(self, client: aiosmtplib.SMTP) -> None:
+        """Закрытие неисправного соединения без возврата в пул."""
+        client.close()
+
+    def _release(self, client: aiosmtplib.SMTP) -> None:
+        if client.is_connected:
+            self._idle.append((client, time.monotonic()))
+
+    async def _quit(self, client: aiosmtplib.SMTP) -> None:
+        try:
+            await client.quit()
+        except aiosmtplib.SMTPException:
+            client.close()
+
+    def _bind_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if loop is self._loop:
+            return
+        # соединения другого(закрытого) loop использовать нельзя
+        for client, _ in self._idle:
+            client.close()
+        self._idle = []
+        self._loop = loop
+        self._semaphore = asyncio.Semaphore(self.pool_size)
+
+    def _build(self, subject: str, recipient: str, body: str) -> MIMEMultipart:
+        message = MIMEMultipart()
+        message["From"] = self.from_email
+        message["To"] = recipient
+        message["Subject"] = subject
+        message.attach(MIMEText(body, "html"))
+        return message
+
+
+mailer = Mailer()
@@ -22,6 +22,7 @@ from auth_app.src.services.cache_service import (
     RedisCacheService,
     get_redis_cache_service,
 )
+from auth_app.src.services.user_cache import user_cache
 
 
 class OAuthService:
@@ -151,6 +152,9 @@ class OAuthService:
             await self.account_query_service.create_account(
                 account_data  # type: ignore
             )
+            await user_cache.invalidate(
+                str(user_id), self.cache_service, "social_account"
+            )
 
     async def unlink(self, request_data: UnlinkProviderRequest) -> None:
         """Убирает связь usera с проваайдером."""
@@ -161,6 +165,9 @@ class OAuthService:
         await self.account_query_service.def_delete_account_by_provider(
             request_data.user_id, request_data.provider
         )
+        await user_cache.invalidate(
+            str(request_data.user_id), self.cache_service, "social_account"
+        )
 
 
 async def get_oauth_service(
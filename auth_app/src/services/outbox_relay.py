@@ -0,0 +1,93 @@
+import asyncio
+import time
+
+import dramatiq
+
+from auth_app.src.core.config import app_config
+from auth_app.src.core.logger import logstash_handler
+from auth_app.src.db.models.outbox import OutboxEvent
+from auth_app.src.db.queries.outbox import OutboxQueryService
+from auth_app.src.db.sessions import async_session
+from auth_app.src.models.choices import OutboxEventType
+from auth_app.src.tasks import create_profile_task, send_email_task
+
+logger = logstash_handler()
+
+
+class OutboxRelay:
+    """
+    Ретранслятор outbox -> RabbitMQ.
+        Берет до batch_size неопубликованных событий(SKIP LOCKED),
+        отправляет их в очереди dramatiq и отмечает sent_at
+        в той же транзакции.
+        Полный пакет - следующий сразу, иначе пауза poll_interval.
+    Доставка "хотя бы один раз": при сбое между публикацией и commit
+    события будут опубликованы повторно.
+    Опубликованные события старше retention сек удаляются.
+    """
+
+    actors: dict[str, dramatiq.Actor] = {
+        OutboxEventType.SEND_EMAIL.value: send_email_task,
+        OutboxEventType.CREATE_PROFILE.value: create_profile_task,
+    }
+
+    def __init__(
+        self,
+        batch_size: int = app_config.outbox_batch_size,
+        poll_interval: float = app_config.outbox_poll_interval,
+        retention: int = app_config.outbox_retention,
+    ) -> None:
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.retention = retention
+        self._purged_at = 0.0
+
+    async def run(self) -> None:
+        """Основной цикл ретранслятора."""
+        logger.info("Ретранслятор outbox запущен")
+        while True:
+            try:
+                published = await self.relay_batch()
+                await self.purge()
+            except Exception as e:
+                logger.error(f"Ошибка ретрансляции outbox: {e}")
+                published = 0
+            if published < self.batch_size:
+                await asyncio.sleep(self.poll_interval)
+
+    async def relay_batch(self) -> int:
+        """Публикация одного пакета событий, возвращает их количество."""
+        async with async_session() as session:
+            query = OutboxQueryService(session)
+            events = await query.lock_pending(self.batch_size)
+            if not events:
+                return 0
+            # отправка в RabbitMQ блокирующая(pika) - вне event loop
+            await asyncio.to_thread(self._publish, events)
+            await query.mark_sent([event.id for event in events])
+            await session.commit()
+        logger.info(f"Опубликовано событий outbox: {len(events)}")
+        return len(events)
+
+    async def purge(self) -> None:
+        """Удаление старых опубликованных событий(не чаще раза в час)."""
+        if time.monotonic() - self._purged_at < 3600:
+            return
+        async with async_session() as session:
+            deleted = await OutboxQueryService(session).purge_sent(
+                self.retention
+            )
+        self._purged_at = time.monotonic()
+        if deleted:
+            logger.info(f"Удалено опубликованных событий outbox: {deleted}")
+
+    def _publish(self, events: list[OutboxEvent]) -> None:
+        for event in events:
+            actor = self.actors.get(event.event_type)
+            if actor is None:
+                logger.error(f"Неизвестный тип события outbox: {event}")
+                continue
+            actor.send(event.payload)
+
+
+outbox_relay = OutboxRelay()
@@ -0,0 +1,112 @@
+import asyncio
+import time
+from collections import Counter
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from functools import partial
+from typing import Any, Callable
+
+from werkzeug.security import check_password_hash, generate_password_hash
+
+from auth_app.src.core.config import password_hash_config
+
+
+class PasswordHasher:
+    """
+    Хеширование и проверка паролей(werkzeug) вне event loop.
+        Вычисления выполняются в ограниченном пуле(max_workers):
+        thread - hashlib отпускает GIL на время scrypt/pbkdf2,
+        process - отдельные процессы.
+        method - метод werkzeug с явными параметрами стоимости,
+        needs_rehash() - хеш создан с другими параметрами.
+    Считает количество и время операций(stats) для /stats.
+    """
+
+    def __init__(
+        self,
+        method: str = password_hash_config.method,
+        executor: str = password_hash_config.executor,
+        max_workers: int = password_hash_config.max_workers,
+    ) -> None:
+        self.method = method
+        self.executor_type = executor
+        self.max_workers = max_workers
+        self._executor: Executor | None = None
+        self._stats: Counter[str] = Counter()
+
+    async def hash(self, password: str) -> str:
+        """Хеш пароля с текущими параметрами."""
+        return await self._run(
+            "hash", partial(generate_password_hash, password, self.method)
+        )
+
+    async def verify(self, pwhash: str, password: str) -> bool:
+        """Проверка пароля по хешу."""
+        return await self._run(
+            "verify", partial(check_password_hash, pwhash, password)
+        )
+
+    def needs_rehash(self, pwhash: str) -> bool:
+        """Хеш создан другим методом или с другими параметрами."""
+        return pwhash.split("$", 1)[0] != self.method
+
+    def close(self) -> None:
+        """Остановка пула(lifespan)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> dict:
+        """Количество операций, среднее и максимальное время(мс)."""
+        result: dict[str, Any] = {
+            "method": self.method,
+            "executor": self.executor_type,
+            "max_workers": self.max_workers,
+        }
+        for operation in ("hash", "verify", "rehash"):
+            count = self._stats[f"{operation}:count"]
+            result[operation] = {
+                "count": count,
+                "avg_ms": round(
+                    self._stats[f"{operation}:ms"] / count if count else 0, 2
+                ),
+                "max_ms": round(self._stats[f"{operation}:max_ms"], 2),
+            }
+        return result
+
+    def record_rehash(self, duration: float) -> None:
+        """Учет пересчета хеша при входе."""
+        self._record("rehash", duration)
+
+    async def _run(self, operation: str, func: Callable[[], Any]) -> Any:
+        started = time.perf_counter()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._get_executor(), func
+            )
+        finally:
+            self._record(operation, time.perf_counter() - started)
+
+    def _record(self, operation: str, duration: float) -> None:
+        duration_ms = duration * 1000
+        self._stats[f"{operation}:count"] += 1
+        self._stats[f"{operation}:ms"] += duration_ms  # type: ignore
+        self._stats[f"{operation}:max_ms"] = max(  # type: ignore
+            self._stats[f"{operation}:max_ms"], duration_ms
+        )
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.executor_type == "process":
+                self._executor = ProcessPoolExecutor(self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    self.max_workers, thread_name_prefix="password-hasher"
+                )
+        return self._executor
+
+
+password_hasher = PasswordHasher()
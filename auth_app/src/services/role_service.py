@@ -12,6 +12,7 @@ from auth_app.src.services.cache_service import (
     RedisCacheService,
     get_redis_cache_service,
 )
+from auth_app.src.services.user_cache import user_cache
 from auth_app.src.services.view_service import ViewService
 
 logging_config.dictConfig(LOGGING)
@@ -19,6 +20,15 @@ logger = logging.getLogger("user_service")
 
 
 class RoleService(ViewService):
+    cache_namespace = "roles"
+
+    def __init__(
+        self,
+        query_service: RoleQueryService,
+        cache_service: RedisCacheService,
+    ):
+        super().__init__(query_service, cache_service)
+        self.query_service: RoleQueryService = query_service
 
     async def create_role(self, role_data: RoleCreate):
         """Создание Роли."""
@@ -28,12 +38,15 @@ class RoleService(ViewService):
                 detail="Role with this name exists.",
             )
         role = await self.query_service.create_role(role_data)
+        await self.cache_service.invalidate_namespace("roles:list")
         role_in_db = RoleInDB.model_validate(role)
         return {"role": role_in_db, "detail": "Role created."}
 
     async def delete_role(self, role_id: int):
-        """Удаление Роли."""
+        """Удаление Роли, со сбросом кеша её пользователей."""
+        user_ids = await self.query_service.get_role_user_ids(role_id)
         if await self.query_service.delete_role_by_id(role_id):
+            await self._invalidate_role(role_id, user_ids, "role_delete")
             return {"detail": "Role deleted."}
         raise HTTPException(
             status_code=HTTPStatus.CONFLICT,
@@ -41,10 +54,12 @@ class RoleService(ViewService):
         )
 
     async def update_role(self, role_id: int, role_data: RoleCreate):
-        """Изменение имени Роли."""
+        """Изменение имени Роли, со сбросом кеша её пользователей."""
         if role := await self.query_service.update_role_name(
             role_id, role_data.name
         ):
+            user_ids = await self.query_service.get_role_user_ids(role_id)
+            await self._invalidate_role(role_id, user_ids, "role_update")
             role_in_db = RoleInDB.model_validate(role)
             return {"updated_role": role_in_db, "detail": "Role updated."}
         raise HTTPException(
@@ -52,6 +67,16 @@ class RoleService(ViewService):
             detail="Role with this id dont exists.",
         )
 
+    async def _invalidate_role(
+        self, role_id: int, user_ids: list[str], reason: str
+    ) -> None:
+        """Сброс кеша роли и пользователей, у которых она есть."""
+        await self.cache_service.delete_from_cache(
+            self.cache_service.make_obj_key(self.cache_namespace, role_id)
+        )
+        await self.cache_service.invalidate_namespace("roles:list")
+        await user_cache.invalidate_many(user_ids, self.cache_service, reason)
+
 
 async def get_role_service(
     session=Depends(get_session),
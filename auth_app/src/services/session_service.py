@@ -25,7 +25,7 @@ class SessionService(ViewService):
     Логика старта, продления, закрытия внедрена в auth_service.py
     """
 
-    pass
+    cache_namespace = "sessions"
 
 
 async def get_sessions_service(
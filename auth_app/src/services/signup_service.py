@@ -6,20 +6,33 @@ from fastapi import Depends, HTTPException
 
 from auth_app.src.core.config import app_config
 from auth_app.src.core.logger import LOGGING
+from auth_app.src.db.queries.outbox import OutboxQueryService
 from auth_app.src.db.queries.user import UserQueryService
 from auth_app.src.db.sessions import get_session
+from auth_app.src.models.choices import OutboxEventType
 from auth_app.src.schemas.entity import CreatedUser, UserCreate, UserInDB
-from auth_app.src.tasks import create_profile_task
+from auth_app.src.services.cache_service import (
+    RedisCacheService,
+    get_redis_cache_service,
+)
+from auth_app.src.services.user_cache import user_cache
 from auth_app.src.templates.emails.confirmation import confirmation_email
-from auth_app.src.utils.utils import decode_id, encode_id, send_email
+from auth_app.src.utils.utils import decode_id, encode_id
 
 logging_config.dictConfig(LOGGING)
 logger = logging.getLogger("auth_service")
 
 
 class SignUpService:
-    def __init__(self, query_service: UserQueryService):
+    def __init__(
+        self,
+        query_service: UserQueryService,
+        cache_service: RedisCacheService,
+        outbox_service: OutboxQueryService,
+    ):
         self.query = query_service
+        self.cache_service = cache_service
+        self.outbox = outbox_service
 
     async def create_user(self, user_data: UserCreate) -> dict:
         """
@@ -29,8 +42,8 @@ class SignUpService:
             Создаем пользователя.
             Кодируем id.
             Создаем Письмо.
-            Отправляем подтвердающее письмо.
-            Post запрос создания профиля.
+            В той же транзакции - события outbox: подтверждающее письмо
+            и создание профиля(публикует services/outbox_relay.py).
             Возвращаем usera и статус.
         """
         email = user_data.email
@@ -40,7 +53,7 @@ class SignUpService:
                 status_code=HTTPStatus.CONFLICT,
                 detail="User with this login or email exists",
             )
-        user = await self.query.create_user(user_data)
+        user = await self.query.create_user(user_data, commit=False)
         user_in_db = CreatedUser.model_validate(user)
         encoded_id = await encode_id(id=str(user_in_db.id))
 
@@ -49,16 +62,19 @@ class SignUpService:
             frontend_url=app_config.frontend_auth_url,
             user_id=encoded_id,
         )
-        await send_email(
-            subject="Thank you for registering.",
-            recipient=user_in_db.email,
-            body=email_body,
+        self.outbox.add(
+            OutboxEventType.SEND_EMAIL.value,
+            {
+                "subject": "Thank you for registering.",
+                "recipient": user_in_db.email,
+                "body": email_body,
+            },
         )
-        # запрос на создание профиля пользователя
-        # очередь не преобразовывает в JSON UUID
+        # создание профиля пользователя, JSONB не преобразовывает UUID
         profile_data = user_in_db.model_dump()
         profile_data["id"] = str(profile_data["id"])
-        create_profile_task.send(profile_data)
+        self.outbox.add(OutboxEventType.CREATE_PROFILE.value, profile_data)
+        await self.query.session.commit()
 
         return {
             "user": user_in_db,
@@ -70,6 +86,7 @@ class SignUpService:
         Активация зарегистрированного пользователя.
             Декодируем id.
             Находим usera, если нет -> ошибка.
+            Сбрасываем кеш usera.
             Возвращаем активного пользователя.
         """
         id = await decode_id(encoded_user_id, app_config.confirmation_expire)
@@ -78,13 +95,16 @@ class SignUpService:
             raise HTTPException(
                 status_code=HTTPStatus.NOT_FOUND, detail="User not found."
             )
+        await user_cache.invalidate(str(id), self.cache_service, "activate")
         user = UserInDB.model_validate(user)  # type: ignore
         return {"user": user, "detail": "Confirmation has been success."}
 
 
 async def get_signup_service(
     session=Depends(get_session),
+    cache_service: RedisCacheService = Depends(get_redis_cache_service),
 ) -> SignUpService:
     async with session:
         query_service = UserQueryService(session)
-        return SignUpService(query_service)
+        outbox_service = OutboxQueryService(session)
+        return SignUpService(query_service, cache_service, outbox_service)
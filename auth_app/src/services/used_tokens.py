@@ -0,0 +1,156 @@
+import asyncio
+import hashlib
+import time
+from datetime import datetime, timezone
+
+import jwt
+
+from auth_app.src.core.config import app_config
+from auth_app.src.core.logger import logstash_handler
+from auth_app.src.db.queries.token import TokenQueryService
+from auth_app.src.db.sessions import async_session
+from auth_app.src.services.cache_service import RedisCacheService
+
+logger = logstash_handler()
+
+
+class UsedRefreshTokens:
+    """
+    Использованные refresh token.
+        Redis: ключ <used_refresh_tokens_key>:<jti> без версии кеша,
+        TTL - оставшийся срок жизни токена, истекшие записи удаляются
+        сами. SET NX - отметка и проверка повторного использования
+        одной атомарной командой.
+        БД: необязательный журнал(аудит), записи копятся в очереди
+        и пишутся фоновой задачей пакетами до batch_size.
+    Переполнение очереди не мешает входу: запись журнала теряется.
+    """
+
+    def __init__(
+        self,
+        key_prefix: str = app_config.used_refresh_tokens_key,
+        audit_enabled: bool = app_config.refresh_audit_enabled,
+        batch_size: int = app_config.refresh_audit_batch_size,
+        queue_size: int = app_config.refresh_audit_queue_size,
+    ) -> None:
+        self.key_prefix = key_prefix
+        self.audit_enabled = audit_enabled
+        self.batch_size = batch_size
+        self.queue_size = queue_size
+        self._queue: asyncio.Queue[dict] | None = None
+
+    @staticmethod
+    def token_id(claims: dict, token: str) -> str:
+        """Компактный id токена: jti, без него - sha256 токена."""
+        return claims.get("jti") or hashlib.sha256(token.encode()).hexdigest()
+
+    def key(self, token_id: str) -> str:
+        """Ключ Redis токена, не зависит от версии схемы кеша."""
+        return f"{self.key_prefix}:{token_id}"
+
+    async def mark_used(
+        self, cache_service: RedisCacheService, claims: dict, token: str
+    ) -> bool:
+        """
+        Отметка токена использованным.
+        False - токен уже был использован.
+        """
+        token_id = self.token_id(claims, token)
+        ttl = max(int(claims["exp"] - time.time()), 1)
+        created = await cache_service.conn.set(
+            self.key(token_id),
+            claims["sub"],
+            nx=True,
+            ex=ttl,
+        )
+        if created:
+            self._audit(claims["sub"], token_id)
+        return bool(created)
+
+    async def run_audit(self) -> None:
+        """Фоновая запись журнала(lifespan)."""
+        queue = self._get_queue()
+        while True:
+            rows = [await queue.get()]
+            while len(rows) < self.batch_size and not queue.empty():
+                rows.append(queue.get_nowait())
+            await self._write(rows)
+
+    async def close(self) -> None:
+        """Запись оставшегося в очереди журнала при остановке."""
+        if self._queue is None or self._queue.empty():
+            return
+        rows = []
+        while not self._queue.empty():
+            rows.append(self._queue.get_nowait())
+        await self._write(rows)
+
+    async def migrate_legacy(
+        self, cache_service: RedisCacheService, batch_size: int = 1000
+    ) -> int:
+        """
+        Перенос записей прежнего формата(полный токен в БД).
+        Еще не истекшие токены отмечаются в Redis, записи удаляются.
+        Возвращает количество удаленных записей.
+        """
+        deleted = 0
+        async with async_session() as session:
+            query = TokenQueryService(session)
+            while tokens := await query.get_legacy_tokens(batch_size):
+                async with cache_service.conn.pipeline() as pipe:
+                    for token in tokens:
+                        claims = self._unverified_claims(token.token)
+                        ttl = int(claims.get("exp", 0) - time.time())
+                        if ttl <= 0:
+                            continue
+                        pipe.set(
+                            self.key(self.token_id(claims, token.token)),
+                            str(token.user_id),
+                            nx=True,
+                            ex=ttl,
+                        )
+                    await pipe.execute()
+                await query.delete_tokens([token.id for token in tokens])
+                deleted += len(tokens)
+                logger.info(f"Перенесено refresh token: {deleted}")
+        return deleted
+
+    def _audit(self, user_id: str, token_id: str) -> None:
+        if not self.audit_enabled:
+            return
+        try:
+            self._get_queue().put_nowait(
+                {
+                    "user_id": user_id,
+                    "token": token_id,
+                    "created_at": datetime.now(timezone.utc),
+                }
+            )
+        except asyncio.QueueFull:
+            logger.warning("Очередь журнала refresh token переполнена")
+
+    async def _write(self, rows: list[dict]) -> None:
+        try:
+            async with async_session() as session:
+                await TokenQueryService(session).add_used_tokens(rows)
+        except Exception as e:
+            logger.error(f"Ошибка записи журнала refresh token: {e}")
+
+    def _get_queue(self) -> asyncio.Queue[dict]:
+        if self._queue is None:
+            self._queue = asyncio.Queue(self.queue_size)
+        return self._queue
+
+    @staticmethod
+    def _unverified_claims(token: str) -> dict:
+        """Содержимое токена без проверки подписи и срока."""
+        try:
+            return jwt.decode(
+                token,
+                options={"verify_signature": False, "verify_exp": False},
+            )
+        except jwt.InvalidTokenError:
+            return {}
+
+
+used_refresh_tokens = UsedRefreshTokens()
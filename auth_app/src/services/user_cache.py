@@ -0,0 +1,181 @@
+import asyncio
+import logging
+import time
+from collections import Counter, OrderedDict
+from logging import config as logging_config
+
+import redis.exceptions as redis_e
+from redis.asyncio import Redis
+
+from auth_app.src.core.config import app_config
+from auth_app.src.core.logger import LOGGING
+from auth_app.src.schemas.entity import UserInDB
+from auth_app.src.services.cache_service import RedisCacheService
+
+logging_config.dictConfig(LOGGING)
+logger = logging.getLogger("user_cache")
+
+
+class UserCache:
+    """
+    Двухуровневый кеш UserInDB.
+        L1 - LRU в памяти воркера(ограничен по размеру, короткий TTL),
+            хранит готовые объекты, без запроса в Redis и парсинга json.
+        L2 - Redis.
+    Ключи Redis - make_obj_key("users", id), общие с UsersService.
+    При изменении пользователя L1 сбрасывается во всех воркерах
+    через Redis pub/sub(канал app_config.user_cache_channel),
+    а страницы списка users - новым поколением "users:list".
+    Сбросы считаются по причинам в invalidations.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = app_config.user_cache_size,
+        ttl: int = app_config.user_cache_ttl,
+        channel: str = app_config.user_cache_channel,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.channel = channel
+        self._data: OrderedDict[str, tuple[float, UserInDB]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations: Counter[str] = Counter()
+
+    def get_local(self, user_id: str) -> UserInDB | None:
+        """Получение пользователя из L1."""
+        item = self._data.get(user_id)
+        if item is None or item[0] < time.monotonic():
+            self._data.pop(user_id, None)
+            self.misses += 1
+            return None
+        self._data.move_to_end(user_id)
+        self.hits += 1
+        return item[1]
+
+    def put_local(self, user_id: str, user: UserInDB) -> None:
+        """Сохранение пользователя в L1, вытесняет самые старые записи."""
+        self._data[user_id] = (time.monotonic() + self.ttl, user)
+        self._data.move_to_end(user_id)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def evict_local(self, user_id: str) -> None:
+        self._data.pop(user_id, None)
+
+    async def get(
+        self, user_id: str, cache_service: RedisCacheService
+    ) -> UserInDB | None:
+        """Пользователь из L1, если нет -> из Redis(с записью в L1)."""
+        if user := self.get_local(user_id):
+            return user
+        user = await cache_service._obj_from_cache(
+            cache_service.make_obj_key("users", user_id), UserInDB
+        )
+        if user:
+            self.put_local(user_id, user)  # type: ignore
+        return user  # type: ignore
+
+    async def put(
+        self,
+        user_id: str,
+        user: UserInDB,
+        cache_service: RedisCacheService,
+        ex: int = app_config.user_cache_expire,
+    ) -> None:
+        """Сохранение пользователя в Redis и L1."""
+        await cache_service._put_obj_to_cache(
+            cache_service.make_obj_key("users", user_id), user, ex
+        )
+        self.put_local(user_id, user)
+
+    async def invalidate(
+        self,
+        user_id: str,
+        cache_service: RedisCacheService,
+        reason: str = "user",
+    ) -> None:
+        """Удаление пользователя из Redis и сброс L1 во всех воркерах."""
+        await self.invalidate_many([user_id], cache_service, reason)
+
+    async def invalidate_many(
+        self,
+        user_ids: list[str],
+        cache_service: RedisCacheService,
+        reason: str = "user",
+    ) -> None:
+        """Сброс кеша группы пользователей одним запросом в Redis."""
+        if not user_ids:
+            return
+        for user_id in user_ids:
+            self.evict_local(user_id)
+        async with cache_service.conn.pipeline(  # type: ignore
+            transaction=False
+        ) as pipe:
+            pipe.delete(
+                *[cache_service.make_obj_key("users", id) for id in user_ids]
+            )
+            for user_id in user_ids:
+                pipe.publish(self.channel, user_id)
+            await pipe.execute()
+        await cache_service.invalidate_namespace("users:list")
+        self.invalidations[reason] += len(user_ids)
+
+    async def listen(self, redis: Redis) -> None:
+        """
+        Подписка на сброс L1(фоновая задача lifespan).
+        При любой ошибке подписки L1 очищается целиком(пропущенные
+        сообщения восстановить нельзя) и подписка возобновляется
+        с паузой, растущей до 30 сек.
+        """
+        delay = 1.0
+        while True:
+            subscribed = await self._subscribe_and_listen(redis)
+            delay = 1.0 if subscribed else min(delay * 2, 30.0)
+            self._data.clear()
+            await asyncio.sleep(delay)
+
+    async def _subscribe_and_listen(self, redis: Redis) -> bool:
+        """
+        Одна подписка до ошибки/завершения.
+        Возвращает True, если подписка была установлена.
+        """
+        pubsub = redis.pubsub()
+        subscribed = False
+        try:
+            await pubsub.subscribe(self.channel)
+            subscribed = True
+            async for message in pubsub.listen():
+                self._handle_message(message)
+            logger.error("Подписка на сброс кеша завершилась")
+        except redis_e.RedisError as e:
+            logger.error(f"Потеряна подписка на сброс кеша: {e}")
+        except Exception as e:
+            logger.exception(f"Ошибка подписки на сброс кеша: {e}")
+        finally:
+            await self._close_pubsub(pubsub)
+        return subscribed
+
+    def _handle_message(self, message: dict) -> None:
+        if message["type"] == "message":
+            self.evict_local(message["data"].decode("utf-8"))
+
+    async def _close_pubsub(self, pubsub) -> None:
+        try:
+            await pubsub.aclose()
+        except Exception as e:
+            logger.warning(f"Ошибка закрытия подписки: {e}")
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": dict(self.invalidations),
+        }
+
+
+user_cache = UserCache()
@@ -11,6 +11,7 @@ from auth_app.src.services.cache_service import (
     RedisCacheService,
     get_redis_cache_service,
 )
+from auth_app.src.services.user_cache import user_cache
 from auth_app.src.services.view_service import ViewService
 
 logging_config.dictConfig(LOGGING)
@@ -23,20 +24,30 @@ class UserRolesService(ViewService):
     Наследует от ViewService. возврат объекта и списка.
     """
 
+    cache_namespace = "user_roles"
+
     async def create_user_roles(self, data: UserRolesCreate):
         """Создаем роль."""
         result = await self.query_service.create_user_roles(  # type: ignore
             data
         )
-        await self.cache_service.delete_from_cache(str(data.user_id))
+        await self._invalidate(data)
         result = UserRolesInDB.model_validate(result)
         return {"user_roles": result}
 
     async def delete_user_roles(self, data: UserRolesCreate):
         """Вычеркнуть из списка избранных."""
         await self.query_service.delete_user_roles(data)  # type: ignore
-        await self.cache_service.delete_from_cache(  # type: ignore
-            str(data.user_id)
+        await self._invalidate(data)
+
+    async def _invalidate(self, data: UserRolesCreate) -> None:
+        """Сброс кеша пользователя и роли(роль хранит список users)."""
+        await self.cache_service.delete_from_cache(
+            self.cache_service.make_obj_key("roles", data.role_id)
+        )
+        await self.cache_service.invalidate_namespace("roles:list")
+        await user_cache.invalidate(
+            str(data.user_id), self.cache_service, "user_roles"
         )
 
 
@@ -14,6 +14,7 @@ from auth_app.src.services.cache_service import (
     RedisCacheService,
     get_redis_cache_service,
 )
+from auth_app.src.services.user_cache import user_cache
 from auth_app.src.services.view_service import ViewService
 from auth_app.src.templates.emails.reset_password import reset_password_email
 from auth_app.src.utils.utils import decode_id, encode_id, send_email
@@ -25,6 +26,8 @@ logger = logging.getLogger("user_service")
 class UsersService(ViewService):
     """Сервис Управления Users."""
 
+    cache_namespace = "users"
+
     async def reset_password_confirmation(
         self,
         request: PasswordReset,
@@ -35,6 +38,7 @@ class UsersService(ViewService):
             Вытаскиваем новый пароль.
             Декодируем токен(шифрованый id usera).
             Находим usera и меняем пароль, если usera нет -> ошибка.
+            Сбрасываем кеш usera.
             Возвращаем статус.
         """
         password = request.new_password
@@ -44,6 +48,7 @@ class UsersService(ViewService):
             raise HTTPException(
                 status_code=HTTPStatus.NOT_FOUND, detail="User not found."
             )
+        await user_cache.invalidate(str(id), self.cache_service, "password")
         return {"detail": "Password has been successfully updated."}
 
     async def reset_password(self, user_email) -> dict:
@@ -58,7 +63,9 @@ class UsersService(ViewService):
             Создаем и отправляем письмо.
             возвращаем статус.
         """
-        cache_key = f"reset_password:{user_email}"
+        cache_key = self.cache_service.make_obj_key(
+            "reset_password", user_email
+        )
         reset_request = await self.cache_service.get_from_cache(cache_key)
 
         if reset_request:
@@ -1,12 +1,24 @@
 from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from auth_app.src.core.config import app_config
 from auth_app.src.db.queries.base import BaseQueryService
+from auth_app.src.db.sessions import async_session
 from auth_app.src.models.choices import RequestData
 from auth_app.src.schemas.entity import UserInDB
 from auth_app.src.services.cache_service import RedisCacheService
 
 
 class ViewService:
+    """
+    Объект и список с кешированием.
+    Загрузка при промахе может выполняться в фоне(stale-while-revalidate)
+    или пережить отменивший запрос, поэтому выполняется в своей сессии
+    БД, а не в сессии запроса(query_service.session).
+    """
+
+    cache_namespace: str = "common"  # пространство имен ключей кеша
+
     def __init__(
         self,
         query_service: BaseQueryService,
@@ -16,41 +28,54 @@ class ViewService:
         self.cache_service = cache_service
 
     async def get_by_id(self, request_data: RequestData) -> UserInDB | None:
-        """Возвращает объект по id."""
+        """
+        Возвращает объект по id.
+        Одновременные промахи кеша по одному id выполняют один запрос в БД.
+        Отсутствующий id кешируется на cache_config.negative_ttl.
+        """
         obj_id = request_data.query
         validate_model: type[BaseModel] = request_data.validate_model
-        obj = await self.cache_service._obj_from_cache(
-            obj_id, model=validate_model  # type: ignore
+        key = self.cache_service.make_obj_key(self.cache_namespace, obj_id)
+
+        async def load() -> BaseModel | None:
+            async with async_session() as session:
+                obj = await self._own_query(session).get_by_id(
+                    obj_id=obj_id  # type: ignore
+                )
+                if not obj:
+                    return None
+                return validate_model.model_validate(obj)
+
+        return await self.cache_service.get_or_load_obj(  # type: ignore
+            key, validate_model, load, app_config.cache_expire
         )
-        if not obj:
-            obj = await self.query_service.get_by_id(
-                obj_id=obj_id  # type: ignore
-            )
-            if not obj:
-                return None
-            obj = validate_model.model_validate(obj)
-            await self.cache_service._put_obj_to_cache(
-                obj_id, obj  # type: ignore
-            )
-        return obj  # type: ignore
 
     async def get_list(self, request_data: RequestData) -> list[BaseModel]:
-        """Возвращает список обьектов с кешированием результата."""
+        """
+        Возвращает список обьектов с кешированием результата.
+        Одновременные промахи кеша одной страницы выполняют один запрос в БД.
+        """
         validate_model: type[BaseModel] = request_data.validate_model
         key = await self.cache_service.make_cache_key(
+            namespace=f"{self.cache_namespace}:list",
             request_data=request_data.request_type,
             sort=request_data.sort,
             page=request_data.page,
             size=request_data.size,
+            cursor=request_data.cursor,
             query=request_data.query,
         )
-        models = await self.cache_service._get_obj_list_from_cache(
-            key, validate_model
+
+        async def load() -> list[BaseModel]:
+            async with async_session() as session:
+                query = self._own_query(session)
+                models = await query.get_list(request_data) or []
+                return [validate_model.model_validate(obj) for obj in models]
+
+        return await self.cache_service.get_or_load_list(
+            key, validate_model, load, app_config.cache_expire
         )
-        if not models:
-            models = await self.query_service.get_list(request_data)
-            if not models:
-                return []
-            models = [validate_model.model_validate(obj) for obj in models]
-            await self.cache_service._put_obj_list_to_cache(key, models)
-        return models
+
+    def _own_query(self, session: AsyncSession) -> BaseQueryService:
+        """Сервис запросов того же типа поверх отдельной сессии."""
+        return type(self.query_service)(session)
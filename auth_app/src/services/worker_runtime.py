@@ -0,0 +1,112 @@
+import asyncio
+import threading
+import time
+from collections import Counter
+from typing import Any, Coroutine
+
+import dramatiq
+
+from auth_app.src.core.logger import logstash_handler
+from auth_app.src.services.http_session import (
+    close_http_session,
+    init_http_session,
+)
+from auth_app.src.services.mailer import mailer
+from auth_app.src.services.token_manager import TokenManager
+
+logger = logstash_handler()
+
+
+class AsyncRuntime(dramatiq.Middleware):
+    """
+    Асинхронная среда процесса воркера dramatiq.
+        Один event loop на процесс в отдельном потоке, запускается
+        после старта воркера и закрывается после его остановки.
+        На нем - общий пул HTTP соединений(http_session),
+        пул SMTP соединений(mailer) и TokenManager.
+        Потоки воркера выполняют корутины через run().
+    Считает обработанные сообщения по очередям(stats),
+    каждые log_every сообщений пишет пропускную способность в лог.
+    """
+
+    def __init__(self, log_every: int = 100) -> None:
+        self.log_every = log_every
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self.thread: threading.Thread | None = None
+        self.token_manager = TokenManager()
+        self.stats: Counter[str] = Counter()
+        self.started_at = time.monotonic()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def after_worker_boot(self, broker, worker) -> None:
+        self.start()
+
+    def after_worker_shutdown(self, broker, worker) -> None:
+        self.stop()
+
+    def before_process_message(self, broker, message) -> None:
+        self._local.started = time.monotonic()
+
+    def after_process_message(
+        self, broker, message, *, result=None, exception=None
+    ) -> None:
+        duration = time.monotonic() - getattr(
+            self._local, "started", time.monotonic()
+        )
+        queue = message.queue_name
+        with self._lock:
+            self.stats[f"{queue}:processed"] += 1
+            self.stats[f"{queue}:seconds"] += duration
+            if exception is not None:
+                self.stats[f"{queue}:failed"] += 1
+            processed = self.stats[f"{queue}:processed"]
+        if processed % self.log_every == 0:
+            self.log_throughput(queue)
+
+    def start(self) -> None:
+        """Запуск event loop процесса и общего HTTP пула."""
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(
+            target=self.loop.run_forever, name="async-runtime", daemon=True
+        )
+        self.thread.start()
+        self.started_at = time.monotonic()
+        self.run(init_http_session())
+
+    def stop(self) -> None:
+        """Закрытие HTTP и SMTP пулов и event loop процесса."""
+        if self.loop is None:
+            return
+        self.run(close_http_session())
+        self.run(mailer.close())
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(timeout=5)  # type: ignore
+        self.loop.close()
+        self.loop, self.thread = None, None
+        for queue in {key.split(":")[0] for key in self.stats}:
+            self.log_throughput(queue)
+
+    def run(self, coro: Coroutine[Any, Any, Any]) -> Any:
+        """
+        Выполнение корутины из потока воркера в event loop процесса.
+        Вне воркера(loop не запущен) - во временном event loop.
+        """
+        if self.loop is None:
+            return asyncio.run(coro)
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+    def log_throughput(self, queue: str) -> None:
+        processed = self.stats[f"{queue}:processed"]
+        if not processed:
+            return
+        elapsed = time.monotonic() - self.started_at
+        logger.info(
+            f"Очередь {queue}: обработано {processed}, "
+            f"ошибок {self.stats[f'{queue}:failed']}, "
+            f"{processed / elapsed:.1f} сообщ/сек, "
+            f"в среднем {self.stats[f'{queue}:seconds'] / processed:.3f} сек"
+        )
+
+
+async_runtime = AsyncRuntime()
@@ -1,5 +1,5 @@
-import asyncio
-from concurrent.futures import ThreadPoolExecutor
+import threading
+from concurrent.futures import Future
 
 import dramatiq
 from dramatiq.brokers.rabbitmq import RabbitmqBroker
@@ -7,59 +7,144 @@ from dramatiq.brokers.rabbitmq import RabbitmqBroker
 from auth_app.src.core.config import app_config, rabbitmq_data
 from auth_app.src.core.logger import logstash_handler
 from auth_app.src.services.api_client import APIClient
-from auth_app.src.services.token_manager import TokenManager
+from auth_app.src.services.mailer import mailer
+from auth_app.src.services.worker_runtime import async_runtime
 from auth_app.src.utils.encoders import UUIDEncoder
 
 logger = logstash_handler()
 
 rabbitmq_broker = RabbitmqBroker(url=rabbitmq_data.broker_url)
+rabbitmq_broker.add_middleware(async_runtime)
 dramatiq.set_broker(rabbitmq_broker)
 dramatiq.set_encoder(UUIDEncoder())
 
 
-def run_async(coro):
-    try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+class ProfileBatcher:
+    """
+    Объединяет профили из одновременно обрабатываемых сообщений
+    очереди user_profiles в один запрос POST profiles/bulk.
+    Первое сообщение пакета ждет до profile_batch_wait сек
+    или до profile_batch_size сообщений и отправляет пакет.
+    Каждое сообщение ждет результат своего пакета: при ошибке
+    исключение получают все сообщения пакета и dramatiq их повторит
+    (bulk пропускает уже созданные профили).
+    Размер пакета ограничен числом потоков процесса(--threads).
+    Прерывание первого сообщения(TimeLimitExceeded, Shutdown) завершает
+    ошибкой все сообщения его пакета, ожидание результата ограничено
+    timeout сек(time_limit задачи).
+    """
+
+    def __init__(
+        self,
+        max_size: int = app_config.profile_batch_size,
+        max_wait: float = app_config.profile_batch_wait,
+        timeout: float = app_config.profile_task_time_limit / 1000,
+    ) -> None:
+        self.max_size = max_size
+        self.max_wait = max_wait
+        self.timeout = timeout
+        self._cond = threading.Condition()
+        self._pending: list[tuple[dict, Future]] = []
+
+    def submit(self, profile: dict) -> None:
+        """Добавляет профиль в пакет и ждет отправки пакета."""
+        future: Future = Future()
+        with self._cond:
+            self._pending.append((profile, future))
+            leader = len(self._pending) == 1
+            if len(self._pending) >= self.max_size:
+                self._cond.notify_all()
+        if leader:
+            batch: list[tuple[dict, Future]] = []
+            try:
+                with self._cond:
+                    self._cond.wait_for(
+                        lambda: len(self._pending) >= self.max_size,
+                        timeout=self.max_wait,
+                    )
+                    batch, self._pending = self._pending, []
+                self._flush(batch)
+            finally:
+                self._fail_unresolved(batch)
+        future.result(timeout=self.timeout)
+
+    def _flush(self, batch: list[tuple[dict, Future]]) -> None:
+        try:
+            response = async_runtime.run(
+                self._send([profile for profile, _ in batch])
+            )
+        except Exception as e:
+            logger.error(f"Ошибка пакетного создания профилей: {e}")
+            for _, future in batch:
+                future.set_exception(e)
+            return
+        logger.info(
+            f"Профили созданы пакетом: {len(response.get('created', []))}, "
+            f"пропущено: {response.get('skipped')}"
+        )
+        for _, future in batch:
+            future.set_result(None)
 
-    if loop.is_running():
-        with ThreadPoolExecutor() as executor:
-            future = executor.submit(loop.run_until_complete, coro)
-            return future.result()
-    else:
-        return loop.run_until_complete(coro)
+    def _fail_unresolved(self, batch: list[tuple[dict, Future]]) -> None:
+        """
+        Ошибка для не получивших результат сообщений пакета:
+        отправивший пакет поток прерван. Прерывание до формирования
+        пакета - пакетом становится вся очередь ожидания.
+        """
+        if not batch:
+            with self._cond:
+                batch, self._pending = self._pending, []
+        error = RuntimeError("Отправка пакета профилей прервана")
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(error)
+
+    async def _send(self, profiles: list[dict]) -> dict:
+        async with APIClient(
+            app_config.profile_url, async_runtime.token_manager
+        ) as api_client:
+            return await api_client.request(
+                "POST",
+                app_config.profile_bulk_url,
+                json={"profiles": profiles},
+            )
+
+
+profile_batcher = ProfileBatcher()
 
 
 @dramatiq.actor(
     queue_name="user_profiles",
+    time_limit=app_config.profile_task_time_limit,
     max_retries=5,
     min_backoff=1000,
     max_backoff=60000,
 )
 def create_profile_task(user_data: dict):
     """
-    Отправляет POST-запрос в profiles_app для создания профиля пользователя.
+    Создание профиля пользователя в profiles_app.
+    Профили одновременно обрабатываемых сообщений
+    отправляются одним запросом(см. ProfileBatcher).
+    """
+    profile_batcher.submit(
+        {
+            "user_id": str(user_data["id"]),
+            "first_name": user_data["first_name"],
+            "last_name": user_data["last_name"],
+        }
+    )
+
+
+@dramatiq.actor(
+    queue_name="emails",
+    max_retries=5,
+    min_backoff=1000,
+    max_backoff=60000,
+)
+def send_email_task(message: dict):
+    """
+    Отправка письма(subject, recipient, body).
+    Выполняется в event loop процесса воркера(AsyncRuntime)
+    через его пул SMTP соединений(mailer).
     """
-    token_manager = TokenManager()
-    try:
-
-        async def _create_profile():
-            async with APIClient(
-                app_config.profile_url, token_manager
-            ) as api_client:
-                await api_client.request(
-                    "POST",
-                    app_config.profile_create_url,
-                    json={
-                        "user_id": str(user_data["id"]),
-                        "first_name": user_data["first_name"],
-                        "last_name": user_data["last_name"],
-                    },
-                )
-
-    except Exception as e:
-        logger.error(f"Ошибка создания профиля: {e}")
-
-    run_async(_create_profile())
+    async_runtime.run(mailer.send(**message))
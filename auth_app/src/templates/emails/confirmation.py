@@ -1,6 +1,9 @@
-def confirmation_email(full_name, frontend_url, user_id):
-    """Шаблон письма пользователю о регистрации."""
-    return f"""
+from html import escape
+from string import Template
+
+# разбирается один раз при импорте
+CONFIRMATION_TEMPLATE = Template(
+    """
         <!DOCTYPE html>
         <html lang="en">
         <head>
@@ -9,11 +12,21 @@ def confirmation_email(full_name, frontend_url, user_id):
             <title>Email Confirmation</title>
         </head>
         <body>
-            <h1>Hello, {full_name}!</h1>
+            <h1>Hello, $full_name!</h1>
             <p>Thank you for registering. Please confirm your email by visiting the link below:</p>
-            <a href="{frontend_url}/api/v1/signup/confirm/{user_id}/">Confirm Email</a>
+            <a href="$frontend_url/api/v1/signup/confirm/$user_id/">Confirm Email</a>
             <p>If you did not register, please ignore this email.</p>
             <p>Best regards,<br>Your Movie teater</p>
         </body>
         </html>
     """
+)
+
+
+def confirmation_email(full_name, frontend_url, user_id):
+    """Шаблон письма пользователю о регистрации."""
+    return CONFIRMATION_TEMPLATE.substitute(
+        full_name=escape(full_name),
+        frontend_url=frontend_url,
+        user_id=user_id,
+    )
@@ -1,6 +1,9 @@
-def reset_password_email(full_name, frontend_url, user_id):
-    """Template email sent to the user for password reset confirmation."""
-    return f"""
+from html import escape
+from string import Template
+
+# разбирается один раз при импорте
+RESET_PASSWORD_TEMPLATE = Template(
+    """
         <!DOCTYPE html>
         <html lang="en">
         <head>
@@ -9,12 +12,22 @@ def reset_password_email(full_name, frontend_url, user_id):
             <title>Password Reset Confirmation</title>
         </head>
         <body>
-            <h1>Hello, {full_name}!</h1>
+            <h1>Hello, $full_name!</h1>
             <p>We have received a request to reset the password for your account.</p>
             <p>To confirm your password change, please click the link below:</p>
-            <a href="{frontend_url}/api/v1/users/reset-password-confirmation/{user_id}/">Confirm Password Change</a>
+            <a href="$frontend_url/api/v1/users/reset-password-confirmation/$user_id/">Confirm Password Change</a>
             <p>If you did not request a password reset, please ignore this email.</p>
             <p>Best regards,<br>Your Movie Theater Team</p>
         </body>
         </html>
     """
+)
+
+
+def reset_password_email(full_name, frontend_url, user_id):
+    """Template email sent to the user for password reset confirmation."""
+    return RESET_PASSWORD_TEMPLATE.substitute(
+        full_name=escape(full_name),
+        frontend_url=frontend_url,
+        user_id=user_id,
+    )
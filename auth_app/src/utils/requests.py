@@ -3,6 +3,8 @@ from http import HTTPStatus
 
 import aiohttp
 
+from auth_app.src.services.http_session import http_session
+
 
 class HTTPException(Exception):
     def __init__(self, status_code, detail, response_text=None):
@@ -23,7 +25,7 @@ async def aiohttp_request(
     exception_detail: str = "error request",
 ):
     """Обертка для асинхронных запросов."""
-    async with aiohttp.ClientSession() as session:
+    async with http_session() as session:
         try:
             async with session.request(
                 method=method,
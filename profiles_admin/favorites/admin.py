@@ -1,4 +1,6 @@
 from django.contrib import admin
+from django.db.models import F, Value
+from django.db.models.functions import Coalesce, Concat, Trim
 
 from .forms import FavoriteAdminForm
 from .models import Favorite
@@ -20,10 +22,28 @@ class FavoriteAdmin(admin.ModelAdmin):
     readonly_fields = ("created", "modified")
     raw_id_fields = ("profile",)
 
+    def get_queryset(self, request):
+        """Имя и user_id профиля - JOIN в запросе списка, а не по строке."""
+        return (
+            super()
+            .get_queryset(request)
+            .annotate(
+                profile_full_name=Trim(
+                    Concat(
+                        Coalesce("profile__first_name", Value("")),
+                        Value(" "),
+                        Coalesce("profile__last_name", Value("")),
+                    )
+                ),
+                profile_user_id=F("profile__user_id"),
+            )
+        )
+
     def profile_info(self, obj):
-        return f"{obj.profile.full_name} ({obj.profile.user_id})"
+        return f"{obj.profile_full_name} ({obj.profile_user_id})"
 
     profile_info.short_description = "Профиль"
+    profile_info.admin_order_field = "profile_full_name"
 
     def note_short(self, obj):
         return obj.note[:50] + "..." if obj.note else ""
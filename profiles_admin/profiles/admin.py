@@ -1,16 +1,28 @@
 import logging
-from asgiref.sync import async_to_sync
 from django.conf import settings
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
 from django.core.cache import cache
 
 from .forms import ProfileAdminForm
 from .models import Profile
-from .services import APIClient, TokenManager
+from .services import auth_users_client
 
 logger = logging.getLogger(__name__)
 
 
+class ProfileChangeList(ChangeList):
+    """
+    Список профилей: данные строк только текущей страницы -
+    номера дешифруются, email запрашиваются одним пакетом.
+    """
+
+    def get_results(self, request):
+        super().get_results(request)
+        Profile.decrypt_phones(self.result_list)
+        self.model_admin.prefetch_emails(self.result_list)
+
+
 @admin.register(Profile)
 class ProfileAdmin(admin.ModelAdmin):
     form = ProfileAdminForm
@@ -26,84 +38,55 @@ class ProfileAdmin(admin.ModelAdmin):
     search_fields = ("user_id", "first_name", "last_name")
     readonly_fields = ("created", "modified")
 
+    def get_changelist(self, request, **kwargs):
+        return ProfileChangeList
+
     def phone_number_display(self, obj):
         """Отображение дешифрованного номера телефона в админке."""
         return obj.phone_number
 
     phone_number_display.short_description = "Телефон"
 
-    def get_queryset(self, request):
-        qs = super().get_queryset(request)
-        user_ids = [str(user.user_id) for user in qs]
-
-        # Проверка кэша и запрос отсутствующих email
-        missing_user_ids = [
-            user_id
-            for user_id in user_ids
-            if not cache.get(f"user_email:{user_id}")
+    def prefetch_emails(self, profiles):
+        """
+        Email пользователей строк страницы: cache.get_many,
+        промахи - одним пакетным запросом к auth_app, cache.set_many.
+        """
+        keys = {
+            profile: f"user_email:{profile.user_id}" for profile in profiles
+        }
+        cached = cache.get_many(list(keys.values()))
+        missing = [
+            str(profile.user_id)
+            for profile, key in keys.items()
+            if key not in cached
         ]
-
-        if missing_user_ids:
-            emails = async_to_sync(self.fetch_user_emails)(missing_user_ids)
-            for user_id, email in emails.items():
-                if email != "Не найден":
-                    cache.set(f"user_email:{user_id}", email, timeout=60 * 5)
-
-        return qs
-
-    def get_user_email(self, obj):
-        email_cache_key = f"user_email:{obj.user_id}"
-        email = cache.get(email_cache_key)
-
-        if not email:
+        emails: dict[str, str | None] = {}
+        if missing:
             try:
-                emails = async_to_sync(self.fetch_user_emails)(
-                    [str(obj.user_id)]
-                )
-                email = emails.get(str(obj.user_id), "Не найден")
-                if email != "Не найден":
-                    cache.set(email_cache_key, email, timeout=60 * 5)
+                emails = auth_users_client.fetch_emails(missing)
             except Exception as e:
                 logger.error(f"Ошибка получения email: {e}")
-                email = "Ошибка запроса"
+            found = {
+                f"user_email:{user_id}": email
+                for user_id, email in emails.items()
+                if email
+            }
+            cache.set_many(
+                found, timeout=int(settings.USER_EMAIL_CACHE_TIMEOUT)
+            )
+            cached.update(found)
+        for profile, key in keys.items():
+            if key in cached:
+                profile.user_email = cached[key]
+            elif emails.get(str(profile.user_id), "") is None:
+                profile.user_email = "Не найден"
+            else:
+                profile.user_email = "Ошибка запроса"
 
-        return email
+    def get_user_email(self, obj):
+        if not hasattr(obj, "user_email"):
+            self.prefetch_emails([obj])
+        return obj.user_email
 
     get_user_email.short_description = "Email пользователя"
-
-    async def fetch_user_emails(
-        self,
-        user_ids: list,
-        batch_size: int | None = settings.BATCH_SIZE,
-        endpoint: str | None = settings.USERS_BULK,
-    ):
-        """Запрос для получения данных пользователей."""
-        result = {}
-        token_manager = TokenManager()
-
-        async with APIClient(settings.AUTH_URL, token_manager) as client:
-            for i in range(0, len(user_ids), batch_size):
-                batch = user_ids[i: i + batch_size]
-                try:
-                    response = await client.request(
-                        method="POST",
-                        endpoint=endpoint,
-                        json={"user_ids": batch},
-                    )
-                    if isinstance(response, list):
-                        batch_result = {
-                            user["id"]: user.get("email", "Не найден")
-                            for user in response
-                        }
-                        for user_id in batch:
-                            if user_id not in batch_result:
-                                batch_result[user_id] = "Не найден"
-                        result.update(batch_result)
-                except Exception as e:
-                    logger.error(f"Ошибка в батче {i // batch_size}: {e}")
-                    batch_result = {
-                        user_id: "Ошибка запроса" for user_id in batch
-                    }
-                    result.update(batch_result)
-
-        return result
@@ -1,6 +1,7 @@
+import hashlib
+import hmac
+
 from cryptography.fernet import Fernet
-from cryptography.hazmat.backends import default_backend
-from cryptography.hazmat.primitives import hashes, hmac
 from django.conf import settings
 from django.db import models
 from django.utils.translation import gettext_lazy as _
@@ -62,23 +63,53 @@ class Profile(UUIDMixin):
 
     @property
     def phone_number(self):
-        """Дешифрация номера телефона."""
+        """
+        Дешифрация номера телефона при первом получении,
+        результат хранится в объекте до изменения шифра.
+        """
         if not self._phone_number:
             return None
-        try:
-            return cipher_suite.decrypt(self._phone_number.encode()).decode()
-        except Exception:
-            return "Ошибка при дешифрации"
+        cached = getattr(self, "_phone_cache", None)
+        if cached is None or cached[0] != self._phone_number:
+            cached = (self._phone_number, self._decrypt(self._phone_number))
+            self._phone_cache = cached
+        return cached[1]
 
     @phone_number.setter
     def phone_number(self, value):
         if value:
             self._phone_number = cipher_suite.encrypt(value.encode()).decode()
             self._phone_hmac = self._generate_hmac(value)
+            self._phone_cache = (self._phone_number, value)
         else:
             self._phone_number = None
             self._phone_hmac = None
 
+    @classmethod
+    def decrypt_phones(cls, profiles):
+        """
+        Пакетная дешифрация номеров страницы списка админки:
+        одинаковые шифры дешифруются один раз,
+        дальше phone_number берется из кеша объекта.
+        """
+        profiles = [profile for profile in profiles if profile._phone_number]
+        phones = {
+            token: cls._decrypt(token)
+            for token in {profile._phone_number for profile in profiles}
+        }
+        for profile in profiles:
+            profile._phone_cache = (
+                profile._phone_number,
+                phones[profile._phone_number],
+            )
+
+    @staticmethod
+    def _decrypt(token: str) -> str:
+        try:
+            return cipher_suite.decrypt(token.encode()).decode()
+        except Exception:
+            return "Ошибка при дешифрации"
+
     @classmethod
     def generate_phone_hmac(cls, phone_number):
         if not phone_number:
@@ -88,8 +119,6 @@ class Profile(UUIDMixin):
     @staticmethod
     def _generate_hmac(phone_number: str) -> str:
         """Общий метод для генерации HMAC."""
-        h = hmac.HMAC(
-            settings.HMAC_KEY, hashes.SHA256(), backend=default_backend()
-        )
-        h.update(phone_number.encode())
-        return h.finalize().hex()
+        return hmac.new(
+            settings.HMAC_KEY, phone_number.encode(), hashlib.sha256
+        ).hexdigest()
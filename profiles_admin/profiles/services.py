@@ -1,11 +1,16 @@
+import asyncio
+import logging
+import threading
 from datetime import datetime
-from typing import Any
+from typing import Any, Coroutine
 
 import aiohttp
 from django.conf import settings
 
 from .utils import encode_id
 
+logger = logging.getLogger(__name__)
+
 
 class TokenManager:
     def __init__(
@@ -48,18 +53,24 @@ class HTTPException(Exception):
 
 class APIClient:
     def __init__(
-        self, base_url: str, token_manager: TokenManager | None = None
+        self,
+        base_url: str,
+        token_manager: TokenManager | None = None,
+        session: aiohttp.ClientSession | None = None,
     ) -> None:
         self.base_url = base_url
         self.token_manager = token_manager
-        self.session: aiohttp.ClientSession | None = None
+        # переданная сессия(общий пул) не закрывается клиентом
+        self.session = session
+        self._own_session = session is None
 
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        if self._own_session:
+            self.session = aiohttp.ClientSession()
         return self
 
     async def __aexit__(self, exc_type, exc, tb):
-        if self.session:
+        if self.session and self._own_session:
             await self.session.close()
 
     async def request(self, method: str, endpoint: str, **kwargs) -> Any:
@@ -89,3 +100,90 @@ class APIClient:
                 return await response.json()
         except aiohttp.ClientError as e:
             raise HTTPException(status_code=None, detail=str(e))
+
+
+class AuthUsersClient:
+    """
+    Постоянный клиент auth_app для синхронного кода админки(WSGI).
+        Один event loop в фоновом потоке на процесс и одна
+        aiohttp.ClientSession на нем: пул keep-alive соединений
+        и токен сервиса переиспользуются между запросами админки.
+    """
+
+    def __init__(
+        self,
+        base_url: str = settings.AUTH_URL,
+        users_bulk: str = settings.USERS_BULK,
+        batch_size: int = int(settings.BATCH_SIZE),
+        timeout: float = float(settings.AUTH_TIMEOUT),
+    ) -> None:
+        self.base_url = base_url
+        self.users_bulk = users_bulk
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self.token_manager = TokenManager()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._session: aiohttp.ClientSession | None = None
+        self._lock = threading.Lock()
+
+    def fetch_emails(self, user_ids: list[str]) -> dict[str, str | None]:
+        """
+        Email пользователей одним запросом на batch_size id.
+        None - пользователь не найден, нет в ответе - ошибка запроса.
+        """
+        return self.run(self._fetch_emails(user_ids))
+
+    def run(self, coro: Coroutine[Any, Any, Any]) -> Any:
+        """Выполнение корутины в event loop клиента."""
+        future = asyncio.run_coroutine_threadsafe(coro, self._get_loop())
+        return future.result(timeout=self.timeout * 2)
+
+    async def _fetch_emails(
+        self, user_ids: list[str]
+    ) -> dict[str, str | None]:
+        result: dict[str, str | None] = {}
+        async with APIClient(
+            self.base_url, self.token_manager, self._get_session()
+        ) as client:
+            for i in range(0, len(user_ids), self.batch_size):
+                batch = user_ids[i: i + self.batch_size]
+                try:
+                    response = await client.request(
+                        method="POST",
+                        endpoint=self.users_bulk,
+                        json={"user_ids": batch},
+                    )
+                except Exception as e:
+                    logger.error(f"Ошибка в батче {i // self.batch_size}: {e}")
+                    continue
+                emails = {
+                    str(user["id"]): user.get("email") for user in response
+                }
+                result.update(
+                    {user_id: emails.get(user_id) for user_id in batch}
+                )
+        return result
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=10, keepalive_timeout=60
+                ),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self._session
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=self._loop.run_forever,
+                    name="auth-users-client",
+                    daemon=True,
+                ).start()
+        return self._loop
+
+
+auth_users_client = AuthUsersClient()
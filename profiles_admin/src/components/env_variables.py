@@ -4,6 +4,8 @@ import os
 FRONTEND_URL: str = os.environ.get("FRONTEND_URL", "http://127.0.0.1:8000/")
 AUTH_URL: str = os.environ.get("AUTH_URL", "http://auth_app:80/")
 USERS_BULK: str = os.environ.get("USERS_BULK", "api/v1/users/bulk")
+AUTH_TIMEOUT: float = os.environ.get("AUTH_TIMEOUT", 5)  # сек
+JWT_ALGORITHM: str = os.environ.get("JWT_ALGORITHM", "HS256")
 
 HMAC_KEY: str = base64.urlsafe_b64decode(
     os.environ.get("HMAC_KEY", "X7Fq3tRk9vYlLpOzKjWnQrSsUmTdYcA1B2C3D4E5F6G=")
@@ -23,3 +25,7 @@ SECRET_KEY: str = os.environ.get(
     "fastapi-insecure-b2sh!qk&=%azim-=s&=d1(-1upbq7H&-^-=tmPeHPLKXD",
 )
 BATCH_SIZE: int = os.environ.get("BATCH_SIZE", 1000)
+USER_EMAIL_CACHE_TIMEOUT: int = os.environ.get(
+    "USER_EMAIL_CACHE_TIMEOUT", 60 * 5
+)
+ADMIN_QUERY_BUDGET: int = os.environ.get("ADMIN_QUERY_BUDGET", 12)
@@ -0,0 +1,48 @@
+import logging
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+
+class AdminQueryBudgetMiddleware:
+    """
+    Бюджет SQL запросов страниц админки.
+        Считает запросы ко всем БД(default, profiles_db) за время
+        обработки запроса к /admin/. Количество не должно зависеть
+        от размера страницы списка: превышение ADMIN_QUERY_BUDGET
+        пишется в лог, в DEBUG - заголовок X-Query-Count.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.budget = int(settings.ADMIN_QUERY_BUDGET)
+
+    def __call__(self, request):
+        if not request.path.startswith("/admin/"):
+            return self.get_response(request)
+
+        queries = 0
+
+        def count_query(execute, sql, params, many, context):
+            nonlocal queries
+            queries += 1
+            return execute(sql, params, many, context)
+
+        with ExitStack() as stack:
+            for alias in connections:
+                stack.enter_context(
+                    connections[alias].execute_wrapper(count_query)
+                )
+            response = self.get_response(request)
+
+        if queries > self.budget:
+            logger.warning(
+                f"Превышен бюджет SQL запросов админки: {request.path} - "
+                f"{queries} запросов(бюджет {self.budget})"
+            )
+        if settings.DEBUG:
+            response["X-Query-Count"] = str(queries)
+        return response
@@ -62,6 +62,7 @@ MIDDLEWARE = [
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "django.middleware.locale.LocaleMiddleware",
+    "src.middleware.AdminQueryBudgetMiddleware",
 ]
 
 ROOT_URLCONF = "src.urls"
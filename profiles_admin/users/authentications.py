@@ -1,52 +1,115 @@
-import json
 import logging
 
+import jwt
 import requests
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.backends import BaseBackend
-from django.conf import settings
+from requests.adapters import HTTPAdapter
 
 User = get_user_model()
 logging.basicConfig(
     level=logging.DEBUG, format="%(asctime)s - %(levelname)s - %(message)s"
 )
+logger = logging.getLogger(__name__)
+
+# общий пул соединений к auth_app для всех входов процесса
+auth_adapter = HTTPAdapter(pool_connections=1, pool_maxsize=10)
+auth_session = requests.Session()
+auth_session.mount("http://", auth_adapter)
+auth_session.mount("https://", auth_adapter)
 
 
 class CustomBackend(BaseBackend):
-    def authenticate(self, request, username=None, password=None):
-        auth_url = settings.AUTH_URL
-        url = auth_url + "api/v1/auth/login"
+    """
+    Вход в админку через auth_app.
+        access_token - токен auth_app, проверяется на месте
+        (подпись, срок жизни, тип), без запроса и пароля.
+        username/password - вход через /auth/login auth_app
+        (пул соединений, таймаут AUTH_TIMEOUT).
+    Локальная копия пользователя обновляется только при изменении
+    данных, пароль локально не хранится и не хешируется.
+    is_active обновляется только по ответу входа с паролем: токен
+    не проверяется на отзыв и не должен активировать пользователя.
+    """
+
+    def authenticate(
+        self, request, username=None, password=None, access_token=None
+    ):
+        if access_token:
+            user_data = self.verify_access_token(access_token)
+        elif username and password:
+            user_data = self.login(username, password)
+        else:
+            return None
+        if user_data is None:
+            return None
+        try:
+            user = self.sync_user(user_data)
+        except Exception as e:
+            logger.error(f"Ошибка синхронизации пользователя: {e}")
+            return None
+        return user if user.is_active else None
+
+    def verify_access_token(self, access_token: str) -> dict | None:
+        """Данные пользователя из access token auth_app."""
+        try:
+            claims = jwt.decode(
+                access_token,
+                settings.SECRET_KEY,
+                algorithms=[settings.JWT_ALGORITHM],
+            )
+        except jwt.InvalidTokenError as e:
+            logger.info(f"Некорректный access token: {e}")
+            return None
+        if claims.get("type") != "access" or "user_data" not in claims:
+            return None
+        return {**claims["user_data"], "roles": claims.get("roles", [])}
+
+    def login(self, username: str, password: str) -> dict | None:
+        """Данные пользователя после входа в auth_app."""
+        url = settings.AUTH_URL + "api/v1/auth/login"
         payload = {"login": username, "password": password}
-        response = requests.post(url, data=json.dumps(payload))
-        data = response.json()
         try:
-            user, created = User.objects.get_or_create(
-                email=data["user"]["email"],
-                defaults={
-                    "email": data["user"]["email"],
-                    "login": data["user"]["login"],
-                    "username": data["user"]["login"],
-                    "first_name": data["user"]["first_name"],
-                    "last_name": data["user"]["last_name"],
-                    "is_active": data["user"]["is_active"],
-                    "is_admin": "admin" in data["user"]["roles"],
-                    "is_staff": "admin" in data["user"]["roles"],
-                    "is_superuser": "admin" in data["user"]["roles"],
-                },
+            response = auth_session.post(
+                url, json=payload, timeout=float(settings.AUTH_TIMEOUT)
             )
-            if not created:
-                user.login = data["user"]["login"]
-                user.username = data["user"]["login"]
-                user.first_name = data["user"]["first_name"]
-                user.last_name = data["user"]["last_name"]
-                user.is_active = data["user"]["is_active"]
-                user.is_admin = "admin" in data["user"]["roles"]
-                user.is_staff = "admin" in data["user"]["roles"]
-                user.is_superuser = "admin" in data["user"]["roles"]
-                user.set_password(password)
-                user.save()
-        except Exception:
+        except requests.RequestException as e:
+            logger.error(f"auth_app недоступен: {e}")
+            return None
+        if response.status_code != 200:
             return None
+        return response.json()["user"]
+
+    def sync_user(self, user_data: dict):
+        """Создание/обновление локальной копии пользователя."""
+        is_admin = "admin" in user_data["roles"]
+        fields = {
+            "login": user_data["login"],
+            "username": user_data["login"],
+            "first_name": user_data["first_name"],
+            "last_name": user_data["last_name"],
+            "is_admin": is_admin,
+            "is_staff": is_admin,
+            "is_superuser": is_admin,
+        }
+        if "is_active" in user_data:
+            fields["is_active"] = user_data["is_active"]
+        user = User.objects.filter(email=user_data["email"]).first()
+        if user is None:
+            user = User(email=user_data["email"], **fields)
+            user.set_unusable_password()
+            user.save()
+            return user
+        changed = [
+            name
+            for name, value in fields.items()
+            if getattr(user, name) != value
+        ]
+        if changed:
+            for name in changed:
+                setattr(user, name, fields[name])
+            user.save(update_fields=changed)
         return user
 
     def get_user(self, user_id):
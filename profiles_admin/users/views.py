@@ -0,0 +1,29 @@
+from django.contrib.auth import authenticate, login
+from django.http import HttpResponseForbidden
+from django.shortcuts import redirect
+from django.utils.http import url_has_allowed_host_and_scheme
+
+
+def token_login(request):
+    """
+    Вход в админку по access token auth_app(cookie access_token
+    или заголовок Authorization: Bearer) без повторного ввода пароля.
+    """
+    access_token = request.COOKIES.get("access_token")
+    scheme, _, credentials = request.headers.get(
+        "Authorization", ""
+    ).partition(" ")
+    if scheme == "Bearer" and credentials:
+        access_token = credentials
+    user = authenticate(request, access_token=access_token)
+    if user is None or not user.is_staff:
+        return HttpResponseForbidden("Invalid or expired token.")
+    login(request, user)
+    next_url = request.GET.get("next")
+    if next_url and url_has_allowed_host_and_scheme(
+        next_url,
+        allowed_hosts={request.get_host()},
+        require_https=request.is_secure(),
+    ):
+        return redirect(next_url)
+    return redirect("admin:index")
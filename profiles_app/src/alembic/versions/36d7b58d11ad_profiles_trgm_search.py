@@ -0,0 +1,49 @@
+"""profiles_trgm_search
+
+Revision ID: 36d7b58d11ad
+Revises: 8e1ad7218ebf
+Create Date: 2026-10-18 11:48:19.226731
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "36d7b58d11ad"
+down_revision: Union[str, None] = "8e1ad7218ebf"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Выражение совпадает с FULL_NAME в db/queries/profiles.py
+FULL_NAME = "(coalesce(first_name, '') || ' ' || coalesce(last_name, ''))"
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm;")
+    # ILIKE '%x%' и 'x%' по имени/фамилии(фильтр списка, подсказки).
+    for column in ("first_name", "last_name"):
+        op.create_index(
+            f"ix_profiles_{column}_trgm",
+            "profiles",
+            [column],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+    # оператор % и similarity() по полному имени(поиск).
+    op.create_index(
+        "ix_profiles_full_name_trgm",
+        "profiles",
+        [sa.text(f"{FULL_NAME} gin_trgm_ops")],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_profiles_full_name_trgm", table_name="profiles")
+    op.drop_index("ix_profiles_last_name_trgm", table_name="profiles")
+    op.drop_index("ix_profiles_first_name_trgm", table_name="profiles")
@@ -0,0 +1,99 @@
+"""movie_rating_stats
+
+Revision ID: 8e1ad7218ebf
+Revises: f28f2b3f6f77
+Create Date: 2026-10-18 11:02:37.904615
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "8e1ad7218ebf"
+down_revision: Union[str, None] = "f28f2b3f6f77"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Инкрементальное обновление агрегатов при любом изменении reviews
+# (api, админка, каскадное удаление профиля).
+APPLY_FUNCTION = """
+CREATE OR REPLACE FUNCTION movie_rating_stats_apply(
+    p_movie_id uuid, p_rating integer, p_delta integer
+) RETURNS void AS $$
+BEGIN
+    INSERT INTO movie_rating_stats (
+        movie_id, reviews_count, rating_sum, histogram
+    )
+    VALUES (p_movie_id, 0, 0, array_fill(0, ARRAY[10]))
+    ON CONFLICT (movie_id) DO NOTHING;
+
+    UPDATE movie_rating_stats
+    SET reviews_count = reviews_count + p_delta,
+        rating_sum = rating_sum + p_delta * p_rating,
+        histogram[p_rating] = histogram[p_rating] + p_delta
+    WHERE movie_id = p_movie_id;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION reviews_rating_stats() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM movie_rating_stats_apply(OLD.movie_id, OLD.rating, -1);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM movie_rating_stats_apply(NEW.movie_id, NEW.rating, 1);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+TRIGGER = """
+CREATE TRIGGER reviews_rating_stats
+AFTER INSERT OR DELETE OR UPDATE OF rating, movie_id ON reviews
+FOR EACH ROW EXECUTE FUNCTION reviews_rating_stats();
+"""
+
+HISTOGRAM = ", ".join(
+    f"count(*) FILTER (WHERE rating = {rating})" for rating in range(1, 11)
+)
+
+BACKFILL = f"""
+INSERT INTO movie_rating_stats (movie_id, reviews_count, rating_sum, histogram)
+SELECT movie_id, count(*), sum(rating), ARRAY[{HISTOGRAM}]
+FROM reviews
+GROUP BY movie_id;
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        "movie_rating_stats",
+        sa.Column("movie_id", sa.UUID(), nullable=False),
+        sa.Column("reviews_count", sa.Integer(), nullable=False),
+        sa.Column("rating_sum", sa.BigInteger(), nullable=False),
+        sa.Column(
+            "histogram", postgresql.ARRAY(sa.Integer()), nullable=False
+        ),
+        sa.PrimaryKeyConstraint("movie_id"),
+    )
+    op.execute(APPLY_FUNCTION)
+    op.execute(TRIGGER_FUNCTION)
+    op.execute(TRIGGER)
+    op.execute(BACKFILL)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS reviews_rating_stats ON reviews;")
+    op.execute("DROP FUNCTION IF EXISTS reviews_rating_stats();")
+    op.execute(
+        "DROP FUNCTION IF EXISTS "
+        "movie_rating_stats_apply(uuid, integer, integer);"
+    )
+    op.drop_table("movie_rating_stats")
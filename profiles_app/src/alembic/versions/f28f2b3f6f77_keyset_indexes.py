@@ -0,0 +1,60 @@
+"""keyset_indexes
+
+Revision ID: f28f2b3f6f77
+Revises: 06293ca0baf0
+Create Date: 2026-10-18 10:14:05.772104
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f28f2b3f6f77"
+down_revision: Union[str, None] = "06293ca0baf0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_profiles_updated_at_id",
+        "profiles",
+        ["updated_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_favorites_created_at_id",
+        "favorites",
+        ["created_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_favorites_profile_id_created_at_id",
+        "favorites",
+        ["profile_id", "created_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_reviews_created_at_id",
+        "reviews",
+        ["created_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_reviews_movie_id_created_at_id",
+        "reviews",
+        ["movie_id", "created_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_reviews_movie_id_created_at_id", table_name="reviews")
+    op.drop_index("ix_reviews_created_at_id", table_name="reviews")
+    op.drop_index(
+        "ix_favorites_profile_id_created_at_id", table_name="favorites"
+    )
+    op.drop_index("ix_favorites_created_at_id", table_name="favorites")
+    op.drop_index("ix_profiles_updated_at_id", table_name="profiles")
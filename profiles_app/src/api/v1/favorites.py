@@ -136,6 +136,10 @@ async def list_favorites(
         Query(description="Сортировка: 'asc' или 'desc'",
               enum=["asc", "desc"])
     ] = "desc",
+    cursor: Annotated[
+        str | None,
+        Query(description="Курсор следующей страницы(next_cursor)"),
+    ] = None,
     favorites_service: FavoritesService = Depends(get_favorites_service),
 ) -> FavoriteListResponse:
     try:
@@ -145,6 +149,7 @@ async def list_favorites(
             page_number=page_number,
             page_size=page_size,
             order=order,
+            cursor=cursor,
         )
     except ValueError as e:
         raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e))
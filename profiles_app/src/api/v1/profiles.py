@@ -4,17 +4,25 @@ from uuid import UUID
 
 from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request
 
+from profiles_app.src.models.choices import AccessLevel
 from profiles_app.src.schemas.entity import (
     CreateProfileResponse,
     PhoneVerificationRequest,
+    ProfileBulkCreate,
+    ProfileBulkCreateResponse,
     ProfileCreate,
     ProfileListResponse,
     ProfileRead,
+    ProfileSearchResult,
     ProfileUpdate,
     UpdateProfileResponse,
     UserData,
     VerifyCodeRequest,
 )
+from profiles_app.src.services.access_service import (
+    access_control,
+    has_access,
+)
 from profiles_app.src.services.profiles_service import (
     ProfilesService,
     get_profiles_service,
@@ -28,22 +36,73 @@ router = APIRouter()
 @router.get(
     "/my",
     response_model=ProfileRead,
+    response_model_exclude_unset=True,
     summary="Получение собственного профиля",
     description="API получения собственного профиля по ID",
 )
 async def get_my_profile(
     request: Request,
+    fields: Annotated[
+        list[str] | None,
+        Query(
+            description=(
+                "Необязательные поля ответа(first_name, last_name, "
+                "phone_number), по умолчанию - все"
+            )
+        ),
+    ] = None,
     profiles_service: ProfilesService = Depends(get_profiles_service),
 ) -> ProfileRead:
     token_data = request.state.token_data
     request_user_data = token_data.get("user_data")
     user_data = UserData.model_validate(request_user_data)
 
-    profile = await profiles_service.get_my_profile(user_data)
+    profile = await profiles_service.get_my_profile(
+        user_data, set(fields) if fields is not None else None
+    )
     logger.info(f"Profile {profile.first_name} {profile.last_name} received")
     return profile
 
 
+@router.get(
+    "/search",
+    response_model=list[ProfileSearchResult],
+    summary="Поиск профилей",
+    description=(
+        "Поиск по имени и фамилии с учетом опечаток, "
+        "результаты отсортированы по сходству с запросом."
+    ),
+)
+async def search_profiles(
+    query: Annotated[
+        str, Query(description="Имя и/или фамилия", min_length=2)
+    ],
+    limit: Annotated[
+        int, Query(description="Количество результатов", ge=1)
+    ] = 10,
+    profiles_service: ProfilesService = Depends(get_profiles_service),
+) -> list[ProfileSearchResult]:
+    return await profiles_service.search_profiles(query, limit)
+
+
+@router.get(
+    "/autocomplete",
+    response_model=list[ProfileSearchResult],
+    summary="Подсказки при вводе имени",
+    description="Профили, имя или фамилия которых начинается с prefix.",
+)
+async def autocomplete_profiles(
+    prefix: Annotated[
+        str, Query(description="Начало имени или фамилии", min_length=1)
+    ],
+    limit: Annotated[
+        int, Query(description="Количество подсказок", ge=1)
+    ] = 10,
+    profiles_service: ProfilesService = Depends(get_profiles_service),
+) -> list[ProfileSearchResult]:
+    return await profiles_service.autocomplete_profiles(prefix, limit)
+
+
 @router.post(
     "",
     response_model=CreateProfileResponse,
@@ -74,18 +133,49 @@ async def create_profile(
     }
 
 
+@router.post(
+    "/bulk",
+    response_model=ProfileBulkCreateResponse,
+    status_code=HTTPStatus.CREATED,
+    summary="Пакетное создание профилей",
+    description=(
+        "Создание профилей одним запросом в БД(регистрации из auth_app). "
+        "Уже существующие профили пропускаются."
+    ),
+)
+@access_control(AccessLevel.ADMIN, allow_services=True)
+async def create_profiles_bulk(
+    request: Request,  # нужен для декоратора.
+    bulk_data: ProfileBulkCreate,
+    profiles_service: ProfilesService = Depends(get_profiles_service),
+) -> ProfileBulkCreateResponse:
+    return await profiles_service.create_profiles_bulk(bulk_data)
+
+
 @router.get(
     "/{profile_id}",
     response_model=ProfileRead,
+    response_model_exclude_unset=True,
     summary="Получение профиля",
     description="API получения профиля по ID",
 )
 async def get_profile(
     profile_id: UUID,
+    fields: Annotated[
+        list[str] | None,
+        Query(
+            description=(
+                "Необязательные поля ответа(first_name, last_name, "
+                "phone_number), по умолчанию - все"
+            )
+        ),
+    ] = None,
     profiles_service: ProfilesService = Depends(get_profiles_service),
 ) -> ProfileRead:
 
-    profile = await profiles_service.get_profile(profile_id)
+    profile = await profiles_service.get_profile(
+        profile_id, set(fields) if fields is not None else None
+    )
     return profile
 
 
@@ -178,6 +268,7 @@ async def verify_phone(
 @router.get(
     "",
     response_model=ProfileListResponse,
+    response_model_exclude_unset=True,
     status_code=HTTPStatus.OK,
     summary="Получить список профилей с пагинацией",
     description=(
@@ -186,6 +277,7 @@ async def verify_phone(
     ),
 )
 async def list_profiles(
+    request: Request,
     page_number: Annotated[
         int, Query(description='Номер страницы', ge=1)
     ] = 1,
@@ -203,12 +295,33 @@ async def list_profiles(
         enum=["asc", "desc"],
         description="Sort order: 'asc' or 'desc'",
     ),
+    cursor: Annotated[
+        str | None,
+        Query(description="Курсор следующей страницы(next_cursor)"),
+    ] = None,
+    fields: Annotated[
+        list[str] | None,
+        Query(
+            description=(
+                "Необязательные поля профилей(phone_number - только "
+                "администраторам и сервисам), по умолчанию - без них"
+            )
+        ),
+    ] = None,
     profiles_service: ProfilesService = Depends(get_profiles_service),
 ) -> ProfileListResponse:
     """
     Для получения списка профилей из
     базы данных с применением пагинации и фильтров.
+    Номера телефонов(fields=phone_number) - только администраторам
+    и сервисам.
     """
+    if "phone_number" in (fields or ()) and not has_access(
+        request, AccessLevel.ADMIN, allow_services=True
+    ):
+        raise HTTPException(
+            status_code=HTTPStatus.UNAUTHORIZED, detail="access denied."
+        )
     try:
         result = await profiles_service.list_profiles(
             first_name=first_name,
@@ -216,8 +329,12 @@ async def list_profiles(
             page_number=page_number,
             page_size=page_size,
             order=order,
+            cursor=cursor,
+            fields=set(fields or ()),
         )
         return result
+    except ValueError as e:
+        raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e))
     except Exception as e:
         logger.info({"message": f"Unhandled exception: {str(e)}"})
         raise HTTPException(
@@ -133,6 +133,10 @@ async def list_reviews(
         Query(description="Сортировка: 'asc' или 'desc'",
               enum=["asc", "desc"])
     ] = "desc",
+    cursor: Annotated[
+        str | None,
+        Query(description="Курсор следующей страницы(next_cursor)"),
+    ] = None,
     review_service: ReviewService = Depends(get_reviews_service),
 ) -> ReviewListResponse:
     try:
@@ -142,6 +146,7 @@ async def list_reviews(
             page_number=page_number,
             page_size=page_size,
             order=order,
+            cursor=cursor,
         )
     except ValueError as e:
         raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e))
@@ -1,4 +1,5 @@
 import base64
+from typing import Literal
 
 from cryptography.fernet import InvalidToken
 from pydantic import ConfigDict, Field
@@ -19,6 +20,27 @@ class AppConfig(BaseSettings):
     auth_url: str = Field(default="http://auth_app:80/")
     content_url: str = Field(default="http://content_app:60/")
     service_token_max_age: int = 30 * 24 * 60 * 60  # 30 дней в секундах
+    cache_prefix: str = Field(default="profiles")  # префикс ключей Redis
+    cache_version: int = Field(default=1)  # версия схемы кешируемых данных
+    auth_verify_mode: Literal["local", "remote"] = Field(
+        default="local",
+        description=(
+            "local - проверка access token на месте, "
+            "remote - запрос в auth_app(/auth/checkout)"
+        ),
+    )
+    jwt_algorithm: str = Field(default="HS256")
+    claims_cache_ttl: int = Field(default=60)  # сек
+    revoked_sync_interval: int = Field(default=15)  # сек
+    film_data_expire: int = Field(default=60 * 10)  # сек
+    film_fetch_concurrency: int = Field(default=10)  # запросов в content_app
+    list_count_strategy: Literal["exact", "window", "cached", "estimate"] = (
+        Field(default="window")  # подсчет total_count списков
+    )
+    list_count_cache_ttl: int = Field(default=60 * 5)  # сек, для cached
+    rating_stats_cache_ttl: int = Field(default=60)  # сек
+    search_max_limit: int = Field(default=50)  # результатов поиска профилей
+    bulk_create_max_size: int = Field(default=1000)  # профилей в bulk запросе
     enable_hawk: bool = Field(default=True)
     encryption_key: str = Field(
         default="mFb4xclONMT0TTIcuAmTQpVNh4ibHyvhSpmHUK-vJrI="
@@ -49,6 +71,10 @@ class ContactConfig(BaseSettings):
 
 class RedisData(BaseSettings):
     unix_socket_path: str
+    db: int = Field(default=1)
+    max_connections: int = Field(default=50)  # размер пула воркера
+    pool_timeout: int = Field(default=5)  # сек ожидания свободного соединения
+    health_check_interval: int = Field(default=30)  # сек
 
     model_config = ConfigDict(  # type: ignore
         env_prefix="REDIS_",
@@ -130,10 +156,40 @@ class HawkConfig(BaseSettings):
     )
 
 
+class CacheConfig(BaseSettings):
+    stale_ttl: int = Field(default=0)  # сек отдачи устаревшего значения
+    early_refresh_beta: float = Field(default=1.0)  # 0 - выключено
+    use_lock: bool = Field(default=False)  # Redis lock между воркерами
+    lock_timeout: float = Field(default=5.0)  # сек
+    lock_poll_interval: float = Field(default=0.05)  # сек
+    negative_ttl: int = Field(default=30)  # сек хранения "не найдено"
+
+    model_config = ConfigDict(  # type: ignore
+        env_prefix="CACHE_",
+        envenv_file=".conn.env",
+    )
+
+
+class HttpClientConfig(BaseSettings):
+    limit: int = Field(default=100)  # всего соединений в пуле
+    limit_per_host: int = Field(default=30)
+    keepalive_timeout: int = Field(default=30)  # сек
+    dns_cache_ttl: int = Field(default=300)  # сек
+    total_timeout: int = Field(default=30)  # сек
+    connect_timeout: int = Field(default=5)  # сек
+
+    model_config = ConfigDict(  # type: ignore
+        env_prefix="HTTP_CLIENT_",
+        envenv_file=".conn.env",
+    )
+
+
 hawk_data: HawkConfig = HawkConfig()
 logstash_data: LogstashConfig = LogstashConfig()
 psql_data: PsqlData = PsqlData()
 redis_data: RedisData = RedisData()  # явная типизация
 rabbitmq_data: RabbitMQData = RabbitMQData()
+http_client_config: HttpClientConfig = HttpClientConfig()
+cache_config: CacheConfig = CacheConfig()
 app_config: AppConfig = AppConfig()
 contact_config: ContactConfig = ContactConfig()
\ No newline at end of file
@@ -6,5 +6,6 @@ class Base(DeclarativeBase):
 
 
 from .favorites import Favorite
+from .movie_rating_stats import MovieRatingStats
 from .profiles import Profile
 from .reviews import Review
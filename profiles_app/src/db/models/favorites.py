@@ -6,6 +6,7 @@ from sqlalchemy import (
     CheckConstraint,
     DateTime,
     ForeignKey,
+    Index,
     Text,
     UniqueConstraint,
 )
@@ -23,6 +24,14 @@ class Favorite(Base, UUIDMixin, TimeStampedMixin):
             "self_rating >= 1 AND self_rating <= 10",
             name="check_self_rating_range",
         ),
+        # keyset пагинация списка избранного
+        Index("ix_favorites_created_at_id", "created_at", "id"),
+        Index(
+            "ix_favorites_profile_id_created_at_id",
+            "profile_id",
+            "created_at",
+            "id",
+        ),
     )
     profile_id: Mapped[UUID] = mapped_column(
         UUID,
@@ -50,6 +59,4 @@ class Favorite(Base, UUIDMixin, TimeStampedMixin):
     #     "FavoriteTags", back_populates="favorite", lazy="selectin"
     # )
 
-    profile = relationship(
-        "Profile", back_populates="favorites", lazy="selectin"
-    )
+    profile = relationship("Profile", back_populates="favorites", lazy="raise")
@@ -0,0 +1,29 @@
+from sqlalchemy import UUID, BigInteger, Integer
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Mapped, mapped_column
+
+from . import Base
+
+RATINGS = range(1, 11)  # допустимые значения Review.rating
+
+
+class MovieRatingStats(Base):
+    """
+    Агрегаты рейтинга отзывов фильма.
+    Поддерживаются триггером reviews_rating_stats(см. миграции) на
+    вставку/изменение/удаление reviews, в т.ч. каскадное и из админки.
+    """
+
+    __tablename__ = "movie_rating_stats"
+
+    movie_id: Mapped[UUID] = mapped_column(UUID, primary_key=True)
+    reviews_count: Mapped[int] = mapped_column(
+        Integer, default=0, nullable=False
+    )
+    rating_sum: Mapped[int] = mapped_column(
+        BigInteger, default=0, nullable=False
+    )
+    # histogram[i - 1] - количество отзывов с рейтингом i
+    histogram: Mapped[list[int]] = mapped_column(
+        ARRAY(Integer), default=lambda: [0] * len(RATINGS), nullable=False
+    )
@@ -1,21 +1,39 @@
 from datetime import datetime, timezone
+from typing import Iterable
 
-from cryptography.fernet import Fernet
-from cryptography.hazmat.backends import default_backend
-from cryptography.hazmat.primitives import hashes, hmac
-from sqlalchemy import UUID, DateTime, String, event
+from sqlalchemy import UUID, DateTime, Index, String, event
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from profiles_app.src.core.config import app_config
+from profiles_app.src.utils.phone_crypto import (
+    decrypt_phone,
+    decrypt_phones,
+    encrypt_phone,
+    phone_hmac,
+)
 
 from . import Base
 from .mixins import TimeStampedMixin, UUIDMixin
 
-cipher_suite = Fernet(app_config.encryption_key)
-
 
 class Profile(Base, UUIDMixin, TimeStampedMixin):
     __tablename__ = "profiles"
+    __table_args__ = (
+        # keyset пагинация списка профилей
+        Index("ix_profiles_updated_at_id", "updated_at", "id"),
+        # поиск по имени(pg_trgm), индекс полного имени - в миграции.
+        Index(
+            "ix_profiles_first_name_trgm",
+            "first_name",
+            postgresql_using="gin",
+            postgresql_ops={"first_name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_profiles_last_name_trgm",
+            "last_name",
+            postgresql_using="gin",
+            postgresql_ops={"last_name": "gin_trgm_ops"},
+        ),
+    )
     user_id: Mapped[UUID] = mapped_column(UUID, index=True, unique=True)
     _phone_number: Mapped[str | None] = mapped_column(
         "phone_number", String, nullable=True
@@ -34,17 +52,34 @@ class Profile(Base, UUIDMixin, TimeStampedMixin):
         nullable=False,
     )
 
+    # не загружаются неявно: нужные запросы указывают selectinload.
+    # passive_deletes - удаление каскадом в БД(ondelete="CASCADE").
     favorites = relationship(
-        "Favorite", back_populates="profile", lazy="selectin"
+        "Favorite",
+        back_populates="profile",
+        lazy="raise",
+        passive_deletes=True,
+    )
+    reviews = relationship(
+        "Review",
+        back_populates="profile",
+        lazy="raise",
+        passive_deletes=True,
     )
-    reviews = relationship("Review", back_populates="profile", lazy="selectin")
 
     @property
     def phone_number(self) -> str | None:
-        """Дешифрует тел.номер при получении."""
+        """
+        Дешифрует тел.номер при первом получении,
+        результат хранится в объекте до изменения шифра.
+        """
         if self._phone_number is None:
             return None
-        return cipher_suite.decrypt(self._phone_number.encode()).decode()
+        cached = getattr(self, "_phone_cache", None)
+        if cached is None or cached[0] != self._phone_number:
+            cached = (self._phone_number, decrypt_phone(self._phone_number))
+            self._phone_cache = cached
+        return cached[1]
 
     @phone_number.setter
     def phone_number(self, value: str | None):
@@ -52,14 +87,29 @@ class Profile(Base, UUIDMixin, TimeStampedMixin):
             self._phone_number = None
             self._phone_hmac = None
         else:
-            self._phone_number = cipher_suite.encrypt(value.encode()).decode()
-            h = hmac.HMAC(
-                app_config.hmac_key.encode(),
-                hashes.SHA256(),
-                backend=default_backend(),
+            self._phone_number = encrypt_phone(value)
+            self._phone_hmac = phone_hmac(value)
+            self._phone_cache = (self._phone_number, value)
+
+    @classmethod
+    def decrypt_phones(cls, profiles: Iterable["Profile"]) -> None:
+        """
+        Пакетная дешифрация номеров группы профилей(страница списка),
+        дальше phone_number берется из кеша объекта.
+        """
+        profiles = [
+            profile
+            for profile in profiles
+            if profile._phone_number is not None
+            and getattr(profile, "_phone_cache", (None,))[0]
+            != profile._phone_number
+        ]
+        phones = decrypt_phones(profile._phone_number for profile in profiles)
+        for profile in profiles:
+            profile._phone_cache = (
+                profile._phone_number,
+                phones[profile._phone_number],  # type: ignore
             )
-            h.update(value.encode())
-            self._phone_hmac = h.finalize().hex()
 
     @property
     def full_name(self) -> str:
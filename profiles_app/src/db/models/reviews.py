@@ -5,6 +5,7 @@ from sqlalchemy import (
     CheckConstraint,
     DateTime,
     ForeignKey,
+    Index,
     Text,
     UniqueConstraint,
 )
@@ -23,6 +24,14 @@ class Review(Base, UUIDMixin, TimeStampedMixin):
         CheckConstraint(
             "rating >= 1 AND rating <= 10", name="check_rating_range"
         ),
+        # keyset пагинация списка отзывов
+        Index("ix_reviews_created_at_id", "created_at", "id"),
+        Index(
+            "ix_reviews_movie_id_created_at_id",
+            "movie_id",
+            "created_at",
+            "id",
+        ),
     )
     profile_id: Mapped[UUID] = mapped_column(
         UUID,
@@ -43,4 +52,4 @@ class Review(Base, UUIDMixin, TimeStampedMixin):
         nullable=False,
     )
 
-    profile = relationship("Profile", back_populates="reviews", lazy="selectin")
+    profile = relationship("Profile", back_populates="reviews", lazy="raise")
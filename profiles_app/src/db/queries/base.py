@@ -1,12 +1,117 @@
+from typing import Any
+
+from sqlalchemy import ColumnElement, Select, func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from profiles_app.src.core.config import app_config
+from profiles_app.src.db.sessions import async_session
+from profiles_app.src.services.cache_service import RedisCacheService
+
 
 class BaseQueryService:
-    """Базовый класс запросов в БД."""
+    """
+    Базовый класс запросов в БД.
+    cache_service(необязательный) - кеш результатов запросов.
+    """
 
-    def __init__(self, session: AsyncSession):
+    def __init__(
+        self,
+        session: AsyncSession,
+        cache_service: RedisCacheService | None = None,
+    ):
         self.session = session
+        self.cache_service = cache_service
 
     async def get_by_id(self, obj_id: int) -> None:
         """Получение объекта по id. Переопределен в наследниках."""
         pass
+
+    async def _page_with_total(
+        self,
+        model: Any,
+        query: Select,
+        where: ColumnElement | None,
+        filter_key: dict,
+        cursor: str | None = None,
+    ) -> tuple[list, int, bool]:
+        """
+        Страница списка и общее количество объектов.
+        Возвращает (объекты, количество, количество точное).
+        Количество по app_config.list_count_strategy:
+            exact - отдельный COUNT(*) с тем же фильтром.
+            window - COUNT(*) OVER() в запросе страницы, с cursor -> exact.
+            cached - COUNT(*) из кеша по filter_key,
+                сбрасывается при создании/удалении(_invalidate_count).
+            estimate - оценка планировщика(pg_class.reltuples)
+                для списка без фильтров, с фильтрами -> cached.
+        """
+        strategy = app_config.list_count_strategy
+        if strategy == "window" and not cursor:
+            rows = (
+                await self.session.execute(
+                    query.add_columns(func.count().over())
+                )
+            ).all()
+            if rows:
+                return [row[0] for row in rows], rows[0][1], True
+            return [], await self._exact_count(model, where), True
+
+        items = list((await self.session.execute(query)).scalars().all())
+        if strategy == "estimate" and where is None:
+            estimate = await self.session.scalar(
+                text(
+                    "SELECT reltuples::bigint FROM pg_class "
+                    "WHERE oid = CAST(:table AS regclass)"
+                ),
+                {"table": model.__tablename__},
+            )
+            # -1 - таблица еще не анализировалась.
+            if estimate is not None and estimate >= 0:
+                return items, estimate, False
+        if strategy in ("cached", "estimate") and self.cache_service:
+            total = await self._cached_count(model, where, filter_key)
+        else:
+            total = await self._exact_count(model, where)
+        return items, total, True
+
+    async def _exact_count(
+        self,
+        model: Any,
+        where: ColumnElement | None,
+        session: AsyncSession | None = None,
+    ) -> int:
+        query = select(func.count()).select_from(model)
+        if where is not None:
+            query = query.where(where)
+        return await (session or self.session).scalar(query) or 0
+
+    async def _cached_count(
+        self, model: Any, where: ColumnElement | None, filter_key: dict
+    ) -> int:
+        key = await self.cache_service.make_cache_key(  # type: ignore
+            namespace=f"{model.__tablename__}:count", **filter_key
+        )
+
+        async def load() -> int:
+            # может выполняться в фоне(stale-while-revalidate) после
+            # завершения запроса - в своей сессии, не в сессии запроса
+            async with async_session() as session:
+                return await self._exact_count(model, where, session)
+
+        count = await self.cache_service.get_or_load(  # type: ignore
+            key,
+            load,
+            encode=str,
+            decode=int,
+            ex=app_config.list_count_cache_ttl,
+        )
+        return count or 0  # 0 кешируется как NEGATIVE -> None
+
+    async def _invalidate_count(self, *models: Any) -> None:
+        """Сброс кешированных количеств списков(создание/удаление)."""
+        if self.cache_service is None:
+            return
+        for model in models:
+            await self.cache_service.invalidate_namespace(
+                f"{model.__tablename__}:count"
+            )
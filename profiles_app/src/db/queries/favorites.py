@@ -13,6 +13,7 @@ from profiles_app.src.schemas.entity import (
 )
 
 from .base import BaseQueryService
+from .pagination import keyset_page, next_cursor
 
 
 class FavoriteQueryService(BaseQueryService):
@@ -37,6 +38,7 @@ class FavoriteQueryService(BaseQueryService):
         self.session.add(favorite)
         await self.session.commit()
         await self.session.refresh(favorite)
+        await self._invalidate_count(Favorite)
         return favorite
 
     async def is_exists(self, profile_id: UUID, movie_id: UUID) -> bool:
@@ -78,6 +80,7 @@ class FavoriteQueryService(BaseQueryService):
         """Удаление записи из избранного"""
         await self.session.delete(favorite)
         await self.session.commit()
+        await self._invalidate_count(Favorite)
         return True
 
     async def get_list(
@@ -87,6 +90,7 @@ class FavoriteQueryService(BaseQueryService):
         page_number: int = 1,
         page_size: int = 10,
         order: str = "desc",
+        cursor: str | None = None,
     ) -> FavoriteListResponse:
         """Получение списка избранного с фильтрацией и пагинацией"""
         if page_number < 1 or page_size < 1:
@@ -103,29 +107,30 @@ class FavoriteQueryService(BaseQueryService):
         if movie_id:
             filters.append(Favorite.movie_id == movie_id)
 
-        if filters:
-            query = query.where(or_(*filters))
+        where = or_(*filters) if filters else None
+        if where is not None:
+            query = query.where(where)
 
-        if order == "asc":
-            query = query.order_by(Favorite.created_at.asc())
-        else:
-            query = query.order_by(Favorite.created_at.desc())
-
-        offset = (page_number - 1) * page_size
-        query = query.offset(offset).limit(page_size)
-
-        result = await self.session.execute(query)
-        favorites: list[Favorite] = result.scalars().all()
-
-        count_query = select(func.count()).select_from(Favorite)
-        if filters:
-            count_query = count_query.where(or_(*filters))
-        total = await self.session.scalar(count_query)
+        query = keyset_page(
+            query, Favorite.created_at, Favorite.id, order, page_size, cursor
+        )
+        if not cursor:
+            query = query.offset((page_number - 1) * page_size)
+
+        favorites, total, total_is_exact = await self._page_with_total(
+            Favorite,
+            query,
+            where,
+            {"profile_id": profile_id, "movie_id": movie_id},
+            cursor,
+        )
 
         return FavoriteListResponse(
             total_count=total,
+            total_is_exact=total_is_exact,
             page_number=page_number,
             page_size=page_size,
             sort_order=order,
+            next_cursor=next_cursor(favorites, "created_at", page_size),
             favorites=favorites,
         )
@@ -0,0 +1,66 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Sequence
+
+from sqlalchemy import Select, literal, tuple_
+from sqlalchemy.orm import InstrumentedAttribute
+
+
+def encode_cursor(sort_value: datetime, obj_id: Any) -> str:
+    """Непрозрачный курсор: позиция последнего объекта страницы."""
+    raw = json.dumps([sort_value.isoformat(), str(obj_id)])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """Позиция из курсора, ValueError - если курсор поврежден."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        sort_value, obj_id = json.loads(raw)
+        return datetime.fromisoformat(sort_value), obj_id
+    except (binascii.Error, ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+
+
+def keyset_page(
+    query: Select,
+    sort_column: InstrumentedAttribute,
+    id_column: InstrumentedAttribute,
+    order: str | None,
+    page_size: int,
+    cursor: str | None = None,
+) -> Select:
+    """
+    Страница, отсортированная по (sort_column, id_column).
+    С cursor - keyset пагинация: WHERE (sort, id) </> позиции курсора,
+    стоимость не зависит от глубины страницы(индекс (sort, id)).
+    Без cursor - первая страница, offset добавляет вызывающий.
+    """
+    if order == "asc":
+        query = query.order_by(sort_column.asc(), id_column.asc())
+    else:
+        query = query.order_by(sort_column.desc(), id_column.desc())
+
+    if cursor:
+        sort_value, obj_id = decode_cursor(cursor)
+        position = tuple_(sort_column, id_column)
+        bound = tuple_(
+            literal(sort_value, sort_column.type),
+            literal(id_column.type.python_type(obj_id), id_column.type),
+        )
+        query = query.where(
+            position > bound if order == "asc" else position < bound
+        )
+    return query.limit(page_size)
+
+
+def next_cursor(
+    items: Sequence[Any], sort_field: str, page_size: int | None
+) -> str | None:
+    """Курсор следующей страницы, None - если страница последняя."""
+    if not items or page_size is None or len(items) < page_size:
+        return None
+    last = items[-1]
+    return encode_cursor(getattr(last, sort_field), last.id)
@@ -1,26 +1,44 @@
 from uuid import UUID
 
-from cryptography.fernet import Fernet
-from cryptography.hazmat.backends import default_backend
-from cryptography.hazmat.primitives import hashes, hmac
-from sqlalchemy import func, or_, select
+from sqlalchemy import func, literal_column, or_, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncResult
 
-from profiles_app.src.core.config import app_config
+from profiles_app.src.db.models.favorites import Favorite
 from profiles_app.src.db.models.profiles import Profile
+from profiles_app.src.db.models.reviews import Review
 from profiles_app.src.schemas.entity import (
     ProfileCreate,
     ProfileList,
+    ProfileListItem,
     ProfileListResponse,
+    ProfileSearchResult,
 )
+from profiles_app.src.utils.phone_crypto import phone_hmac
 
 from .base import BaseQueryService
+from .pagination import keyset_page, next_cursor
+
+# Совпадает с выражением индекса ix_profiles_full_name_trgm(см. миграции),
+# константы в тексте запроса, иначе индекс не используется.
+FULL_NAME = literal_column(
+    "(coalesce(first_name, '') || ' ' || coalesce(last_name, ''))"
+)
 
-cipher_suite = Fernet(app_config.encryption_key)
+
+def escape_like(value: str) -> str:
+    """Экранирование спецсимволов LIKE во вводе пользователя."""
+    return (
+        value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    )
 
 
 class ProfileQueryService(BaseQueryService):
-    """CRUD для модели Profile."""
+    """
+    CRUD для модели Profile.
+    С cache_service отсутствие профиля у user_id кешируется
+    (cache_config.negative_ttl), сбрасывается при создании профиля.
+    """
 
     async def get_by_id(self, profile_id: UUID) -> Profile | None:
         """Получить профиль по id профиля."""
@@ -30,9 +48,30 @@ class ProfileQueryService(BaseQueryService):
 
     async def get_by_user_id(self, user_id: UUID) -> Profile | None:
         """Получить профиль по user_id."""
+        key = self._no_profile_key(user_id)
+        if key and await self.cache_service.is_negative(key):  # type: ignore
+            return None
         query = select(Profile).where(Profile.user_id == user_id)
         result: AsyncResult = await self.session.execute(query)
-        return result.scalars().first()
+        profile = result.scalars().first()
+        if key and not profile:
+            await self.cache_service.put_negative(key)  # type: ignore
+        return profile
+
+    async def get_id_by_user_id(self, user_id: UUID) -> UUID | None:
+        """
+        Только id профиля по user_id(проверки прав в избранном/отзывах):
+        один столбец по уникальному индексу, без загрузки модели.
+        """
+        key = self._no_profile_key(user_id)
+        if key and await self.cache_service.is_negative(key):  # type: ignore
+            return None
+        profile_id = await self.session.scalar(
+            select(Profile.id).where(Profile.user_id == user_id)
+        )
+        if key and not profile_id:
+            await self.cache_service.put_negative(key)  # type: ignore
+        return profile_id
 
     async def create_profile(self, profile_data: ProfileCreate) -> Profile:
         """
@@ -49,8 +88,52 @@ class ProfileQueryService(BaseQueryService):
         self.session.add(profile)
         await self.session.commit()
         await self.session.refresh(profile)
+        if key := self._no_profile_key(profile.user_id):
+            await self.cache_service.delete_from_cache(key)  # type: ignore
+        await self._invalidate_count(Profile)
         return profile
 
+    async def create_profiles_bulk(
+        self, profiles_data: list[ProfileCreate]
+    ) -> list[UUID]:
+        """
+        Пакетное создание профилей одним INSERT ... ON CONFLICT DO NOTHING.
+        Существующие(user_id/телефон) пропускаются, повтор пакета безопасен.
+        Возвращает user_id созданных профилей.
+        """
+        rows = []
+        for profile_data in profiles_data:
+            # сеттер модели шифрует телефон и считает HMAC.
+            profile = Profile(
+                user_id=profile_data.user_id,
+                phone_number=profile_data.phone_number,
+                first_name=profile_data.first_name,
+                last_name=profile_data.last_name,
+            )
+            rows.append(
+                {
+                    "user_id": profile.user_id,
+                    "_phone_number": profile._phone_number,
+                    "_phone_hmac": profile._phone_hmac,
+                    "first_name": profile.first_name,
+                    "last_name": profile.last_name,
+                }
+            )
+        query = (
+            insert(Profile)
+            .on_conflict_do_nothing()
+            .returning(Profile.user_id)
+        )
+        result = await self.session.scalars(query, rows)
+        created = list(result.all())
+        await self.session.commit()
+        if self.cache_service is not None and created:
+            await self.cache_service.conn.delete(  # type: ignore
+                *[self._no_profile_key(user_id) for user_id in created]
+            )
+        await self._invalidate_count(Profile)
+        return created
+
     async def update_profile(
         self,
         profile_id: UUID,
@@ -90,9 +173,17 @@ class ProfileQueryService(BaseQueryService):
         if profile:
             await self.session.delete(profile)
             await self.session.commit()
+            # каскадно удалены избранное и отзывы профиля.
+            await self._invalidate_count(Profile, Favorite, Review)
             return True
         return False
 
+    def _no_profile_key(self, user_id: UUID) -> str | None:
+        """Ключ "у user_id нет профиля", None - кеш не используется."""
+        if self.cache_service is None:
+            return None
+        return self.cache_service.make_obj_key("no_profile", user_id)
+
     async def is_user_exists(self, user_id: UUID) -> bool:
         """Проверка существования профиля по user_id."""
         query = select(Profile).where(Profile.user_id == user_id)
@@ -104,14 +195,9 @@ class ProfileQueryService(BaseQueryService):
         Проверка существования phone_number (с учетом шифрования).
         Использует проверку через хэши.
         """
-        h = hmac.HMAC(
-            app_config.hmac_key.encode(),
-            hashes.SHA256(),
-            backend=default_backend(),
+        query = select(Profile).where(
+            Profile._phone_hmac == phone_hmac(phone_number)
         )
-        h.update(phone_number.encode())
-        target_hmac = h.finalize().hex()
-        query = select(Profile).where(Profile._phone_hmac == target_hmac)
         result = await self.session.execute(query)
         return bool(result.scalar_one_or_none())
 
@@ -122,42 +208,102 @@ class ProfileQueryService(BaseQueryService):
         order: str = "desc",
         first_name: str | None = None,
         last_name: str | None = None,
+        cursor: str | None = None,
+        fields: set[str] | None = None,
     ) -> dict:
         """
         Возвращает список профилей
         с пагинацией, фильтрацией и сортировкой.
+        fields - необязательные поля(phone_number), номера страницы
+        дешифруются одним пакетом, только если запрошены.
         """
         query = select(Profile)
+        where = None
         if first_name or last_name:
             filters = []
             if first_name:
                 filters.append(Profile.first_name.ilike(f"%{first_name}%"))
             if last_name:
                 filters.append(Profile.last_name.ilike(f"%{last_name}%"))
-            query = query.where(or_(*filters))
-
-        if order == "asc":
-            query = query.order_by(Profile.updated_at.asc())
-        else:
-            query = query.order_by(Profile.updated_at.desc())
+            where = or_(*filters)
+            query = query.where(where)
 
-        offset = (page_number - 1) * page_size
-        query = query.offset(offset).limit(page_size)
-
-        result = await self.session.execute(query)
-        profiles = result.scalars().all()
+        query = keyset_page(
+            query, Profile.updated_at, Profile.id, order, page_size, cursor
+        )
+        if not cursor:
+            query = query.offset((page_number - 1) * page_size)
 
-        count_query = select(func.count()).select_from(Profile)
-        if first_name or last_name:
-            count_query = count_query.where(or_(*filters))
-        total = await self.session.scalar(count_query)
+        profiles, total, total_is_exact = await self._page_with_total(
+            Profile,
+            query,
+            where,
+            {"first_name": first_name, "last_name": last_name},
+            cursor,
+        )
 
-        profiles_data = [ProfileList.from_orm(profile) for profile in profiles]
+        fields = fields or set()
+        if "phone_number" in fields:
+            Profile.decrypt_phones(profiles)
+        profiles_data = [
+            ProfileListItem.from_orm(profile, include=fields)
+            for profile in profiles
+        ]
 
         return ProfileListResponse(
             total_count=total,
+            total_is_exact=total_is_exact,
             page_number=page_number,
             page_size=page_size,
             sort_order=order,
+            next_cursor=next_cursor(profiles_data, "updated_at", page_size),
             profiles=profiles_data,
         )
+
+    async def search(
+        self, query: str, limit: int = 10
+    ) -> list[ProfileSearchResult]:
+        """
+        Поиск профилей по имени и фамилии с опечатками(pg_trgm).
+        Отбор - оператор % по индексу ix_profiles_full_name_trgm,
+        сортировка - по убыванию сходства(similarity).
+        """
+        score = func.similarity(FULL_NAME, query).label("score")
+        result = await self.session.execute(
+            select(Profile, score)
+            .where(FULL_NAME.op("%")(query))
+            .order_by(score.desc(), Profile.id)
+            .limit(limit)
+        )
+        return [
+            ProfileSearchResult.model_validate(
+                {**ProfileList.from_orm(profile).model_dump(), "score": score}
+            )
+            for profile, score in result.all()
+        ]
+
+    async def autocomplete(
+        self, prefix: str, limit: int = 10
+    ) -> list[ProfileSearchResult]:
+        """
+        Подсказки: профили, имя или фамилия которых начинается с prefix.
+        ILIKE 'prefix%' обслуживается trgm индексами first_name/last_name.
+        """
+        pattern = f"{escape_like(prefix)}%"
+        result = await self.session.execute(
+            select(Profile)
+            .where(
+                or_(
+                    Profile.first_name.ilike(pattern),
+                    Profile.last_name.ilike(pattern),
+                )
+            )
+            .order_by(Profile.last_name, Profile.first_name, Profile.id)
+            .limit(limit)
+        )
+        return [
+            ProfileSearchResult.model_validate(
+                ProfileList.from_orm(profile).model_dump()
+            )
+            for profile in result.scalars().all()
+        ]
@@ -2,17 +2,22 @@ from http import HTTPStatus
 from uuid import UUID
 
 from fastapi import HTTPException
-from sqlalchemy import func, or_, select
+from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncResult
 
+from profiles_app.src.core.config import app_config
+from profiles_app.src.db.models.movie_rating_stats import MovieRatingStats
 from profiles_app.src.db.models.reviews import Review
+from profiles_app.src.db.sessions import async_session
 from profiles_app.src.schemas.entity import (
+    MovieRatingStatsView,
     ReviewCreate,
     ReviewListResponse,
     ReviewUpdate,
 )
 
 from .base import BaseQueryService
+from .pagination import keyset_page, next_cursor
 
 
 class ReviewQueryService(BaseQueryService):
@@ -37,6 +42,8 @@ class ReviewQueryService(BaseQueryService):
         self.session.add(review)
         await self.session.commit()
         await self.session.refresh(review)
+        await self._invalidate_count(Review)
+        await self._invalidate_rating_stats(review.movie_id)
         return review
 
     async def update_review(
@@ -60,14 +67,42 @@ class ReviewQueryService(BaseQueryService):
 
         await self.session.commit()
         await self.session.refresh(review)
+        await self._invalidate_rating_stats(review.movie_id)
         return review
 
     async def delete_review(self, review: Review) -> bool:
         """Удаление отзыва."""
         await self.session.delete(review)
         await self.session.commit()
+        await self._invalidate_count(Review)
+        await self._invalidate_rating_stats(review.movie_id)
         return True
 
+    async def get_rating_stats(
+        self, movie_id: UUID
+    ) -> MovieRatingStatsView | None:
+        """
+        Агрегаты рейтинга фильма(movie_rating_stats) с кешированием.
+        Один запрос по первичному ключу вместо AVG() по отзывам.
+        """
+
+        async def load() -> MovieRatingStatsView | None:
+            # своя сессия: загрузка может выполняться в фоне
+            async with async_session() as session:
+                stats = await session.get(MovieRatingStats, movie_id)
+                if stats is None:
+                    return None
+                return MovieRatingStatsView.model_validate(stats)
+
+        if self.cache_service is None:
+            return await load()
+        return await self.cache_service.get_or_load_obj(  # type: ignore
+            self._rating_stats_key(movie_id),
+            MovieRatingStatsView,
+            load,
+            app_config.rating_stats_cache_ttl,
+        )
+
     async def get_list(
         self,
         profile_id: UUID | None = None,
@@ -75,6 +110,7 @@ class ReviewQueryService(BaseQueryService):
         page_number: int = 1,
         page_size: int = 10,
         order: str = "desc",
+        cursor: str | None = None,
     ) -> ReviewListResponse:
         """
         Получение списка отзывов с фильтрацией, сортировкой и пагинацией.
@@ -93,37 +129,47 @@ class ReviewQueryService(BaseQueryService):
         if movie_id:
             filters.append(Review.movie_id == movie_id)
 
-        if filters:
-            query = query.where(or_(*filters))
-
-        if order == "asc":
-            query = query.order_by(Review.created_at.asc())
-        else:
-            query = query.order_by(Review.created_at.desc())
-
-        offset = (page_number - 1) * page_size
-        query = query.offset(offset).limit(page_size)
+        where = or_(*filters) if filters else None
+        if where is not None:
+            query = query.where(where)
 
-        result = await self.session.execute(query)
-        reviews: list[Review] = result.scalars().all()
-
-        count_query = select(func.count()).select_from(Review)
-        if filters:
-            count_query = count_query.where(or_(*filters))
-        total = await self.session.scalar(count_query)
+        query = keyset_page(
+            query, Review.created_at, Review.id, order, page_size, cursor
+        )
+        if not cursor:
+            query = query.offset((page_number - 1) * page_size)
+
+        reviews, total, total_is_exact = await self._page_with_total(
+            Review,
+            query,
+            where,
+            {"profile_id": profile_id, "movie_id": movie_id},
+            cursor,
+        )
 
-        average_rating: float | None = None
+        stats = None
         if movie_id is not None:
-            avg_query = select(func.avg(Review.rating))
-            if filters:
-                avg_query = avg_query.where(or_(*filters))
-            average_rating = await self.session.scalar(avg_query)
+            stats = await self.get_rating_stats(movie_id)
 
         return ReviewListResponse(
             total_count=total,
+            total_is_exact=total_is_exact,
             page_number=page_number,
             page_size=page_size,
             sort_order=order,
+            next_cursor=next_cursor(reviews, "created_at", page_size),
             reviews=reviews,
-            average_rating=average_rating,
+            average_rating=stats.average_rating if stats else None,
+            rating_distribution=stats.distribution if stats else None,
+        )
+
+    async def _invalidate_rating_stats(self, movie_id: UUID) -> None:
+        if self.cache_service is not None:
+            await self.cache_service.delete_from_cache(
+                self._rating_stats_key(movie_id)
+            )
+
+    def _rating_stats_key(self, movie_id: UUID) -> str:
+        return self.cache_service.make_obj_key(  # type: ignore
+            "movie_rating", movie_id
         )
@@ -1,3 +1,4 @@
+import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import Depends, FastAPI, Request
@@ -6,10 +7,16 @@ from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from profiles_app.src.middleware import HawkMiddleware, before_request
 from profiles_app.src.services.access_service import security_jwt
+from profiles_app.src.services.http_session import (
+    close_http_session,
+    init_http_session,
+)
+from profiles_app.src.services.mailer import mailer
+from profiles_app.src.services.revocation_service import revoked_tokens
 
-from .api.v1 import favorites, profiles, reviews
+from .api.v1 import favorites, profiles, reviews, stats
 from .core import config
-from .db.redis import get_redis
+from .db.redis import close_redis, init_redis
 from .hawk import init_hawk
 from .exceptions import http_exception_handler
 
@@ -17,15 +24,25 @@ from .exceptions import http_exception_handler
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Жизненный цикл приложения."""
-    redis = await get_redis()
+    await init_redis()
+    await init_http_session()
     if config.app_config.enable_hawk:
         app.state.hawk = init_hawk()
     else:
         app.state.hawk = None
+    revoked_sync = None
+    if config.app_config.auth_verify_mode == "local":
+        revoked_sync = asyncio.create_task(
+            revoked_tokens.run(config.app_config.revoked_sync_interval)
+        )
     try:
         yield
     finally:
-        await redis.aclose()
+        if revoked_sync:
+            revoked_sync.cancel()
+        await close_http_session()
+        await mailer.close()
+        await close_redis()
 
 
 app = FastAPI(
@@ -64,3 +81,10 @@ app.include_router(
     tags=["reviews"],
     dependencies=[Depends(security_jwt)],
 )
+
+app.include_router(
+    stats.router,
+    prefix="/api/v1/stats",
+    tags=["stats"],
+    dependencies=[Depends(security_jwt)],
+)
@@ -31,6 +31,17 @@ class ProfileCreate(ProfileBase):
     last_name: str = Field(..., title="Фамилия.")
 
 
+class ProfileBulkCreate(BaseModel):
+    """Схема пакетного создания профилей(регистрации из auth_app)."""
+
+    profiles: list[ProfileCreate] = Field(..., min_length=1)
+
+
+class ProfileBulkCreateResponse(BaseModel):
+    created: list[UUID] = Field(..., title="user_id созданных профилей.")
+    skipped: int = Field(..., title="Уже существующих(пропущено).")
+
+
 class ProfileUpdate(ProfileUserNames):
     """Схема для обновления профиля(имя/фамилия)."""
 
@@ -66,9 +77,16 @@ class BaseListResponse(BaseModel):
     total_count: int = Field(
         default=0, description="Общее количество объектов в БД"
     )
+    total_is_exact: bool = Field(
+        default=True, description="False - total_count приблизительный"
+    )
     page_number: int | None = None
     page_size: int | None = None
     sort_order: str | None = None
+    next_cursor: str | None = Field(
+        default=None,
+        description="Курсор следующей страницы, None - страница последняя",
+    )
 
 
 class ProfileList(OrmConverterMixin, BaseModel):
@@ -82,8 +100,18 @@ class ProfileList(OrmConverterMixin, BaseModel):
     updated_at: datetime = Field(..., title="Обновление")
 
 
+class ProfileListItem(ProfileList):
+    """Профиль списка, phone_number - только если запрошен(fields)."""
+
+    phone_number: str | None = Field(None, title="Контактный номер.")
+
+
+class ProfileSearchResult(ProfileList):
+    score: float | None = Field(None, title="Сходство с запросом(0..1).")
+
+
 class ProfileListResponse(BaseListResponse):
-    profiles: list[ProfileList] = Field(
+    profiles: list[ProfileListItem] = Field(
         ..., description="Список профилей на текущей странице"
     )
 
@@ -155,10 +183,35 @@ class ReviewListView(OrmConverterMixin, ReviewView):
     pass
 
 
+class MovieRatingStatsView(BaseModel):
+    movie_id: UUID = Field(..., title="ID фильма.")
+    reviews_count: int = Field(0, title="Количество отзывов.")
+    rating_sum: int = Field(0, title="Сумма рейтингов.")
+    histogram: list[int] = Field(
+        default_factory=list, title="Количество отзывов по рейтингам 1..10."
+    )
+
+    class Config:
+        from_attributes = True
+
+    @property
+    def average_rating(self) -> float | None:
+        if not self.reviews_count:
+            return None
+        return self.rating_sum / self.reviews_count
+
+    @property
+    def distribution(self) -> dict[int, int]:
+        return dict(enumerate(self.histogram, start=1))
+
+
 class ReviewListResponse(BaseListResponse):
     average_rating: float | None = Field(
         None, description="Средний рейтинг отзывов"
     )
+    rating_distribution: dict[int, int] | None = Field(
+        None, description="Количество отзывов фильма по рейтингам 1..10"
+    )
     reviews: list[ReviewListView] = Field(
         ..., description="Список отзывов на текущей странице"
     )
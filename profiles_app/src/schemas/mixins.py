@@ -1,4 +1,5 @@
 import re
+from typing import Iterable
 
 from pydantic import field_validator
 
@@ -7,8 +8,19 @@ PHONE_NUMBER_PATTERN = re.compile(r"^\+7\(\d{3}\)\d{3}-\d{2}-\d{2}$")
 
 class OrmConverterMixin:
     @classmethod
-    def from_orm(cls, obj):
-        return cls(**{key: getattr(obj, key) for key in cls.__annotations__})
+    def from_orm(cls, obj, include: Iterable[str] = ()):
+        """
+        Схема из атрибутов obj.
+        Необязательные поля(со значением по умолчанию) читаются,
+        только если перечислены в include(phone_number - дешифрация).
+        """
+        return cls(
+            **{
+                name: getattr(obj, name)
+                for name, field in cls.model_fields.items()  # type: ignore
+                if field.is_required() or name in include
+            }
+        )
 
 
 class PhoneValidationMixin:
@@ -1,13 +1,19 @@
+import json
+import time
 from functools import wraps
 from http import HTTPStatus
 from typing import Any, Callable
 
 import aiohttp
+import jwt
 from fastapi import HTTPException, Request
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 from profiles_app.src.core.config import app_config
 from profiles_app.src.models.choices import AccessLevel
+from profiles_app.src.services.cache_service import get_redis_cache_service
+from profiles_app.src.services.http_session import http_session
+from profiles_app.src.services.revocation_service import revoked_tokens
 from profiles_app.src.utils.utils import decode_id, encode_id
 
 
@@ -16,6 +22,16 @@ async def generate_service_token(service_id: str) -> str:
     return await encode_id(service_id)
 
 
+def has_access(
+    request: Request, access_level: AccessLevel, allow_services: bool = False
+) -> bool:
+    """Роль пользователя(или сервис при allow_services) подходит уровню."""
+    if allow_services and getattr(request.state, "is_service", False):
+        return True
+    user_roles = request.state.token_data.get("user_roles", [])
+    return bool(set(access_level.value) & set(user_roles))
+
+
 def access_control(access_level: AccessLevel, allow_services: bool = False):
     """
     Декоратор для контроля доступа.
@@ -27,11 +43,7 @@ def access_control(access_level: AccessLevel, allow_services: bool = False):
         @wraps(func)
         async def wrapper(*args, **kwargs):
             request: Request = kwargs["request"]
-            if allow_services and getattr(request.state, "is_service", False):
-                return await func(*args, **kwargs)
-
-            user_roles = request.state.token_data.get("user_roles", [])
-            if not bool(set(access_level.value) & set(user_roles)):
+            if not has_access(request, access_level, allow_services):
                 raise HTTPException(
                     status_code=HTTPStatus.UNAUTHORIZED, detail="access denied."
                 )
@@ -53,6 +65,11 @@ class JWTBearer(HTTPBearer):
 
     FastAPI при использовании класса HTTPBearer добавит всё
     необходимое для авторизации в Swagger документацию.
+
+    Режим проверки задается app_config.auth_verify_mode:
+        local - подпись и срок жизни токена проверяются на месте,
+            отозванные токены сверяются с revoked_tokens;
+        remote - каждый токен отправляется в auth_app(/auth/checkout).
     """
 
     def __init__(self, auto_error: bool = True):
@@ -91,9 +108,7 @@ class JWTBearer(HTTPBearer):
                 status_code=HTTPStatus.UNAUTHORIZED,
                 detail="Only Bearer token might be accepted",
             )
-        decoded_token = await self.send_token_for_validation(
-            credentials.credentials
-        )
+        decoded_token = await self.verify_token(credentials.credentials)
         if not decoded_token:
             raise HTTPException(
                 status_code=HTTPStatus.FORBIDDEN,
@@ -102,13 +117,79 @@ class JWTBearer(HTTPBearer):
         request.state.token_data = decoded_token
         return decoded_token
 
+    async def verify_token(self, jwt_token: str) -> dict | None:
+        """
+        Проверка access tokena.
+            В режиме remote -> запрос в auth_app.
+            Проверяем подпись и срок жизни, если некорректен -> ошибка.
+            Если токен отозван -> ошибка.
+            Данные пользователя берем из токена, если их нет
+            (токен выпущен до добавления user_data) -> из кеша/auth_app.
+        """
+        if app_config.auth_verify_mode == "remote":
+            return await self.send_token_for_validation(jwt_token)
+
+        claims = self._decode_token(jwt_token)
+        if claims.get("jti") in revoked_tokens:
+            raise HTTPException(
+                status_code=HTTPStatus.UNAUTHORIZED,
+                detail="Token has been revoked.",
+            )
+        if user_data := claims.get("user_data"):
+            return {"user_data": user_data, "user_roles": claims["roles"]}
+        return await self._claims_from_cache(jwt_token, claims)
+
+    def _decode_token(self, jwt_token: str) -> dict:
+        """Проверка подписи и срока жизни access tokena."""
+        try:
+            claims = jwt.decode(
+                jwt_token,
+                app_config.secret_key,
+                algorithms=[app_config.jwt_algorithm],
+            )
+        except jwt.ExpiredSignatureError:
+            raise HTTPException(
+                status_code=HTTPStatus.UNAUTHORIZED,
+                detail="Token has expired.",
+            )
+        except jwt.InvalidTokenError:
+            raise HTTPException(
+                status_code=HTTPStatus.FORBIDDEN,
+                detail="Invalid or expired token.",
+            )
+        if claims.get("type") != "access":
+            raise HTTPException(
+                status_code=HTTPStatus.FORBIDDEN,
+                detail="Only access token might be accepted",
+            )
+        return claims
+
+    async def _claims_from_cache(self, jwt_token: str, claims: dict) -> dict:
+        """
+        Данные пользователя из кеша, если нет -> из auth_app.
+        Храним не дольше claims_cache_ttl и срока жизни токена.
+        """
+        cache_service = await get_redis_cache_service()
+        key = cache_service.make_obj_key("token_claims", claims["jti"])
+        if data := await cache_service.get_from_cache(key):
+            return json.loads(data)
+
+        token_data = await self.send_token_for_validation(jwt_token)
+        ttl = min(
+            app_config.claims_cache_ttl, int(claims["exp"] - time.time())
+        )
+        if token_data and ttl > 0:
+            await cache_service.put_to_cache(
+                key, json.dumps(token_data), ex=ttl
+            )
+        return token_data  # type: ignore
+
     async def send_token_for_validation(self, jwt_token: str) -> dict | None:
         """Отправление access tokena на проверку и дешифровку."""
-        async with aiohttp.ClientSession() as session:
+        async with http_session() as session:
             headers = {"Authorization": f"Bearer {jwt_token}"}
             try:
-                # url = f"{app_config.auth_url}api/v1/auth/checkout"
-                url = "http://auth_app:80/api/v1/auth/checkout"
+                url = f"{app_config.auth_url}api/v1/auth/checkout"
                 async with session.get(url=url, headers=headers) as response:
                     if response.status == 200:
                         return await response.json()
@@ -3,6 +3,7 @@ from typing import Any, Type
 
 import aiohttp
 
+from profiles_app.src.services.http_session import get_http_session
 from profiles_app.src.services.token_manager import TokenManager
 
 
@@ -26,9 +27,14 @@ class APIClient:
         self.base_url = base_url
         self.token_manager = token_manager
         self.session: aiohttp.ClientSession | None = None
+        self._own_session = False
 
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        # общий пул воркера, вне lifespan(dramatiq) -> собственная сессия.
+        self.session = get_http_session()
+        self._own_session = self.session is None
+        if self._own_session:
+            self.session = aiohttp.ClientSession()
         return self
 
     async def __aexit__(
@@ -37,8 +43,9 @@ class APIClient:
         exc: BaseException | None,            # Сам объект исключения.
         tb: TracebackType | None,             # Трассировка стека.
     ) -> bool | None:                         # Возвращает `None` или `bool`.
-        if self.session:
+        if self.session and self._own_session:
             await self.session.close()
+        self.session = None
 
     async def request(self, method: str, endpoint: str, **kwargs) -> Any:
         if not self.session:
@@ -1,4 +1,3 @@
-import json
 import logging
 from http import HTTPStatus
 from logging import config as logging_config
@@ -8,7 +7,6 @@ from fastapi import Depends, HTTPException
 
 from profiles_app.src.core.config import app_config
 from profiles_app.src.core.logger import LOGGING
-from profiles_app.src.db.models.profiles import Profile
 from profiles_app.src.db.queries.favorites import FavoriteQueryService
 from profiles_app.src.db.queries.profiles import ProfileQueryService
 from profiles_app.src.db.sessions import get_session
@@ -23,6 +21,7 @@ from profiles_app.src.services.cache_service import (
     RedisCacheService,
     get_redis_cache_service,
 )
+from profiles_app.src.services.film_data_service import FilmDataService
 from profiles_app.src.services.token_manager import (
     TokenManager,
     get_token_manager,
@@ -44,6 +43,7 @@ class FavoritesService:
         self.profile_query = profile_query_service
         self.cache_service = cache_service
         self.api_client = api_client
+        self.film_data = FilmDataService(cache_service, api_client)
 
     async def create_favorites(
         self, favorite_data: FavoriteCreate, request_user_id: str
@@ -54,28 +54,28 @@ class FavoritesService:
         2. Проверяем наличия профиля с данным user_id
         3. создаем объект Favorite
         """
-        profile: Profile = await self.profile_query.get_by_user_id(
+        profile_id = await self.profile_query.get_id_by_user_id(
             UUID(request_user_id)
         )
-        if not profile:
+        if not profile_id:
             logger.error(f"User {request_user_id} profile does not exist")
             raise HTTPException(
                 status_code=HTTPStatus.NOT_FOUND, detail="Profile not found"
             )
 
         exists = await self.query.is_exists(
-            profile_id=profile.id, movie_id=favorite_data.movie_id
+            profile_id=profile_id, movie_id=favorite_data.movie_id
         )
         if exists:
             raise HTTPException(
                 status_code=HTTPStatus.CONFLICT,
                 detail=(
-                    f"Favorite for profile {profile.id} "
+                    f"Favorite for profile {profile_id} "
                     f"and movie {favorite_data.movie_id} already exists."
                 ),
             )
 
-        favorite = await self.query.create_favorite(favorite_data, profile.id)
+        favorite = await self.query.create_favorite(favorite_data, profile_id)
         return FavoriteView.model_validate(favorite)
 
     async def favorite_by_id(self, favorite_id: UUID) -> FavoriteView:
@@ -88,12 +88,12 @@ class FavoritesService:
             )
 
         # запрос при наличии активного сервиса content_app
-        film_data = await self._get_film_data(favorite.movie_id)
+        film_data = await self.film_data.get(favorite.movie_id)
 
         return FavoriteView(
             **favorite.__dict__,
-            title=film_data.get("title", "Название недоступно"),
-            imdb_rating=film_data.get("imdb_rating"),
+            movie_title=film_data.get("title", "Название недоступно"),
+            movie_imdb_rating=film_data.get("imdb_rating"),
         )
 
     async def update_favorite_by_id(
@@ -103,15 +103,15 @@ class FavoritesService:
         update_data: FavoriteUpdate,
     ) -> FavoriteView:
         """Обновление объекта Избранного по id."""
-        profile: Profile = await self.profile_query.get_by_user_id(
+        profile_id = await self.profile_query.get_id_by_user_id(
             UUID(request_user_id)
         )
-        if not profile:
+        if not profile_id:
             raise HTTPException(
                 status_code=HTTPStatus.NOT_FOUND, detail="Profile not found"
             )
         favorite = await self.query.update_favorite(
-            favorite_id, profile.id, update_data
+            favorite_id, profile_id, update_data
         )
         if not favorite:
             logger.error(f"Favorite with id: {favorite_id} does not exist")
@@ -126,10 +126,10 @@ class FavoritesService:
         request_user_id: str,
     ) -> None:
         """Удаление объекта Избранного по id с проверкой соответствия."""
-        profile: Profile = await self.profile_query.get_by_user_id(
+        profile_id = await self.profile_query.get_id_by_user_id(
             UUID(request_user_id)
         )
-        if not profile:
+        if not profile_id:
             raise HTTPException(
                 status_code=HTTPStatus.NOT_FOUND, detail="Profile not found"
             )
@@ -141,7 +141,7 @@ class FavoritesService:
                 status_code=HTTPStatus.NOT_FOUND, detail="Favorite not found"
             )
 
-        if favorite.profile_id != profile.id:
+        if favorite.profile_id != profile_id:
             raise HTTPException(
                 status_code=HTTPStatus.FORBIDDEN,
                 detail="You are not allowed to delete this favorite",
@@ -162,34 +162,19 @@ class FavoritesService:
         page_number: int = 1,
         page_size: int = 10,
         order: str = "desc",
+        cursor: str | None = None,
     ) -> FavoriteListResponse:
-        return await self.query.get_list(
+        """Страница списка с данными фильмов(одним пакетом на страницу)."""
+        response = await self.query.get_list(
             profile_id=profile_id,
             movie_id=movie_id,
             page_number=page_number,
             page_size=page_size,
             order=order,
+            cursor=cursor,
         )
-
-    async def _get_film_data(self, film_id: UUID) -> dict:
-        cache_key = f"film_data:{film_id}"
-        film_data = await self.cache_service.get_from_cache(cache_key)
-        if film_data:
-            return json.loads(film_data)
-
-        try:
-            async with self.api_client as client:
-                film_data = await client.request(
-                    method="GET",
-                    endpoint=f"/api/v1/films/{film_id}",
-                )
-                await self.cache_service.put_to_cache(
-                    cache_key, json.dumps(film_data), ex=60 * 10
-                )
-                return film_data
-        except Exception as e:
-            logger.error(f"Ошибка получения данных фильма: {str(e)}")
-            return {}
+        await self.film_data.enrich(response.favorites)
+        return response
 
 
 async def get_favorites_service(
@@ -199,8 +184,8 @@ async def get_favorites_service(
 ) -> FavoritesService:
     api_client = APIClient(app_config.content_url, token_manager=token_manager)
     async with session:
-        query_service = FavoriteQueryService(session)
-        profile_query_service = ProfileQueryService(session)
+        query_service = FavoriteQueryService(session, cache_service)
+        profile_query_service = ProfileQueryService(session, cache_service)
         return FavoritesService(
             query_service,
             profile_query_service,
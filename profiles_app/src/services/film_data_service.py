@@ -0,0 +1,136 @@
+import asyncio
+import json
+import logging
+from logging import config as logging_config
+from typing import Iterable
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from profiles_app.src.core.config import app_config, cache_config
+from profiles_app.src.core.logger import LOGGING
+from profiles_app.src.services.api_client import APIClient
+from profiles_app.src.services.cache_service import (
+    NEGATIVE,
+    RedisCacheService,
+)
+from profiles_app.src.services.single_flight import single_flight
+
+logging_config.dictConfig(LOGGING)
+logger = logging.getLogger("film_data_service")
+
+
+class FilmDataService:
+    """
+    Данные фильмов(title, imdb_rating) из content_app с кешированием.
+    Ключи Redis - make_obj_key("film_data", film_id).
+    Ошибка запроса(фильма нет, content_app недоступен) кешируется
+    как отсутствие данных на cache_config.negative_ttl.
+    """
+
+    def __init__(
+        self, cache_service: RedisCacheService, api_client: APIClient
+    ) -> None:
+        self.cache_service = cache_service
+        self.api_client = api_client
+
+    async def get(self, film_id: UUID) -> dict:
+        """Данные одного фильма, {} - если недоступны."""
+
+        async def load() -> dict | None:
+            async with self.api_client as client:
+                return await self._fetch(client, film_id)
+
+        film_data = await self.cache_service.get_or_load(
+            self._key(film_id),
+            load,
+            encode=json.dumps,
+            decode=json.loads,
+            ex=app_config.film_data_expire,
+        )
+        return film_data or {}
+
+    async def get_many(self, film_ids: Iterable[UUID]) -> dict[UUID, dict]:
+        """
+        Данные группы фильмов:
+            все ключи - одним MGET,
+            промахи - параллельно(не больше film_fetch_concurrency),
+            запись результатов - одним pipeline.
+        """
+        ids = list(dict.fromkeys(film_ids))
+        if not ids:
+            return {}
+        cached = await self.cache_service.conn.mget(  # type: ignore
+            [self._key(film_id) for film_id in ids]
+        )
+        result: dict[UUID, dict] = {}
+        missing: list[UUID] = []
+        for film_id, data in zip(ids, cached):
+            if data is None:
+                missing.append(film_id)
+            elif data == NEGATIVE:
+                single_flight.stats["hit_negative"] += 1
+                result[film_id] = {}
+            else:
+                single_flight.stats["hit_positive"] += 1
+                result[film_id] = json.loads(data)
+        if missing:
+            result.update(await self._load_many(missing))
+        return result
+
+    async def enrich(self, items: Iterable[BaseModel]) -> None:
+        """Заполняет movie_title и movie_imdb_rating у элементов списка."""
+        items = list(items)
+        films = await self.get_many(item.movie_id for item in items)
+        for item in items:
+            film_data = films.get(item.movie_id) or {}
+            item.movie_title = film_data.get("title", "Название недоступно")
+            item.movie_imdb_rating = film_data.get("imdb_rating")
+
+    async def _load_many(self, film_ids: list[UUID]) -> dict[UUID, dict]:
+        semaphore = asyncio.Semaphore(app_config.film_fetch_concurrency)
+
+        async with self.api_client as client:
+
+            async def fetch(film_id: UUID) -> dict | None:
+                async with semaphore:
+                    return await self._fetch(client, film_id)
+
+            loaded = await asyncio.gather(*map(fetch, film_ids))
+
+        async with self.cache_service.conn.pipeline(  # type: ignore
+            transaction=False
+        ) as pipe:
+            for film_id, film_data in zip(film_ids, loaded):
+                if film_data:
+                    single_flight.stats["miss_positive"] += 1
+                    pipe.set(
+                        self._key(film_id),
+                        json.dumps(film_data),
+                        ex=app_config.film_data_expire
+                        + cache_config.stale_ttl,
+                    )
+                else:
+                    single_flight.stats["miss_negative"] += 1
+                    pipe.set(
+                        self._key(film_id),
+                        NEGATIVE,
+                        ex=cache_config.negative_ttl,
+                    )
+            await pipe.execute()
+        return {
+            film_id: film_data or {}
+            for film_id, film_data in zip(film_ids, loaded)
+        }
+
+    async def _fetch(self, client: APIClient, film_id: UUID) -> dict | None:
+        try:
+            return await client.request(
+                method="GET", endpoint=f"/api/v1/films/{film_id}"
+            )
+        except Exception as e:
+            logger.error(f"Ошибка получения данных фильма: {str(e)}")
+            return None
+
+    def _key(self, film_id: UUID) -> str:
+        return self.cache_service.make_obj_key("film_data", film_id)
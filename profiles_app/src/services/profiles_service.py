@@ -3,7 +3,6 @@ from http import HTTPStatus
 from logging import config as logging_config
 from uuid import UUID
 
-from cryptography.fernet import Fernet
 from fastapi import Depends, HTTPException
 
 from profiles_app.src.core.config import app_config
@@ -13,9 +12,12 @@ from profiles_app.src.db.queries.profiles import ProfileQueryService
 from profiles_app.src.db.sessions import get_session
 from profiles_app.src.schemas.entity import (
     PhoneVerificationRequest,
+    ProfileBulkCreate,
+    ProfileBulkCreateResponse,
     ProfileCreate,
     ProfileListResponse,
     ProfileRead,
+    ProfileSearchResult,
     ProfileUpdate,
     UserData,
     VerifyCodeRequest,
@@ -31,8 +33,6 @@ from profiles_app.src.utils.utils import generate_code
 logging_config.dictConfig(LOGGING)
 logger = logging.getLogger("profiles_service")
 
-cipher_suite = Fernet(app_config.encryption_key)
-
 
 class ProfilesService:
     def __init__(
@@ -79,7 +79,34 @@ class ProfilesService:
                 detail="Failed to create profile.",
             )
 
-    async def get_profile(self, profile_id: UUID) -> ProfileRead:
+    async def create_profiles_bulk(
+        self, bulk_data: ProfileBulkCreate
+    ) -> ProfileBulkCreateResponse:
+        """
+        Пакетное создание профилей(всплески регистраций в auth_app).
+        Уже существующие профили пропускаются без ошибки.
+        """
+        if len(bulk_data.profiles) > app_config.bulk_create_max_size:
+            raise HTTPException(
+                status_code=HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                detail=(
+                    "Too many profiles, max "
+                    f"{app_config.bulk_create_max_size} per request."
+                ),
+            )
+        created = await self.query.create_profiles_bulk(bulk_data.profiles)
+        logger.info(
+            f"Bulk profiles created: {len(created)}, "
+            f"skipped: {len(bulk_data.profiles) - len(created)}"
+        )
+        return ProfileBulkCreateResponse(
+            created=created,
+            skipped=len(bulk_data.profiles) - len(created),
+        )
+
+    async def get_profile(
+        self, profile_id: UUID, fields: set[str] | None = None
+    ) -> ProfileRead:
         """Получение профиля по ID."""
         profile = await self.query.get_by_id(profile_id)
         if not profile:
@@ -87,8 +114,26 @@ class ProfilesService:
             raise HTTPException(
                 status_code=HTTPStatus.NOT_FOUND, detail="Profile not found"
             )
-        profile_in_db = ProfileRead.model_validate(profile)
-        return profile_in_db
+        return self.project_profile(profile, fields)
+
+    @staticmethod
+    def project_profile(
+        profile: Profile, fields: set[str] | None = None
+    ) -> ProfileRead:
+        """
+        ProfileRead с необязательными полями из fields, None - все поля.
+        Незапрошенные поля не читаются из модели:
+        phone_number дешифруется, только если запрошен.
+        """
+        if fields is None:
+            return ProfileRead.model_validate(profile)
+        return ProfileRead.model_validate(
+            {
+                name: getattr(profile, name)
+                for name, field in ProfileRead.model_fields.items()
+                if field.is_required() or name in fields
+            }
+        )
 
     async def list_profiles(
         self,
@@ -97,6 +142,8 @@ class ProfilesService:
         page_number: int,
         page_size: int,
         order: str,
+        cursor: str | None = None,
+        fields: set[str] | None = None,
     ) -> ProfileListResponse:
         return await self.query.get_list(
             page_number=page_number,
@@ -104,6 +151,22 @@ class ProfilesService:
             order=order,
             first_name=first_name,
             last_name=last_name,
+            cursor=cursor,
+            fields=fields,
+        )
+
+    async def search_profiles(
+        self, query: str, limit: int
+    ) -> list[ProfileSearchResult]:
+        return await self.query.search(
+            query, min(limit, app_config.search_max_limit)
+        )
+
+    async def autocomplete_profiles(
+        self, prefix: str, limit: int
+    ) -> list[ProfileSearchResult]:
+        return await self.query.autocomplete(
+            prefix, min(limit, app_config.search_max_limit)
         )
 
     async def update_profile(
@@ -185,7 +248,11 @@ class ProfilesService:
                 raise HTTPException(400, "Номер не изменился")
 
             code = generate_code()
-            await self.cache_service.put_to_cache(str(profile_id), code, 300)
+            await self.cache_service.put_to_cache(
+                self.cache_service.make_obj_key("phone_code", profile_id),
+                code,
+                300,
+            )
 
             # метод работает но возвращает отказ в связи с отсутствием юр лица
             # await send_sms(phone_number, code)
@@ -209,7 +276,7 @@ class ProfilesService:
                     status_code=HTTPStatus.NOT_FOUND, detail="Profile not found"
                 )
             stored_code = await self.cache_service.get_from_cache(
-                str(profile_id)
+                self.cache_service.make_obj_key("phone_code", profile_id)
             )
             if not stored_code or stored_code.decode() != code_data.code:
                 raise HTTPException(400, "Неверный код или срок действия истек")
@@ -221,13 +288,14 @@ class ProfilesService:
             logger.error(f"Ошибка подтверждения номера: {e}")
             return {"message": f"Ошибка подтверждения номера: {e}"}
 
-    async def get_my_profile(self, user_data: UserData) -> ProfileRead:
+    async def get_my_profile(
+        self, user_data: UserData, fields: set[str] | None = None
+    ) -> ProfileRead:
         """Получение собственного профиля по ID."""
 
         profile = await self.query.get_by_user_id(user_data.user_id)
         if profile:
-            profile_in_db = ProfileRead.model_validate(profile)
-            return profile_in_db
+            return self.project_profile(profile, fields)
 
         # что бы не создавать вручную профили админов
         # в проде убрать
@@ -240,5 +308,5 @@ async def get_profiles_service(
     cache_service: RedisCacheService = Depends(get_redis_cache_service),
 ) -> ProfilesService:
     async with session:
-        query_service = ProfileQueryService(session)
+        query_service = ProfileQueryService(session, cache_service)
         return ProfilesService(query_service, cache_service=cache_service)
@@ -1,4 +1,3 @@
-import json
 import logging
 from http import HTTPStatus
 from logging import config as logging_config
@@ -8,7 +7,6 @@ from fastapi import Depends, HTTPException
 
 from profiles_app.src.core.config import app_config
 from profiles_app.src.core.logger import LOGGING
-from profiles_app.src.db.models.profiles import Profile
 from profiles_app.src.db.queries.profiles import ProfileQueryService
 from profiles_app.src.db.queries.reviews import ReviewQueryService
 from profiles_app.src.db.sessions import get_session
@@ -23,6 +21,7 @@ from profiles_app.src.services.cache_service import (
     RedisCacheService,
     get_redis_cache_service,
 )
+from profiles_app.src.services.film_data_service import FilmDataService
 from profiles_app.src.services.token_manager import (
     TokenManager,
     get_token_manager,
@@ -44,20 +43,21 @@ class ReviewService:
         self.profile_query = profile_query_service
         self.cache_service = cache_service
         self.api_client = api_client
+        self.film_data = FilmDataService(cache_service, api_client)
 
     async def create_review(
         self, review_data: ReviewCreate, request_user_id: str
     ) -> ReviewView:
-        profile: Profile = await self.profile_query.get_by_user_id(
+        profile_id = await self.profile_query.get_id_by_user_id(
             UUID(request_user_id)
         )
-        if not profile:
+        if not profile_id:
             logger.error(f"User {request_user_id} profile does not exist")
             raise HTTPException(
                 status_code=HTTPStatus.NOT_FOUND, detail="Profile not found"
             )
 
-        review = await self.query.create_review(review_data, profile.id)
+        review = await self.query.create_review(review_data, profile_id)
         return ReviewView.model_validate(review)
 
     async def review_by_id(self, review_id: UUID) -> ReviewView:
@@ -68,12 +68,12 @@ class ReviewService:
             )
 
         # запрос при наличии активного сервиса content_app
-        film_data = await self._get_film_data(review.movie_id)
+        film_data = await self.film_data.get(review.movie_id)
 
         return ReviewView(
             **review.__dict__,
-            title=film_data.get("movie_title", "Название недоступно"),
-            imdb_rating=film_data.get("movie_imdb_rating"),
+            movie_title=film_data.get("title", "Название недоступно"),
+            movie_imdb_rating=film_data.get("imdb_rating"),
         )
 
     async def update_review_by_id(
@@ -82,16 +82,16 @@ class ReviewService:
         request_user_id: str,
         update_data: ReviewUpdate,
     ) -> ReviewView:
-        profile: Profile = await self.profile_query.get_by_user_id(
+        profile_id = await self.profile_query.get_id_by_user_id(
             UUID(request_user_id)
         )
-        if not profile:
+        if not profile_id:
             raise HTTPException(
                 status_code=HTTPStatus.NOT_FOUND, detail="Profile not found"
             )
 
         review = await self.query.update_review(
-            review_id, profile.id, update_data
+            review_id, profile_id, update_data
         )
         if not review:
             logger.error(f"Review with id: {review_id} does not exist")
@@ -105,10 +105,10 @@ class ReviewService:
         review_id: UUID,
         request_user_id: str,
     ) -> None:
-        profile: Profile = await self.profile_query.get_by_user_id(
+        profile_id = await self.profile_query.get_id_by_user_id(
             UUID(request_user_id)
         )
-        if not profile:
+        if not profile_id:
             raise HTTPException(
                 status_code=HTTPStatus.NOT_FOUND, detail="Profile not found"
             )
@@ -120,7 +120,7 @@ class ReviewService:
                 status_code=HTTPStatus.NOT_FOUND, detail="Отзыв не найден"
             )
 
-        if review.profile_id != profile.id:
+        if review.profile_id != profile_id:
             raise HTTPException(
                 status_code=HTTPStatus.FORBIDDEN,
                 detail="Недостаточно прав для удаления отзыва",
@@ -141,34 +141,19 @@ class ReviewService:
         page_number: int = 1,
         page_size: int = 10,
         order: str = "desc",
+        cursor: str | None = None,
     ) -> ReviewListResponse:
-        return await self.query.get_list(
+        """Страница списка с данными фильмов(одним пакетом на страницу)."""
+        response = await self.query.get_list(
             profile_id=profile_id,
             movie_id=movie_id,
             page_number=page_number,
             page_size=page_size,
             order=order,
+            cursor=cursor,
         )
-
-    async def _get_film_data(self, film_id: UUID) -> dict:
-        cache_key = f"film_data:{film_id}"
-        film_data = await self.cache_service.get_from_cache(cache_key)
-        if film_data:
-            return json.loads(film_data)
-
-        try:
-            async with self.api_client as client:
-                film_data = await client.request(
-                    method="GET",
-                    endpoint=f"/api/v1/films/{film_id}",
-                )
-                await self.cache_service.put_to_cache(
-                    cache_key, json.dumps(film_data), ex=60 * 10
-                )
-                return film_data
-        except Exception as e:
-            logger.error(f"Ошибка получения данных фильма: {str(e)}")
-            return {}
+        await self.film_data.enrich(response.reviews)
+        return response
 
 
 async def get_reviews_service(
@@ -178,8 +163,8 @@ async def get_reviews_service(
 ) -> ReviewService:
     api_client = APIClient(app_config.content_url, token_manager=token_manager)
     async with session:
-        query_service = ReviewQueryService(session)
-        profile_query_service = ProfileQueryService(session)
+        query_service = ReviewQueryService(session, cache_service)
+        profile_query_service = ProfileQueryService(session, cache_service)
         return ReviewService(
             query_service,
             profile_query_service,
@@ -0,0 +1,49 @@
+import asyncio
+import logging
+from logging import config as logging_config
+
+from profiles_app.src.core.config import app_config
+from profiles_app.src.core.logger import LOGGING
+from profiles_app.src.services.api_client import APIClient
+from profiles_app.src.services.token_manager import TokenManager
+
+logging_config.dictConfig(LOGGING)
+logger = logging.getLogger("revocation_service")
+
+
+class RevokedTokens:
+    """
+    Локальная копия списка отозванных(logout) access token из auth_app.
+    Хранит jti токенов, обновляется фоновой задачей из lifespan.
+    """
+
+    def __init__(self, endpoint: str = "api/v1/auth/revoked") -> None:
+        self.endpoint = endpoint
+        self.tokens: set[str] = set()
+        self.token_manager = TokenManager()
+
+    def __contains__(self, jti: object) -> bool:
+        return jti in self.tokens
+
+    async def sync(self) -> None:
+        """Запрос актуального списка отозванных токенов."""
+        async with APIClient(
+            app_config.auth_url, self.token_manager
+        ) as client:
+            response = await client.request("GET", self.endpoint)
+        self.tokens = set(response.get("tokens", []))
+
+    async def run(self, interval: int) -> None:
+        """
+        Периодическое обновление списка, при любой ошибке(HTTP, таймаут,
+        некорректный ответ) список не меняется, задача продолжает работу.
+        """
+        while True:
+            try:
+                await self.sync()
+            except Exception as e:
+                logger.error(f"Ошибка обновления отозванных токенов: {e}")
+            await asyncio.sleep(interval)
+
+
+revoked_tokens = RevokedTokens()
@@ -0,0 +1,81 @@
+import asyncio
+import logging
+import math
+import random
+import time
+from collections import Counter
+from logging import config as logging_config
+from typing import Any, Awaitable, Callable
+
+from profiles_app.src.core.logger import LOGGING
+
+logging_config.dictConfig(LOGGING)
+logger = logging.getLogger("single_flight")
+
+Loader = Callable[[], Awaitable[Any]]
+
+
+class SingleFlight:
+    """
+    Объединение одновременных запросов одного ключа в воркере:
+    первый запрос выполняет loader, остальные ждут его результат.
+    Хранит время выполнения loader по ключам для раннего обновления.
+    """
+
+    def __init__(self, max_durations: int = 10_000) -> None:
+        self._tasks: dict[str, asyncio.Task] = {}
+        self.durations: dict[str, float] = {}
+        self.max_durations = max_durations
+        self.stats: Counter[str] = Counter()
+
+    async def do(self, key: str, loader: Loader) -> Any:
+        """Результат loader, общий для всех одновременных вызовов ключа."""
+        task = self._tasks.get(key)
+        if task is None:
+            task = self._start(key, loader)
+        else:
+            self.stats["coalesced"] += 1
+        # shield: отмена одного из ожидающих не отменяет общий loader.
+        return await asyncio.shield(task)
+
+    def refresh(self, key: str, loader: Loader) -> None:
+        """Фоновое обновление ключа, если оно еще не запущено."""
+        if key not in self._tasks:
+            self._start(key, loader)
+
+    def should_refresh_early(
+        self, key: str, ttl_left: float, beta: float
+    ) -> bool:
+        """
+        Вероятностное раннее обновление(XFetch):
+        чем дольше loader и меньше осталось жить ключу, тем вероятнее.
+        """
+        delta = self.durations.get(key)
+        if not delta or beta <= 0:
+            return False
+        return -delta * beta * math.log(random.random()) >= ttl_left
+
+    def in_flight(self) -> int:
+        return len(self._tasks)
+
+    def _start(self, key: str, loader: Loader) -> asyncio.Task:
+        task = asyncio.ensure_future(self._timed(key, loader))
+        self._tasks[key] = task
+        task.add_done_callback(lambda done: self._finish(key, done))
+        return task
+
+    async def _timed(self, key: str, loader: Loader) -> Any:
+        start = time.monotonic()
+        result = await loader()
+        if len(self.durations) >= self.max_durations:
+            self.durations.clear()
+        self.durations[key] = time.monotonic() - start
+        return result
+
+    def _finish(self, key: str, task: asyncio.Task) -> None:
+        self._tasks.pop(key, None)
+        if not task.cancelled() and (error := task.exception()):
+            logger.error(f"Ошибка загрузки ключа {key}: {error}")
+
+
+single_flight = SingleFlight()
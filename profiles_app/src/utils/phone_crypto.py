@@ -0,0 +1,42 @@
+import hashlib
+import hmac
+from typing import Iterable
+
+from cryptography.fernet import Fernet
+
+from profiles_app.src.core.config import app_config
+
+# объекты ключей создаются один раз на процесс
+cipher_suite = Fernet(app_config.encryption_key)
+_hmac_key = app_config.hmac_key.encode()
+
+
+def encrypt_phone(phone_number: str) -> str:
+    """Шифрование номера(Fernet, недетерминированное)."""
+    return cipher_suite.encrypt(phone_number.encode()).decode()
+
+
+def decrypt_phone(token: str) -> str:
+    """Дешифрация номера."""
+    return cipher_suite.decrypt(token.encode()).decode()
+
+
+def decrypt_phones(tokens: Iterable[str | None]) -> dict[str, str]:
+    """
+    Дешифрация группы номеров: {шифр: номер}.
+    Каждый шифр дешифруется отдельно(Fernet не умеет пакетно),
+    одинаковые шифры - один раз, None пропускаются.
+    """
+    return {
+        token: decrypt_phone(token) for token in set(tokens) if token
+    }
+
+
+def phone_hmac(phone_number: str) -> str:
+    """
+    Детерминированный HMAC-SHA256 номера(hex)
+    для проверки уникальности в БД.
+    """
+    return hmac.new(
+        _hmac_key, phone_number.encode(), hashlib.sha256
+    ).hexdigest()
@@ -1,35 +1,19 @@
 import base64
 import binascii
 import random
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
 from http import HTTPStatus
 
-import aiosmtplib
 from fastapi import HTTPException
 from itsdangerous import TimestampSigner
 from itsdangerous.exc import BadSignature, SignatureExpired
 
 from profiles_app.src.core.config import app_config
-from profiles_app.src.core.smtp_config import smtp_data
+from profiles_app.src.services.mailer import mailer
 
 
 async def send_email(subject, recipient, body):
-    """метод для отправки писем(SMTP)"""
-    message = MIMEMultipart()
-    message["From"] = smtp_data.default_from_email
-    message["To"] = recipient
-    message["Subject"] = subject
-
-    message.attach(MIMEText(body, "html"))
-
-    await aiosmtplib.send(
-        message,
-        hostname=smtp_data.email_host,
-        port=smtp_data.email_port,
-        use_tls=smtp_data.email_use_tls,
-        start_tls=smtp_data.email_use_ssl,
-    )
+    """метод для отправки писем(SMTP, пул соединений mailer)"""
+    await mailer.send(subject=subject, recipient=recipient, body=body)
 
 
 async def encode_id(id: str):
@@ -0,0 +1,108 @@
+import socket
+
+import aiosmtplib
+import pytest
+from aiosmtpd.controller import Controller
+
+from profiles_app.src.services.mailer import Mailer
+
+
+class RecordingHandler:
+    """
+    Обработчик aiosmtpd: считает соединения(EHLO) и письма.
+    drop_connections - сколько следующих соединений разорвать на EHLO.
+    """
+
+    def __init__(self) -> None:
+        self.connections = 0
+        self.drop_connections = 0
+        self.messages: list = []
+
+    async def handle_EHLO(
+        self, server, session, envelope, hostname, responses
+    ):
+        self.connections += 1
+        if self.drop_connections:
+            self.drop_connections -= 1
+            server.transport.close()
+        session.host_name = hostname
+        return responses
+
+    async def handle_DATA(self, server, session, envelope):
+        self.messages.append(envelope)
+        return "250 OK"
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def smtp_server():
+    handler = RecordingHandler()
+    controller = Controller(handler, hostname="127.0.0.1", port=free_port())
+    controller.start()
+    yield handler, controller.port
+    controller.stop()
+
+
+def make_mailer(port: int, **kwargs) -> Mailer:
+    params = {
+        "hostname": "127.0.0.1",
+        "port": port,
+        "use_tls": False,
+        "start_tls": False,
+        "username": None,
+        "password": None,
+        "from_email": "noreply@example.com",
+        "pool_size": 2,
+        "idle_timeout": 60,
+        "max_retries": 2,
+        "retry_backoff": 0,
+        "timeout": 5,
+    }
+    return Mailer(**{**params, **kwargs})
+
+
+@pytest.mark.asyncio
+async def test_mailer_reuses_pooled_connection(smtp_server):
+    """Письма подряд уходят через одно соединение пула."""
+    handler, port = smtp_server
+    mailer = make_mailer(port)
+
+    await mailer.send("first", "user@example.com", "<p>1</p>")
+    await mailer.send("second", "user@example.com", "<p>2</p>")
+
+    assert len(handler.messages) == 2
+    assert handler.connections == 1
+    assert mailer.stats()["idle"] == 1
+    await mailer.close()
+
+
+@pytest.mark.asyncio
+async def test_mailer_retries_dropped_connection(smtp_server):
+    """Разрыв соединения сервером -> переподключение и повтор."""
+    handler, port = smtp_server
+    mailer = make_mailer(port)
+    handler.drop_connections = 1
+
+    await mailer.send("subject", "user@example.com", "<p>body</p>")
+
+    assert len(handler.messages) == 1
+    assert handler.connections == 2
+    await mailer.close()
+
+
+@pytest.mark.asyncio
+async def test_mailer_login_failure_raises_smtp_error(smtp_server):
+    """Отказ авторизации -> ошибка SMTP, соединение не остается в пуле."""
+    _, port = smtp_server
+    mailer = make_mailer(port, username="user", password="secret")
+
+    with pytest.raises(aiosmtplib.SMTPException):
+        await mailer.send("subject", "user@example.com", "<p>body</p>")
+
+    assert mailer.stats()["idle"] == 0
+    await mailer.close()
@@ -0,0 +1,188 @@
+"""
+Поиск профилей по имени на PROFILES профилях:
+ILIKE '%x%'(прежний фильтр списка) против оператора %/similarity
+(ProfileQueryService.search) и подсказок ILIKE 'x%'(autocomplete).
+Профили создаются одним INSERT ... SELECT generate_series, помечаются
+phone_number, для каждого варианта печатает количество строк,
+прочитанных планом(EXPLAIN ANALYZE), время выполнения плана
+и среднее время запроса за RUNS повторов.
+Данные удаляются в конце.
+
+Запуск(контейнер tests): python3 functional/utils/profile_search_bench.py
+"""
+
+import asyncio
+import json
+import time
+import uuid
+
+from sqlalchemy import delete, func, or_, select, text
+
+from profiles_app.src.db.models.profiles import Profile
+from profiles_app.src.db.queries.profiles import FULL_NAME, escape_like
+from profiles_app.src.db.sessions import async_session, engine
+
+PROFILES = 1_000_000
+RUNS = 50
+LIMIT = 10
+SUBSTRING = "ivan"
+TYPO = "Ivonov Petr"
+PREFIX = "Iva"
+
+FIRST_NAMES = (
+    "Ivan Petr Anna Maria Olga Sergey Elena Pavel "
+    "Dmitry Irina Nikolay Tatiana Andrey Svetlana Oleg"
+).split()
+LAST_NAMES = (
+    "Ivanov Petrov Sidorov Smirnov Kuznetsov Popov Vasiliev Sokolov "
+    "Mikhailov Novikov Fedorov Morozov Volkov Alekseev Lebedev Semenov"
+).split()
+
+# фамилия со случайным окончанием: иначе только len(LAST_NAMES) значений
+SEED_SQL = """
+INSERT INTO profiles (id, user_id, first_name, last_name, phone_number,
+                      created_at, updated_at)
+SELECT gen_random_uuid(), gen_random_uuid(),
+       (CAST(:first_names AS text[]))[
+           1 + floor(random() * CAST(:first_count AS int))::int
+       ],
+       (CAST(:last_names AS text[]))[
+           1 + floor(random() * CAST(:last_count AS int))::int
+       ]
+           || substr(md5(random()::text), 1, 3),
+       :tag, now(), now() - random() * interval '365 days'
+FROM generate_series(1, CAST(:count AS int))
+"""
+
+
+def ilike_query():
+    """Прежний фильтр get_list: ILIKE '%x%' по имени и фамилии."""
+    pattern = f"%{SUBSTRING}%"
+    return (
+        select(Profile)
+        .where(
+            or_(
+                Profile.first_name.ilike(pattern),
+                Profile.last_name.ilike(pattern),
+            )
+        )
+        .order_by(Profile.updated_at.desc(), Profile.id.desc())
+        .limit(LIMIT)
+    )
+
+
+def similarity_query():
+    """Запрос ProfileQueryService.search: оператор % и similarity."""
+    score = func.similarity(FULL_NAME, TYPO).label("score")
+    return (
+        select(Profile, score)
+        .where(FULL_NAME.op("%")(TYPO))
+        .order_by(score.desc(), Profile.id)
+        .limit(LIMIT)
+    )
+
+
+def autocomplete_query():
+    """Запрос ProfileQueryService.autocomplete: ILIKE 'x%'."""
+    pattern = f"{escape_like(PREFIX)}%"
+    return (
+        select(Profile)
+        .where(
+            or_(
+                Profile.first_name.ilike(pattern),
+                Profile.last_name.ilike(pattern),
+            )
+        )
+        .order_by(Profile.last_name, Profile.first_name, Profile.id)
+        .limit(LIMIT)
+    )
+
+
+def rows_scanned(plan: dict) -> int:
+    """Сумма строк всех узлов плана(с учетом повторов loops)."""
+    rows = plan.get("Actual Rows", 0) * plan.get("Actual Loops", 1)
+    return rows + sum(rows_scanned(node) for node in plan.get("Plans", []))
+
+
+def index_names(plan: dict) -> set[str]:
+    """Индексы, использованные узлами плана."""
+    names = {plan["Index Name"]} if "Index Name" in plan else set()
+    for node in plan.get("Plans", []):
+        names |= index_names(node)
+    return names
+
+
+async def measure(session, query) -> dict:
+    compiled = query.compile(
+        engine.sync_engine, compile_kwargs={"literal_binds": True}
+    )
+    result = await session.execute(
+        text(f"EXPLAIN (ANALYZE, FORMAT JSON) {compiled}")
+    )
+    plan = result.scalar()
+    plan = json.loads(plan) if isinstance(plan, str) else plan
+    started = time.perf_counter()
+    for _ in range(RUNS):
+        rows = (await session.execute(query)).all()
+    elapsed_ms = (time.perf_counter() - started) * 1000 / RUNS
+    return {
+        "rows": rows_scanned(plan[0]["Plan"]),
+        "plan_ms": plan[0]["Execution Time"],
+        "ms": elapsed_ms,
+        "found": len(rows),
+        "indexes": ", ".join(sorted(index_names(plan[0]["Plan"]))) or "-",
+    }
+
+
+async def seed(session, tag: str) -> None:
+    started = time.perf_counter()
+    await session.execute(
+        text(SEED_SQL),
+        {
+            "first_names": FIRST_NAMES,
+            "first_count": len(FIRST_NAMES),
+            "last_names": LAST_NAMES,
+            "last_count": len(LAST_NAMES),
+            "tag": tag,
+            "count": PROFILES,
+        },
+    )
+    await session.commit()
+    await session.execute(text("ANALYZE profiles"))
+    await session.commit()
+    print(
+        f"Создано профилей: {PROFILES}, "
+        f"{time.perf_counter() - started:.1f} с"
+    )
+
+
+async def main() -> None:
+    tag = f"bench_{uuid.uuid4().hex[:8]}"
+    async with async_session() as session:
+        try:
+            await seed(session, tag)
+            queries = {
+                f"ILIKE '%{SUBSTRING}%'": ilike_query(),
+                f"% '{TYPO}'": similarity_query(),
+                f"ILIKE '{PREFIX}%'": autocomplete_query(),
+            }
+            for name, query in queries.items():
+                stats = await measure(session, query)
+                print(
+                    f"{name:<22}строк плана {stats['rows']:>8}, "
+                    f"план {stats['plan_ms']:.2f} мс, "
+                    f"запрос {stats['ms']:.2f} мс, "
+                    f"найдено {stats['found']}, "
+                    f"индексы: {stats['indexes']}"
+                )
+        finally:
+            await session.rollback()
+            await session.execute(
+                delete(Profile).where(Profile._phone_number == tag)
+            )
+            await session.commit()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,179 @@
+"""
+Количество SQL запросов сервисных методов ручек profiles_app.
+Создает профиль с HISTORY_SIZE избранными и отзывами, выполняет
+сценарии ручек(каждый - в своей сессии, как запрос) и печатает
+количество запросов к БД. Данные удаляются в конце.
+
+Запуск(контейнер tests): python3 functional/utils/query_counts.py
+"""
+
+import asyncio
+import uuid
+from contextlib import contextmanager
+from typing import Awaitable, Callable, Iterator
+
+from sqlalchemy import event
+
+from profiles_app.src.core.config import app_config
+from profiles_app.src.db.models.favorites import Favorite
+from profiles_app.src.db.models.reviews import Review
+from profiles_app.src.db.queries.favorites import FavoriteQueryService
+from profiles_app.src.db.queries.profiles import ProfileQueryService
+from profiles_app.src.db.queries.reviews import ReviewQueryService
+from profiles_app.src.db.sessions import async_session, engine
+from profiles_app.src.schemas.entity import (
+    FavoriteCreate,
+    FavoriteUpdate,
+    ProfileCreate,
+    ReviewCreate,
+    ReviewUpdate,
+    UserData,
+)
+from profiles_app.src.services.api_client import APIClient
+from profiles_app.src.services.cache_service import get_redis_cache_service
+from profiles_app.src.services.favorites_service import FavoritesService
+from profiles_app.src.services.profiles_service import ProfilesService
+from profiles_app.src.services.reviews_service import ReviewService
+from profiles_app.src.services.token_manager import TokenManager
+
+HISTORY_SIZE = 200
+
+
+@contextmanager
+def count_queries() -> Iterator[list[str]]:
+    statements: list[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, *args) -> None:
+        statements.append(statement)
+
+    event.listen(
+        engine.sync_engine, "before_cursor_execute", before_cursor_execute
+    )
+    try:
+        yield statements
+    finally:
+        event.remove(
+            engine.sync_engine,
+            "before_cursor_execute",
+            before_cursor_execute,
+        )
+
+
+async def measure(
+    name: str, scenario: Callable[..., Awaitable], results: dict
+) -> None:
+    cache_service = await get_redis_cache_service()
+    api_client = APIClient(app_config.content_url, TokenManager())
+    async with async_session() as session:
+        profile_query = ProfileQueryService(session, cache_service)
+        services = {
+            "profiles": ProfilesService(profile_query, cache_service),
+            "favorites": FavoritesService(
+                FavoriteQueryService(session, cache_service),
+                profile_query,
+                cache_service,
+                api_client,
+            ),
+            "reviews": ReviewService(
+                ReviewQueryService(session, cache_service),
+                profile_query,
+                cache_service,
+                api_client,
+            ),
+        }
+        with count_queries() as statements:
+            await scenario(**services)
+        results[name] = len(statements)
+
+
+async def main() -> None:
+    user_id = uuid.uuid4()
+    async with async_session() as session:
+        profile = await ProfileQueryService(session).create_profile(
+            ProfileCreate(
+                user_id=user_id, first_name="Bench", last_name="Mark"
+            )
+        )
+        session.add_all(
+            [
+                Favorite(profile_id=profile.id, movie_id=uuid.uuid4())
+                for _ in range(HISTORY_SIZE)
+            ]
+            + [
+                Review(
+                    profile_id=profile.id,
+                    movie_id=uuid.uuid4(),
+                    content="benchmark",
+                    rating=5,
+                )
+                for _ in range(HISTORY_SIZE)
+            ]
+        )
+        await session.commit()
+
+    user = str(user_id)
+    user_data = UserData(
+        user_id=user_id,
+        login="bench",
+        email="bench@example.com",
+        first_name="Bench",
+        last_name="Mark",
+    )
+    movie_id = uuid.uuid4()
+    created: dict = {}
+    results: dict[str, int] = {}
+
+    async def create_favorite(favorites, **_):
+        created["favorite"] = await favorites.create_favorites(
+            FavoriteCreate(movie_id=movie_id, note="bench"), user
+        )
+
+    async def create_review(reviews, **_):
+        created["review"] = await reviews.create_review(
+            ReviewCreate(movie_id=movie_id, content="bench", rating=7), user
+        )
+
+    scenarios = {
+        "GET /profiles/{id}": lambda profiles, **_: profiles.get_profile(
+            profile.id
+        ),
+        "GET /profiles/my": lambda profiles, **_: profiles.get_my_profile(
+            user_data
+        ),
+        "POST /favorites": create_favorite,
+        "PATCH /favorites/{id}": lambda favorites, **_: (
+            favorites.update_favorite_by_id(
+                created["favorite"].id,
+                user,
+                FavoriteUpdate(self_rating=9, note="bench"),
+            )
+        ),
+        "DELETE /favorites/{id}": lambda favorites, **_: (
+            favorites.delete_favorite_by_id(created["favorite"].id, user)
+        ),
+        "POST /reviews": create_review,
+        "PATCH /reviews/{id}": lambda reviews, **_: (
+            reviews.update_review_by_id(
+                created["review"].id,
+                user,
+                ReviewUpdate(rating=8, content="bench"),
+            )
+        ),
+        "DELETE /reviews/{id}": lambda reviews, **_: (
+            reviews.delete_review_by_id(created["review"].id, user)
+        ),
+        "DELETE /profiles/{id}": lambda profiles, **_: (
+            profiles.delete_profile(profile.id)
+        ),
+    }
+    for name, scenario in scenarios.items():
+        await measure(name, scenario, results)
+
+    print(f"SQL запросов(история профиля: {HISTORY_SIZE} + {HISTORY_SIZE})")
+    for name, count in results.items():
+        print(f"{name:<28}{count:>4}")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
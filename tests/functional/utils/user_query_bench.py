@@ -0,0 +1,137 @@
+"""
+Загрузчик пользователя auth_app: JOIN + GROUP BY(прежний) против
+коррелированных подзапросов(UserQueryService._base_user_query).
+Создает пользователя с ROLES ролями и ACCOUNTS соц. аккаунтами,
+для каждого варианта печатает количество строк, прочитанных планом
+(EXPLAIN ANALYZE), и среднее время запроса по id за RUNS повторов.
+Данные удаляются в конце.
+
+Запуск(контейнер tests): python3 functional/utils/user_query_bench.py
+"""
+
+import asyncio
+import json
+import time
+import uuid
+
+from sqlalchemy import String, delete, func, select, text
+from sqlalchemy.dialects.postgresql import ARRAY
+
+from auth_app.src.db.models.roles import Role, UserRoles
+from auth_app.src.db.models.social_account import SocialAccount
+from auth_app.src.db.models.users import User
+from auth_app.src.db.queries.user import UserQueryService
+from auth_app.src.db.sessions import async_session, engine
+
+ROLES = 20
+ACCOUNTS = 10
+RUNS = 200
+
+
+def join_user_query():
+    """Прежний запрос: R ролей x S аккаунтов строк до группировки."""
+    return (
+        select(
+            User.id,
+            User.login,
+            User.email,
+            User.first_name,
+            User.last_name,
+            User.is_active,
+            User.password,
+            User.created_at,
+            func.array_agg(Role.name, type_=ARRAY(String)).label("roles"),
+            func.array_agg(
+                func.jsonb_build_object(
+                    "id",
+                    SocialAccount.id,
+                    "provider",
+                    SocialAccount.provider,
+                    "provider_user_id",
+                    SocialAccount.provider_user_id,
+                )
+            ).label("social_accounts"),
+        )
+        .outerjoin(UserRoles, UserRoles.user_id == User.id)
+        .outerjoin(Role, UserRoles.role_id == Role.id)
+        .outerjoin(SocialAccount, SocialAccount.user_id == User.id)
+        .group_by(User.id)
+    )
+
+
+def rows_scanned(plan: dict) -> int:
+    """Сумма строк всех узлов плана(с учетом повторов loops)."""
+    rows = plan.get("Actual Rows", 0) * plan.get("Actual Loops", 1)
+    return rows + sum(rows_scanned(node) for node in plan.get("Plans", []))
+
+
+async def measure(session, query) -> dict:
+    compiled = query.compile(
+        engine.sync_engine, compile_kwargs={"literal_binds": True}
+    )
+    result = await session.execute(
+        text(f"EXPLAIN (ANALYZE, FORMAT JSON) {compiled}")
+    )
+    plan = result.scalar()
+    plan = json.loads(plan) if isinstance(plan, str) else plan
+    started = time.perf_counter()
+    for _ in range(RUNS):
+        row = (await session.execute(query)).first()
+    elapsed_ms = (time.perf_counter() - started) * 1000 / RUNS
+    return {
+        "rows": rows_scanned(plan[0]["Plan"]),
+        "ms": elapsed_ms,
+        "roles": len(row.roles),  # type: ignore
+        "accounts": len(row.social_accounts),  # type: ignore
+    }
+
+
+async def main() -> None:
+    suffix = uuid.uuid4().hex[:8]
+    async with async_session() as session:
+        user = User(
+            login=f"bench_{suffix}",
+            email=f"bench_{suffix}@example.com",
+            password="bench",
+            is_active=True,
+        )
+        roles = [Role(name=f"bench_{suffix}_{i}") for i in range(ROLES)]
+        session.add_all([user, *roles])
+        await session.flush()
+        session.add_all(
+            [UserRoles(user_id=user.id, role_id=role.id) for role in roles]
+            + [
+                SocialAccount(
+                    user_id=user.id,
+                    provider=f"bench_{i}",
+                    provider_user_id=f"{suffix}_{i}",
+                )
+                for i in range(ACCOUNTS)
+            ]
+        )
+        await session.commit()
+
+        try:
+            queries = {
+                "JOIN + GROUP BY": join_user_query(),
+                "подзапросы": UserQueryService(session)._base_user_query(),
+            }
+            print(f"Пользователь: {ROLES} ролей, {ACCOUNTS} аккаунтов")
+            for name, query in queries.items():
+                stats = await measure(session, query.where(User.id == user.id))
+                print(
+                    f"{name:<18}строк плана {stats['rows']:>6}, "
+                    f"{stats['ms']:.2f} мс, ролей {stats['roles']}, "
+                    f"аккаунтов {stats['accounts']}"
+                )
+        finally:
+            await session.execute(delete(User).where(User.id == user.id))
+            await session.execute(
+                delete(Role).where(Role.name.like(f"bench_{suffix}_%"))
+            )
+            await session.commit()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())